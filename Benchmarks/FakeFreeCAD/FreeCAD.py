@@ -0,0 +1,196 @@
+# *************************************************************************
+# *                                                                       *
+# * Copyright (c) 2019-2024 Paul Ebbers                                   *
+# *                                                                       *
+# * This program is free software; you can redistribute it and/or modify  *
+# * it under the terms of the GNU Lesser General Public License (LGPL)    *
+# * as published by the Free Software Foundation; either version 3 of     *
+# * the License, or (at your option) any later version.                   *
+# * for detail see the LICENCE text file.                                 *
+# *                                                                       *
+# * This program is distributed in the hope that it will be useful,       *
+# * but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# * GNU Library General Public License for more details.                  *
+# *                                                                       *
+# * You should have received a copy of the GNU Library General Public     *
+# * License along with this program; if not, write to the Free Software   *
+# * Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# * USA                                                                   *
+# *                                                                       *
+# *************************************************************************
+# Stand-in for the FreeCAD module, used by the benchmarks.
+# Only the functions that are used by the ribbon are available.
+# The parameters are kept in memory and are not saved.
+import os
+import sys
+
+# The version that is returned by Version()
+VERSION = ["1", "0", "0", "39109 (Git)"]
+
+# The folders that are returned by getUserAppDataDir() and getHomePath(). Set them with Setup()
+UserAppDataDir = ""
+HomePath = ""
+
+
+def Setup(UserAppData: str, Home: str):
+    """Set the folders of the fake FreeCAD installation."""
+    global UserAppDataDir, HomePath
+    UserAppDataDir = os.path.join(UserAppData, "")
+    HomePath = os.path.join(Home, "")
+    return
+
+
+class _Qt:
+    @staticmethod
+    def translate(context, text, *args):
+        return text
+
+
+Qt = _Qt()
+
+
+class _Console:
+    # Print to stderr, to keep stdout free for the benchmark results
+    @staticmethod
+    def PrintMessage(text):
+        sys.stderr.write(str(text))
+
+    @staticmethod
+    def PrintWarning(text):
+        sys.stderr.write(str(text))
+
+    @staticmethod
+    def PrintError(text):
+        sys.stderr.write(str(text))
+
+    @staticmethod
+    def PrintLog(text):
+        return
+
+
+Console = _Console()
+
+
+class ParameterGrp:
+    """A parameter group like the ones returned by FreeCAD.ParamGet()."""
+
+    def __init__(self):
+        self.Values = {}
+        self.Groups = {}
+        # Objects with an OnChange(ParameterGrp, Name) method, like in FreeCAD
+        self.Observers = []
+
+    def Attach(self, Observer):
+        if Observer not in self.Observers:
+            self.Observers.append(Observer)
+
+    def Detach(self, Observer):
+        if Observer in self.Observers:
+            self.Observers.remove(Observer)
+
+    def _Set(self, Type: str, Name: str, Value):
+        if self.Values.get((Type, Name)) == Value:
+            return
+        self.Values[(Type, Name)] = Value
+        for Observer in list(self.Observers):
+            Observer.OnChange(self, Name)
+
+    def _Remove(self, Type: str, Name: str):
+        if self.Values.pop((Type, Name), None) is not None:
+            for Observer in list(self.Observers):
+                Observer.OnChange(self, Name)
+
+    def GetGroup(self, Name: str):
+        return self.Groups.setdefault(Name, ParameterGrp())
+
+    def GetGroups(self) -> list:
+        return list(self.Groups)
+
+    def HasGroup(self, Name: str) -> bool:
+        return Name in self.Groups
+
+    def RemGroup(self, Name: str):
+        self.Groups.pop(Name, None)
+
+    def GetContents(self) -> list:
+        return [(Type, Name, Value) for (Type, Name), Value in self.Values.items()]
+
+    def GetString(self, Name: str, Default: str = "") -> str:
+        return self.Values.get(("String", Name), Default)
+
+    def GetBool(self, Name: str, Default: bool = False) -> bool:
+        return self.Values.get(("Boolean", Name), Default)
+
+    def GetInt(self, Name: str, Default: int = 0) -> int:
+        return self.Values.get(("Integer", Name), Default)
+
+    def GetUnsigned(self, Name: str, Default: int = 0) -> int:
+        return self.Values.get(("Unsigned Long", Name), Default)
+
+    def GetFloat(self, Name: str, Default: float = 0.0) -> float:
+        return self.Values.get(("Float", Name), Default)
+
+    def SetString(self, Name: str, Value: str):
+        self._Set("String", Name, str(Value))
+
+    def SetBool(self, Name: str, Value: bool):
+        self._Set("Boolean", Name, bool(Value))
+
+    def SetInt(self, Name: str, Value: int):
+        self._Set("Integer", Name, int(Value))
+
+    def SetUnsigned(self, Name: str, Value: int):
+        self._Set("Unsigned Long", Name, int(Value))
+
+    def SetFloat(self, Name: str, Value: float):
+        self._Set("Float", Name, float(Value))
+
+    def RemString(self, Name: str):
+        self._Remove("String", Name)
+
+    def RemBool(self, Name: str):
+        self._Remove("Boolean", Name)
+
+    def RemInt(self, Name: str):
+        self._Remove("Integer", Name)
+
+    def RemFloat(self, Name: str):
+        self._Remove("Float", Name)
+
+
+# The roots of the parameter trees. ("User parameter", "System parameter")
+Parameters = {}
+
+
+def ParamGet(Path: str) -> ParameterGrp:
+    Root, _, GroupPath = Path.partition(":")
+    Group = Parameters.setdefault(Root, ParameterGrp())
+    for Name in GroupPath.split("/"):
+        if Name != "":
+            Group = Group.GetGroup(Name)
+    return Group
+
+
+def Version() -> list:
+    return list(VERSION)
+
+
+def getUserAppDataDir() -> str:
+    return UserAppDataDir
+
+
+def getHomePath() -> str:
+    return HomePath
+
+
+def getResourceDir() -> str:
+    return HomePath
+
+
+def saveParameter(*args):
+    return
+
+
+def loadFile(*args):
+    return
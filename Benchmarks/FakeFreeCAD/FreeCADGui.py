@@ -0,0 +1,234 @@
+# *************************************************************************
+# *                                                                       *
+# * Copyright (c) 2019-2024 Paul Ebbers                                   *
+# *                                                                       *
+# * This program is free software; you can redistribute it and/or modify  *
+# * it under the terms of the GNU Lesser General Public License (LGPL)    *
+# * as published by the Free Software Foundation; either version 3 of     *
+# * the License, or (at your option) any later version.                   *
+# * for detail see the LICENCE text file.                                 *
+# *                                                                       *
+# * This program is distributed in the hope that it will be useful,       *
+# * but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# * GNU Library General Public License for more details.                  *
+# *                                                                       *
+# * You should have received a copy of the GNU Library General Public     *
+# * License along with this program; if not, write to the Free Software   *
+# * Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# * USA                                                                   *
+# *                                                                       *
+# *************************************************************************
+# Stand-in for the FreeCADGui module, used by the benchmarks.
+# Call Setup() after the QApplication is created. It creates a main window
+# and N workbenches with M toolbars of K commands each.
+import zlib
+
+from PySide.QtGui import QAction, QColor, QIcon, QPixmap
+from PySide.QtWidgets import QMainWindow, QToolBar, QWidget
+from PySide.QtCore import Signal
+
+# The main window, the workbenches and the commands. Created by Setup()
+_MainWindow = None
+_Workbenches = {}
+_Commands = {}
+_ActiveWorkbench = None
+# Icon name -> QIcon
+_Icons = {}
+
+
+class MainWindow(QMainWindow):
+    """Main window with the signal that FreeCAD emits when a workbench is activated."""
+
+    workbenchActivated = Signal(str)
+
+    def __init__(self):
+        super().__init__()
+        self.setObjectName("Main window")
+        self.setCentralWidget(QWidget())
+        # The ribbon takes the preference button from the edit menu and the help action from the help menu
+        EditMenu = self.menuBar().addMenu("&Edit")
+        EditMenu.setObjectName("&Edit")
+        EditMenu.addAction("Preferences...")
+        HelpMenu = self.menuBar().addMenu("&Help")
+        HelpMenu.setObjectName("&Help")
+        HelpMenu.addAction("Help")
+        HelpMenu.addAction("FreeCAD Website")
+        AboutAction = HelpMenu.addAction("About FreeCAD")
+        AboutAction.setMenuRole(QAction.MenuRole.AboutRole)
+        # Used by the ribbon to show the toolbars in the statusbar
+        self.statusBar().setObjectName("statusBar")
+
+
+class _Command:
+    """A command like the ones returned by FreeCADGui.Command.get()."""
+
+    def __init__(self, Name: str, MenuText: str, Pixmap: str):
+        self.Name = Name
+        self.Info = {
+            "name": Name,
+            "menuText": MenuText,
+            "toolTip": f"{MenuText} tooltip",
+            "whatsThis": Name,
+            "statusTip": f"{MenuText} tooltip",
+            "pixmap": Pixmap,
+            "shortcut": "",
+        }
+        self.Action = None
+
+    def getInfo(self) -> dict:
+        return dict(self.Info)
+
+    def getAction(self) -> list:
+        if self.Action is None:
+            return []
+        return [self.Action]
+
+    def createAction(self, Parent):
+        if self.Action is None:
+            self.Action = QAction(
+                getIcon(self.Info["pixmap"]), self.Info["menuText"], Parent
+            )
+            self.Action.setData(self.Name)
+            self.Action.setToolTip(self.Info["toolTip"])
+        return self.Action
+
+
+class _CommandNamespace:
+    @staticmethod
+    def get(Name: str):
+        return _Commands.get(Name)
+
+    @staticmethod
+    def listByShortcut(ShortCut: str) -> list:
+        return []
+
+
+Command = _CommandNamespace()
+
+
+class Workbench:
+    """A workbench like the ones returned by FreeCADGui.listWorkbenches()."""
+
+    def __init__(self, ClassName: str, MenuText: str, Toolbars: dict):
+        self.ClassName = ClassName
+        self.MenuText = MenuText
+        self.ToolTip = f"{MenuText} workbench"
+        self.Icon = f"{ClassName}.svg"
+        # Toolbar name -> list of command names
+        self.Toolbars = Toolbars
+
+    def name(self) -> str:
+        return self.ClassName
+
+    def listToolbars(self) -> list:
+        return list(self.Toolbars)
+
+    def getToolbarItems(self) -> dict:
+        return {Toolbar: list(Commands) for Toolbar, Commands in self.Toolbars.items()}
+
+    def listMenus(self) -> list:
+        return []
+
+    def reloadActive(self):
+        return
+
+
+def Setup(Workbenches: int = 10, Toolbars: int = 5, Commands: int = 8):
+    """Create the main window and the given number of workbenches, toolbars per workbench and commands per toolbar."""
+    global _MainWindow, _ActiveWorkbench
+    _MainWindow = MainWindow()
+    _Workbenches.clear()
+    _Commands.clear()
+    _Icons.clear()
+    for i in range(Workbenches):
+        ClassName = f"Bench{i}Workbench"
+        WorkbenchToolbars = {}
+        for j in range(Toolbars):
+            CommandNames = []
+            for k in range(Commands):
+                CommandName = f"Bench{i}_Command{j}_{k}"
+                _Commands[CommandName] = _Command(
+                    CommandName, f"Command {k} of toolbar {j}", f"{CommandName}.svg"
+                )
+                CommandNames.append(CommandName)
+            WorkbenchToolbars[f"Bench{i} toolbar {j}"] = CommandNames
+        _Workbenches[ClassName] = Workbench(ClassName, f"Bench {i}", WorkbenchToolbars)
+    _ActiveWorkbench = None
+    return _MainWindow
+
+
+def getMainWindow():
+    return _MainWindow
+
+
+def listWorkbenches() -> dict:
+    return dict(_Workbenches)
+
+
+def getWorkbench(Name: str):
+    return _Workbenches[Name]
+
+
+def activeWorkbench():
+    return _ActiveWorkbench
+
+
+def activateWorkbench(Name: str):
+    """Activate a workbench. The first time, its commands get actions and its toolbars are created."""
+    global _ActiveWorkbench
+    WorkBench = _Workbenches[Name]
+    if hasattr(WorkBench, "__Workbench__") is False:
+        for Toolbar, CommandNames in WorkBench.Toolbars.items():
+            ToolBar = QToolBar(Toolbar, _MainWindow)
+            ToolBar.setObjectName(Toolbar)
+            for CommandName in CommandNames:
+                ToolBar.addAction(_Commands[CommandName].createAction(_MainWindow))
+            _MainWindow.addToolBar(ToolBar)
+        WorkBench.__Workbench__ = True
+    _ActiveWorkbench = WorkBench
+    _MainWindow.workbenchActivated.emit(Name)
+    return True
+
+
+def removeWorkbench(Name: str):
+    _Workbenches.pop(Name, None)
+    return
+
+
+def listCommands() -> list:
+    return list(_Commands)
+
+
+def getIcon(Name: str) -> QIcon:
+    """Returns a plain colored icon per name. The color is based on the name."""
+    Icon = _Icons.get(Name)
+    if Icon is None:
+        Pixmap = QPixmap(64, 64)
+        Pixmap.fill(QColor.fromRgb(zlib.crc32(Name.encode("utf-8")) & 0xFFFFFF))
+        Icon = QIcon(Pixmap)
+        _Icons[Name] = Icon
+    return Icon
+
+
+def addLanguagePath(Path: str):
+    return
+
+
+def updateLocale():
+    return
+
+
+class _PySideUic:
+    @staticmethod
+    def loadUi(FileName: str):
+        from PySide import QT_VERSION
+
+        if QT_VERSION == 6:
+            from PySide6.QtUiTools import QUiLoader
+        else:
+            from PySide2.QtUiTools import QUiLoader
+        return QUiLoader().load(FileName)
+
+
+PySideUic = _PySideUic()
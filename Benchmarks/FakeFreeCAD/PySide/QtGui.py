@@ -0,0 +1,30 @@
+# *************************************************************************
+# *                                                                       *
+# * Copyright (c) 2019-2024 Paul Ebbers                                   *
+# *                                                                       *
+# * This program is free software; you can redistribute it and/or modify  *
+# * it under the terms of the GNU Lesser General Public License (LGPL)    *
+# * as published by the Free Software Foundation; either version 3 of     *
+# * the License, or (at your option) any later version.                   *
+# * for detail see the LICENCE text file.                                 *
+# *                                                                       *
+# * This program is distributed in the hope that it will be useful,       *
+# * but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# * GNU Library General Public License for more details.                  *
+# *                                                                       *
+# * You should have received a copy of the GNU Library General Public     *
+# * License along with this program; if not, write to the Free Software   *
+# * Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# * USA                                                                   *
+# *                                                                       *
+# *************************************************************************
+# Like in FreeCAD, QtGui also contains the widgets. Code written for Qt5 imports them from here.
+from PySide import QT_VERSION
+
+if QT_VERSION == 6:
+    from PySide6.QtGui import *  # noqa: F401, F403
+    from PySide6.QtWidgets import *  # noqa: F401, F403
+else:
+    from PySide2.QtGui import *  # noqa: F401, F403
+    from PySide2.QtWidgets import *  # noqa: F401, F403
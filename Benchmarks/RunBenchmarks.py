@@ -0,0 +1,425 @@
+# *************************************************************************
+# *                                                                       *
+# * Copyright (c) 2019-2024 Paul Ebbers                                   *
+# *                                                                       *
+# * This program is free software; you can redistribute it and/or modify  *
+# * it under the terms of the GNU Lesser General Public License (LGPL)    *
+# * as published by the Free Software Foundation; either version 3 of     *
+# * the License, or (at your option) any later version.                   *
+# * for detail see the LICENCE text file.                                 *
+# *                                                                       *
+# * This program is distributed in the hope that it will be useful,       *
+# * but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# * GNU Library General Public License for more details.                  *
+# *                                                                       *
+# * You should have received a copy of the GNU Library General Public     *
+# * License along with this program; if not, write to the Free Software   *
+# * Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# * USA                                                                   *
+# *                                                                       *
+# *************************************************************************
+# Micro-benchmarks for the ribbon. They run without FreeCAD, with the stand-in modules in FakeFreeCAD.
+#
+# Usage:
+#   QT_QPA_PLATFORM=offscreen python Benchmarks/RunBenchmarks.py [--workbenches N] [--toolbars M] [--commands K]
+#                                                                 [--repeat R] [--output results.json]
+#                                                                 [--compare previous.json] [--importtime]
+#
+# The results are written as JSON to stdout or to the output file. Everything else is written to stderr.
+# With --importtime, the ribbon is also imported in a new interpreter with python -X importtime,
+# to report the import time per module.
+import argparse
+import contextlib
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import xml.etree.ElementTree as ET
+from types import SimpleNamespace
+
+BenchmarkFolder = os.path.dirname(os.path.abspath(__file__))
+RibbonFolder = os.path.dirname(BenchmarkFolder)
+
+
+def Measure(Function, Repeat: int = 5, Setup=None) -> dict:
+    """
+    Run a function the given number of times and return the timings in seconds.
+    When a setup function is given, it is called before every run and its result is passed to the function.
+    The setup is not included in the timing.
+    """
+    Timings = []
+    for i in range(Repeat):
+        Arguments = ()
+        if Setup is not None:
+            Arguments = (Setup(),)
+        StartTime = time.perf_counter()
+        Function(*Arguments)
+        Timings.append(time.perf_counter() - StartTime)
+    return {
+        "runs": len(Timings),
+        "min": min(Timings),
+        "median": statistics.median(Timings),
+        "mean": statistics.mean(Timings),
+        "max": max(Timings),
+    }
+
+
+def SetupFreeCAD(TempFolder: str):
+    """Prepare the stand-in FreeCAD module, so the ribbon reads and writes its files in a temporary folder."""
+    import FreeCAD as App
+
+    UserAppData = os.path.join(TempFolder, "UserAppData")
+    Home = os.path.join(TempFolder, "Home")
+    os.makedirs(os.path.join(UserAppData, "Mod"))
+    os.makedirs(os.path.join(Home, "Mod"))
+    App.Setup(UserAppData, Home)
+
+    RibbonStructure = os.path.join(TempFolder, "RibbonStructure.json")
+    shutil.copy(os.path.join(RibbonFolder, "CreateStructure.txt"), RibbonStructure)
+    preferences = App.ParamGet("User parameter:BaseApp/Preferences/Mod/FreeCAD-Ribbon")
+    preferences.SetString("RibbonStructure", RibbonStructure)
+    preferences.SetString("BackupFolder", os.path.join(TempFolder, "Backups"))
+    return
+
+
+def ReturnRibbonVersion() -> str:
+    namespaces = {"i": "https://wiki.freecad.org/Package_Metadata"}
+    treeRoot = ET.parse(os.path.join(RibbonFolder, "package.xml")).getroot()
+    return treeRoot.findtext("i:version", "", namespaces)
+
+
+def NewRibbon():
+    """Returns a ribbon with only the RibbonBar initialized, so createModernMenu can be measured on its own."""
+    import FCBinding
+
+    Ribbon = FCBinding.ModernMenu.__new__(FCBinding.ModernMenu)
+    FCBinding.RibbonBar.__init__(Ribbon, title="", iconSize=Ribbon.iconSize)
+    return Ribbon
+
+
+def BuildAllTabs(Ribbon):
+    """Build the panels of every tab of the ribbon."""
+    for i in range(Ribbon.tabBar().count()):
+        Ribbon.tabBar().setCurrentIndex(i)
+        Ribbon.buildPanels()
+    return
+
+
+def RunBenchmarks(Arguments) -> dict:
+    import FreeCADGui as Gui
+    from PySide.QtGui import QIcon
+    from PySide.QtWidgets import QApplication, QComboBox, QLineEdit, QListWidget
+
+    Results = {}
+    Repeat = Arguments.repeat
+    Gui.Setup(Arguments.workbenches, Arguments.toolbars, Arguments.commands)
+
+    # Import the ribbon. The import is measured once, because the modules are cached afterwards
+    StartTime = time.perf_counter()
+    import FCBinding
+    import LoadDesign_Ribbon
+    import Serialize_Ribbon
+    import StyleMapping
+
+    Duration = time.perf_counter() - StartTime
+    Results["import"] = {
+        "runs": 1,
+        "min": Duration,
+        "median": Duration,
+        "mean": Duration,
+        "max": Duration,
+    }
+
+    # The whole ribbon, from reading RibbonStructure.json until the first tab is built
+    Results["ModernMenu.__init__"] = Measure(FCBinding.ModernMenu, Repeat)
+
+    # Activate all workbenches first. Loading a workbench is not part of the ribbon
+    for WorkBenchName in Gui.listWorkbenches():
+        Gui.activateWorkbench(WorkBenchName)
+
+    Results["ModernMenu.createModernMenu"] = Measure(
+        lambda Ribbon: Ribbon.createModernMenu(), Repeat, NewRibbon
+    )
+
+    def NewRibbonWithTabs():
+        Ribbon = NewRibbon()
+        Ribbon.createModernMenu()
+        for Name in Ribbon.isWbLoaded:
+            Ribbon.isWbLoaded[Name] = False
+        return Ribbon
+
+    Results["ModernMenu.buildPanels"] = Measure(BuildAllTabs, Repeat, NewRibbonWithTabs)
+
+    # Panels with hundreds of widgets. The sizes are mixed like in the ribbon: small, medium and large
+    from pyqtribbon_local.panel import RibbonGridLayoutManager, RibbonPanel
+    from PySide.QtWidgets import QWidget
+
+    RowSpans = [2, 2, 2, 3, 3, 6] * 100
+
+    def RequestCells():
+        GridLayoutManager = RibbonGridLayoutManager(6)
+        for RowSpan in RowSpans:
+            GridLayoutManager.request_cells(RowSpan, 1)
+
+    Results["RibbonGridLayoutManager.request_cells"] = Measure(RequestCells, Repeat)
+
+    def AddWidgets(Panel):
+        for i in range(300):
+            Panel.addSmallWidget(QWidget())
+
+    Results["RibbonPanel.addWidget"] = Measure(
+        AddWidgets, Repeat, lambda: RibbonPanel("Panel", maxRows=6)
+    )
+
+    # Icons with several sizes, like the icons of FreeCAD
+    Icons = []
+    for CommandName in Gui.listCommands()[:100]:
+        Icon = QIcon()
+        for Size in [16, 24, 32, 64]:
+            Icon.addPixmap(Gui.getIcon(CommandName).pixmap(Size, Size))
+        Icons.append(Icon)
+    SerializedIcons = [Serialize_Ribbon.serializeIcon(Icon) for Icon in Icons]
+    Results["Serialize_Ribbon.serializeIcon"] = Measure(
+        lambda: [Serialize_Ribbon.serializeIcon(Icon) for Icon in Icons], Repeat
+    )
+    Results["Serialize_Ribbon.deserializeIcon"] = Measure(
+        lambda: [
+            Serialize_Ribbon.deserializeIcon(Serialized)
+            for Serialized in SerializedIcons
+        ],
+        Repeat,
+    )
+
+    ControlNames = [
+        "Background_Color",
+        "Background_Color_Hover",
+        "Border_Color",
+        "FontColor",
+        "ApplicationButton_Background",
+        "ScrollLeftButton_Tab",
+        "ScrollRightButton_Tab",
+        "ScrollLeftButton_Category",
+        "ScrollRightButton_Category",
+        "OptionButton",
+        "PinButton_open",
+        "PinButton_closed",
+    ]
+    Results["StyleMapping.ReturnStyleItem"] = Measure(
+        lambda: [
+            StyleMapping.ReturnStyleItem(ControlName)
+            for i in range(100)
+            for ControlName in ControlNames
+        ],
+        Repeat,
+    )
+
+    # The filter functions of the design dialog, with a list of commands like in RibbonDataFile.dat
+    Dialog = SimpleNamespace(List_Commands=[], Dict_DropDownButtons={})
+    for WorkBenchName, WorkBench in Gui.listWorkbenches().items():
+        for Toolbar, CommandNames in WorkBench.getToolbarItems().items():
+            for CommandName in CommandNames:
+                MenuText = Gui.Command.get(CommandName).getInfo()["menuText"]
+                Dialog.List_Commands.append(
+                    [
+                        CommandName,
+                        f"{CommandName}.svg",
+                        MenuText,
+                        WorkBenchName,
+                        MenuText,
+                    ]
+                )
+    SearchBar = QLineEdit()
+    SearchBar.setText("command 1")
+    ListCategory = QComboBox()
+    ListCategory.addItem("All", "All")
+    for WorkBenchName, WorkBench in Gui.listWorkbenches().items():
+        ListCategory.addItem(
+            WorkBench.MenuText, [WorkBenchName, WorkBench.Icon, WorkBench.MenuText]
+        )
+    ListCategory.setCurrentIndex(ListCategory.count() - 1)
+
+    def FilterCommands_SearchBar():
+        LoadDesign_Ribbon.LoadDialog.FilterCommands_SearchBar(
+            Dialog, QListWidget(), SearchBar, QListWidget()
+        )
+
+    def FilterCommands_ListCategory():
+        LoadDesign_Ribbon.LoadDialog.FilterCommands_ListCategory(
+            Dialog, QListWidget(), ListCategory
+        )
+
+    Results["LoadDialog.FilterCommands_SearchBar"] = Measure(
+        FilterCommands_SearchBar, Repeat
+    )
+    Results["LoadDialog.FilterCommands_ListCategory"] = Measure(
+        FilterCommands_ListCategory, Repeat
+    )
+
+    QApplication.processEvents()
+    return Results
+
+
+def ImportRibbon():
+    """Import the ribbon like FreeCAD does. Used in the new interpreter that is started by MeasureImportTimes."""
+    TempFolder = tempfile.mkdtemp(prefix="RibbonBenchmarks_")
+    try:
+        SetupFreeCAD(TempFolder)
+        import FreeCADGui as Gui
+        from PySide.QtWidgets import QApplication
+
+        App = QApplication.instance() or QApplication(sys.argv[:1])
+        Gui.Setup(1, 1, 1)
+        with contextlib.redirect_stdout(sys.stderr):
+            import FCBinding
+    finally:
+        shutil.rmtree(TempFolder, ignore_errors=True)
+    return
+
+
+def MeasureImportTimes(MinimumTime: float = 0.001) -> dict:
+    """
+    Import the ribbon in a new interpreter with python -X importtime.
+    Returns the cumulative import time in seconds of every module that takes at least the minimum time.
+    """
+    Command = [
+        sys.executable,
+        "-X",
+        "importtime",
+        os.path.abspath(__file__),
+        "--import-only",
+    ]
+    Process = subprocess.run(Command, capture_output=True, text=True)
+
+    # The lines are like "import time:       self [us] |  cumulative |  imported package"
+    ImportTimes = {}
+    for Line in Process.stderr.splitlines():
+        if not Line.startswith("import time:") or "imported package" in Line:
+            continue
+        Items = Line[len("import time:") :].split("|")
+        if len(Items) != 3:
+            continue
+        Cumulative = int(Items[1]) / 1000000
+        if Cumulative >= MinimumTime:
+            ImportTimes[Items[2].strip()] = Cumulative
+    return dict(sorted(ImportTimes.items(), key=lambda Item: Item[1], reverse=True))
+
+
+def Compare(Results: dict, FileName: str, ImportTimes: dict = {}):
+    """Print the change of the median per benchmark, compared to a previous result file."""
+    with open(FileName, "r") as file:
+        Report = json.load(file)
+    file.close()
+    Previous = Report["results"]
+    for Name, Result in Results.items():
+        if Name not in Previous or Previous[Name]["median"] == 0:
+            continue
+        Change = Result["median"] / Previous[Name]["median"]
+        sys.stderr.write(
+            f"{Name:45} {Previous[Name]['median'] * 1000:10.2f} ms -> {Result['median'] * 1000:10.2f} ms ({Change:.2f}x)\n"
+        )
+
+    # Compare the import times of the modules that were measured before
+    PreviousImportTimes = Report.get("import_times", {})
+    for Name, Duration in PreviousImportTimes.items():
+        if len(ImportTimes) == 0:
+            break
+        sys.stderr.write(
+            f"import {Name:38} {Duration * 1000:10.2f} ms -> {ImportTimes.get(Name, 0) * 1000:10.2f} ms\n"
+        )
+    return
+
+
+def main():
+    Parser = argparse.ArgumentParser(
+        description="Micro-benchmarks for the FreeCAD ribbon."
+    )
+    Parser.add_argument(
+        "--workbenches", type=int, default=10, help="number of fake workbenches"
+    )
+    Parser.add_argument(
+        "--toolbars", type=int, default=5, help="number of toolbars per workbench"
+    )
+    Parser.add_argument(
+        "--commands", type=int, default=8, help="number of commands per toolbar"
+    )
+    Parser.add_argument(
+        "--repeat", type=int, default=5, help="number of runs per benchmark"
+    )
+    Parser.add_argument(
+        "--output", default="", help="write the results to this file instead of stdout"
+    )
+    Parser.add_argument(
+        "--compare", default="", help="a previous result file to compare with"
+    )
+    Parser.add_argument(
+        "--importtime", action="store_true", help="measure the import time per module"
+    )
+    Parser.add_argument("--import-only", action="store_true", help=argparse.SUPPRESS)
+    Arguments = Parser.parse_args()
+
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    sys.path.insert(0, os.path.join(BenchmarkFolder, "FakeFreeCAD"))
+    sys.path.insert(1, RibbonFolder)
+
+    if Arguments.import_only:
+        ImportRibbon()
+        return
+
+    TempFolder = tempfile.mkdtemp(prefix="RibbonBenchmarks_")
+    try:
+        SetupFreeCAD(TempFolder)
+
+        import PySide
+        from PySide.QtCore import qVersion
+        from PySide.QtWidgets import QApplication
+
+        App = QApplication.instance() or QApplication(sys.argv[:1])
+
+        # The ribbon prints messages. Keep stdout free for the results
+        with contextlib.redirect_stdout(sys.stderr):
+            Results = RunBenchmarks(Arguments)
+        App.processEvents()
+    finally:
+        shutil.rmtree(TempFolder, ignore_errors=True)
+
+    Report = {
+        "ribbon_version": ReturnRibbonVersion(),
+        "python": platform.python_version(),
+        "pyside": PySide.__version__,
+        "qt": qVersion(),
+        "platform": platform.platform(),
+        "parameters": {
+            "workbenches": Arguments.workbenches,
+            "toolbars": Arguments.toolbars,
+            "commands": Arguments.commands,
+            "repeat": Arguments.repeat,
+        },
+        "results": Results,
+    }
+    ImportTimes = {}
+    if Arguments.importtime:
+        ImportTimes = MeasureImportTimes()
+        Report["import_times"] = ImportTimes
+        for Name, Duration in list(ImportTimes.items())[:15]:
+            sys.stderr.write(f"import {Name:38} {Duration * 1000:10.2f} ms\n")
+    Text = json.dumps(Report, indent=4)
+    if Arguments.output != "":
+        with open(Arguments.output, "w") as file:
+            file.write(Text)
+        file.close()
+    else:
+        sys.stdout.write(Text + "\n")
+
+    if Arguments.compare != "":
+        Compare(Results, Arguments.compare, ImportTimes)
+    return
+
+
+if __name__ == "__main__":
+    main()
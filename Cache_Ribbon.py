@@ -0,0 +1,517 @@
+# *************************************************************************
+# *                                                                       *
+# * Copyright (c) 2019-2024 Paul Ebbers                                   *
+# *                                                                       *
+# * This program is free software; you can redistribute it and/or modify  *
+# * it under the terms of the GNU Lesser General Public License (LGPL)    *
+# * as published by the Free Software Foundation; either version 3 of     *
+# * the License, or (at your option) any later version.                   *
+# * for detail see the LICENCE text file.                                 *
+# *                                                                       *
+# * This program is distributed in the hope that it will be useful,       *
+# * but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# * GNU Library General Public License for more details.                  *
+# *                                                                       *
+# * You should have received a copy of the GNU Library General Public     *
+# * License along with this program; if not, write to the Free Software   *
+# * Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# * USA                                                                   *
+# *                                                                       *
+# *************************************************************************
+
+# Process-wide caches shared by the ribbon and the design dialog.
+import FreeCAD as App
+import FreeCADGui as Gui
+import os
+import json
+from collections import OrderedDict
+
+from PySide.QtGui import QIcon, QFont, QFontMetrics
+
+import Parameters_Ribbon
+import Standard_Functions_RIbbon as StandardFunctions
+from Standard_Functions_RIbbon import CommandInfoCorrections
+import Serialize_Ribbon
+
+
+class CommandInfoIndex:
+    """
+    Index of the corrected command info (menuText, ActionText, pixmap, etc.) per command name.
+
+    The info is retrieved with CommandInfoCorrections the first time a command is requested
+    and reused afterwards. The index is cleared when a workbench is loaded for the first time
+    (new commands and actions are registered) or when the language of FreeCAD changes.
+    The text of the action (ActionText) is read from the action when it is requested,
+    because commands can change the text of their action.
+    """
+
+    def __init__(self):
+        # Command name -> corrected command info
+        self._Index = {}
+        # English menu text -> list of command names. Build on first use
+        self._MenuTextIndex = None
+        # The registered command names at the time of the last validation
+        self._CommandNames = set()
+        # The language at the time of the last validation
+        self._Language = None
+        # The workbenches that are activated at least once
+        self._LoadedWorkbenches = set()
+        # Command name -> QAction of the command. Filled on first use
+        self._Actions = {}
+
+    def Invalidate(self):
+        """
+        Clear the index. The info is collected again on the next request.
+        The icons are cleared too, because new commands and translations can come with new icons.
+        """
+        self._Index.clear()
+        self._MenuTextIndex = None
+        self._CommandNames = set()
+        self._Actions.clear()
+        CommandIcons.Clear()
+        WorkbenchIcons.Clear()
+        return
+
+    def Validate(self):
+        """Clear the index when commands are added or when the language is changed."""
+        Language = App.ParamGet("User parameter:BaseApp/Preferences/General").GetString(
+            "Language"
+        )
+        CommandNames = Gui.listCommands()
+        if Language != self._Language or len(CommandNames) != len(self._CommandNames):
+            self.Invalidate()
+            self._Language = Language
+            self._CommandNames = set(CommandNames)
+        return
+
+    def OnWorkbenchActivated(self, WorkBenchName: str = ""):
+        """Clear the index when a workbench is loaded for the first time."""
+        if WorkBenchName not in self._LoadedWorkbenches:
+            self._LoadedWorkbenches.add(WorkBenchName)
+            self.Invalidate()
+        self.Validate()
+        return
+
+    def IsCommand(self, CommandName: str) -> bool:
+        """Returns True if the command is registered in FreeCAD."""
+        if len(self._CommandNames) == 0:
+            self.Validate()
+        return CommandName in self._CommandNames
+
+    def ReturnCommandInfo(self, CommandName: str) -> dict:
+        """
+        Returns the corrected command info. See CommandInfoCorrections.
+        The returned dict is shared. Copy it before modifying.
+        """
+        CommandInfo = self._Index.get(CommandName)
+        if CommandInfo is None:
+            CommandInfo = CommandInfoCorrections(CommandName)
+            self._Index[CommandName] = CommandInfo
+        return CommandInfo
+
+    def ReturnCommandNames(self, MenuText: str) -> list:
+        """Returns the names of the commands with the given (English) menu text."""
+        if self._MenuTextIndex is None:
+            self.Validate()
+            MenuTextIndex = {}
+            for CommandName in self._CommandNames:
+                Text = self.ReturnCommandInfo(CommandName)["menuText"]
+                MenuTextIndex.setdefault(Text, []).append(CommandName)
+            self._MenuTextIndex = MenuTextIndex
+        return self._MenuTextIndex.get(MenuText, [])
+
+    def MenuText(self, CommandName: str) -> str:
+        return self.ReturnCommandInfo(CommandName)["menuText"]
+
+    def ActionText(self, CommandName: str) -> str:
+        """Returns the current text of the action of the command, or the menu text."""
+        CommandInfo = self.ReturnCommandInfo(CommandName)
+        Action = self._Actions.get(CommandName)
+        try:
+            if Action is None:
+                Action = Gui.Command.get(CommandName).getAction()[0]
+                self._Actions[CommandName] = Action
+            Text = Action.text()
+        except Exception:
+            # No action (yet) or the action is deleted
+            self._Actions.pop(CommandName, None)
+            return CommandInfo["ActionText"]
+        if Text == "":
+            Text = CommandInfo["menuText"]
+        # Keep the shared info in sync with the action
+        CommandInfo["ActionText"] = Text
+        return Text
+
+    def Pixmap(self, CommandName: str) -> str:
+        return self.ReturnCommandInfo(CommandName)["pixmap"]
+
+
+class IconRegistry:
+    """
+    Bounded LRU cache of the icons of the commands or workbenches, keyed by name.
+
+    When an icon is not in the cache, it is loaded with the given loader or, when that fails,
+    with the fallback (e.g. the icon from the data file). When the cache is full, the least
+    recently used icon is removed. An evicted icon is loaded again on the next request.
+    The cache is cleared when workbenches are loaded, when the language or the stylesheet
+    of FreeCAD is changed and when the data files are written.
+    """
+
+    def __init__(self, MaxSize: int = 1024, Fallback=None):
+        # Name -> QIcon, in order of use
+        self._Icons = OrderedDict()
+        # Function Name -> QIcon, used when there is no other icon
+        self.Fallback = Fallback
+        # The maximum number of icons
+        self.MaxSize = MaxSize
+        # Counters for hits and misses
+        self.Hits = 0
+        self.Misses = 0
+
+    def Clear(self):
+        """Remove all icons."""
+        self._Icons.clear()
+        return
+
+    def Register(self, Name: str, Icon: QIcon):
+        """Add a loaded icon."""
+        if Icon is not None and Icon.isNull() is False:
+            self._Store(Name, Icon)
+        return
+
+    def ReturnIcon(self, Name: str, Loader=None, Default=None):
+        """
+        Returns the icon for the name.
+
+        Args:
+            Name (str): Name of the command or workbench.
+            Loader (optional): Function Name -> QIcon, used when the icon is not in the
+                cache. Defaults to None.
+            Default (optional): Returned when no valid icon is found. Defaults to None.
+
+        Returns:
+            QIcon: the icon.
+        """
+        Key = Name
+        Icon = self._Icons.get(Key)
+        if Icon is not None:
+            self.Hits = self.Hits + 1
+            self._Icons.move_to_end(Key)
+            return Icon
+
+        self.Misses = self.Misses + 1
+        # Load the icon
+        if Loader is not None:
+            Icon = Loader(Name)
+        # If there is no icon yet, use the fallback
+        if (Icon is None or Icon.isNull()) and self.Fallback is not None:
+            try:
+                Icon = self.Fallback(Name)
+            except Exception as e:
+                if Parameters_Ribbon.DEBUG_MODE is True:
+                    StandardFunctions.Print(
+                        f"Failed to load the icon for {Name}\n{e}", "Warning"
+                    )
+                Icon = None
+        if Icon is None or Icon.isNull():
+            return Default
+
+        self._Store(Key, Icon)
+        return Icon
+
+    def Statistics(self) -> dict:
+        """Returns the hit and miss counters and the size of the cache."""
+        return {
+            "hits": self.Hits,
+            "misses": self.Misses,
+            "size": len(self._Icons),
+            "maxSize": self.MaxSize,
+        }
+
+    def _Store(self, Key: str, Icon: QIcon):
+        self._Icons[Key] = Icon
+        self._Icons.move_to_end(Key)
+        while len(self._Icons) > self.MaxSize:
+            self._Icons.popitem(last=False)
+        return
+
+
+class TextLayoutCache:
+    """
+    Bounded LRU cache of the wrapped and elided texts of the button labels.
+
+    The layouts are keyed by (text, font pixel size, width, max number of lines, wrap mode),
+    so rebuilding a tab, or the ribbon after a change of the icon size, reuses the layouts
+    that are already measured. The fonts and their metrics are kept per pixel size.
+    """
+
+    def __init__(self, MaxSize: int = 4096):
+        # (Text, FontSize, Width, MaxNumberOfLines, WrapMode, ExtraCharacters) -> layout, in order of use
+        self._Layouts = OrderedDict()
+        # Pixel size -> (QFont, QFontMetrics)
+        self._Fonts = {}
+        # The maximum number of layouts
+        self.MaxSize = MaxSize
+
+    def Clear(self):
+        """Remove all layouts and fonts."""
+        self._Layouts.clear()
+        self._Fonts.clear()
+        return
+
+    def ReturnFont(self, FontSize: int) -> QFont:
+        """Returns a font with the given pixel size."""
+        return self._ReturnFont(FontSize)[0]
+
+    def ReturnFontMetrics(self, FontSize: int) -> QFontMetrics:
+        """Returns the metrics of the font with the given pixel size."""
+        return self._ReturnFont(FontSize)[1]
+
+    def ReturnWrappedText(
+        self,
+        Text: str,
+        FontSize: int,
+        Width: int,
+        MaxNumberOfLines: int,
+        ExtraCharacters: int = 0,
+    ) -> tuple:
+        """
+        Wrap the text over at most MaxNumberOfLines lines.
+
+        The number of characters per line is the number of characters that fit in the width,
+        plus ExtraCharacters. Returns the lines and the width of the widest line.
+        """
+        Key = (Text, FontSize, Width, MaxNumberOfLines, "wrap", ExtraCharacters)
+        Layout = self._Layouts.get(Key)
+        if Layout is None:
+            FontMetrics = self.ReturnFontMetrics(FontSize)
+            maxLength = self._ReturnMaxLength(Text, FontMetrics, Width)
+            Lines = tuple(
+                StandardFunctions.ReturnWrappedText(
+                    Text, maxLength + ExtraCharacters, MaxNumberOfLines, True
+                )
+            )
+            # ReturnWrappedText can return more lines than requested
+            if MaxNumberOfLines > 0:
+                Lines = Lines[:MaxNumberOfLines]
+            TextWidth = 0
+            for Line in Lines:
+                TextWidth = max(TextWidth, FontMetrics.horizontalAdvance(Line, -1))
+            Layout = (Lines, TextWidth)
+        self._Store(Key, Layout)
+        return Layout
+
+    def ReturnElidedText(self, Text: str, FontSize: int, Width: int) -> str:
+        """Returns the text, shortened and ended with "..." when it does not fit in the width."""
+        Key = (Text, FontSize, Width, 1, "elide", 0)
+        Layout = self._Layouts.get(Key)
+        if Layout is None:
+            Layout = Text
+            FontMetrics = self.ReturnFontMetrics(FontSize)
+            maxLength = self._ReturnMaxLength(Text, FontMetrics, Width)
+            if maxLength < len(Text):
+                limit = maxLength - 3
+                Layout = Text[:limit].strip() + "..."
+        self._Store(Key, Layout)
+        return Layout
+
+    def _ReturnMaxLength(self, Text: str, FontMetrics: QFontMetrics, Width: int):
+        """Returns the number of characters from the start of the text that fit in the width."""
+        maxWidth = 0
+        maxLength = 0
+        for c in Text:
+            maxWidth = maxWidth + FontMetrics.horizontalAdvance(c, -1)
+            if maxWidth >= Width:
+                break
+            maxLength = maxLength + 1
+        return maxLength
+
+    def _ReturnFont(self, FontSize: int) -> tuple:
+        Font = self._Fonts.get(FontSize)
+        if Font is None:
+            font = QFont()
+            font.setPixelSize(FontSize)
+            Font = (font, QFontMetrics(font))
+            self._Fonts[FontSize] = Font
+        return Font
+
+    def _Store(self, Key: tuple, Layout):
+        self._Layouts[Key] = Layout
+        self._Layouts.move_to_end(Key)
+        while len(self._Layouts) > self.MaxSize:
+            self._Layouts.popitem(last=False)
+        return
+
+
+class DataFileCache:
+    """
+    In-memory copy of a data file (e.g. RibbonDataFile.dat) and its icon pack.
+
+    The data file is read at most once per modification time. The icons are stored in a
+    memory-mapped icon pack (see Serialize_Ribbon.IconPack) and only the requested icon is
+    decoded. Serialized icons in the data file of older versions are moved to the icon pack once.
+    """
+
+    def __init__(self, FileName: str, PackFileName: str):
+        # The full paths of the data file and the icon pack
+        self.FileName = FileName
+        self.PackFileName = PackFileName
+        # The (modification time, size) of the files when they were read
+        self._Stamp = None
+        self._PackStamp = None
+        # The content of the data file
+        self._Data = {}
+        # The opened icon pack
+        self._Pack = None
+        # Name -> serialized icon. Only used when the icons could not be moved to the icon pack
+        self._CommandIcons = {}
+        self._WorkbenchIcons = {}
+
+    def Invalidate(self):
+        """Forget the content and close the icon pack. The files are read again on the next request."""
+        self._Stamp = None
+        self._Data = {}
+        self._CommandIcons = {}
+        self._WorkbenchIcons = {}
+        self._ClosePack()
+        return
+
+    def Exists(self) -> bool:
+        return os.path.exists(self.FileName)
+
+    def ReturnData(self) -> dict:
+        """
+        Returns the content of the data file. The file is only read again when it is changed.
+        The returned dict is shared. Copy it before modifying.
+        """
+        Stamp = self._ReturnStamp(self.FileName)
+        if Stamp is None:
+            self.Invalidate()
+            return self._Data
+
+        if Stamp != self._Stamp:
+            Data = {}
+            try:
+                with open(self.FileName, "r") as file:
+                    Data.update(json.load(file))
+            except Exception:
+                Data = {}
+            self._Data = Data
+            self._CommandIcons = {}
+            self._WorkbenchIcons = {}
+            if (
+                len(Data.get("Command_Icons", [])) > 0
+                or len(Data.get("WorkBench_Icons", [])) > 0
+            ):
+                Stamp = self._MigrateIcons(Data)
+            self._Stamp = Stamp
+        return self._Data
+
+    def ReturnPack(self):
+        """Returns the opened icon pack or None if there is no icon pack."""
+        Stamp = self._ReturnStamp(self.PackFileName)
+        if Stamp != self._PackStamp:
+            self._ClosePack()
+            if Stamp is not None:
+                try:
+                    self._Pack = Serialize_Ribbon.IconPack(self.PackFileName)
+                except Exception as e:
+                    if Parameters_Ribbon.DEBUG_MODE is True:
+                        StandardFunctions.Print(
+                            f"Failed to open {self.PackFileName}\n{e}", "Warning"
+                        )
+            self._PackStamp = Stamp
+        return self._Pack
+
+    def ReturnCommandIcon(self, CommandName: str):
+        """Returns the icon of the command from the data file or None."""
+        return self._ReturnIcon("commands", self._CommandIcons, CommandName)
+
+    def ReturnWorkbenchIcon(self, WorkBenchName: str):
+        """Returns the icon of the workbench from the data file or None."""
+        return self._ReturnIcon("workbenches", self._WorkbenchIcons, WorkBenchName)
+
+    def _ReturnIcon(self, Section: str, SerializedIcons: dict, Name: str):
+        self.ReturnData()
+        Icon = None
+        if Name in SerializedIcons:
+            Icon = Serialize_Ribbon.deserializeIcon(SerializedIcons[Name])
+        else:
+            Pack = self.ReturnPack()
+            if Pack is not None:
+                Icon = Pack.icon(Section, Name)
+        if Icon is None or Icon.isNull():
+            return None
+        return Icon
+
+    def _MigrateIcons(self, Data: dict):
+        """Move the serialized icons from the data file to the icon pack. Returns the new stamp."""
+        try:
+            self._ClosePack()
+            Serialize_Ribbon.migrateIconLists(Data, self.PackFileName)
+            Data["Command_Icons"] = []
+            Data["WorkBench_Icons"] = []
+            TempFile = self.FileName + ".tmp"
+            with open(TempFile, "w") as outfile:
+                json.dump(Data, outfile, indent=4)
+            os.replace(TempFile, self.FileName)
+        except Exception as e:
+            if Parameters_Ribbon.DEBUG_MODE is True:
+                StandardFunctions.Print(
+                    f"Failed to create {self.PackFileName}\n{e}", "Warning"
+                )
+            # Use the serialized icons from the data file
+            for IconItem in Data.get("Command_Icons", []):
+                self._CommandIcons[IconItem[0]] = IconItem[1]
+            for IconItem in Data.get("WorkBench_Icons", []):
+                self._WorkbenchIcons[IconItem[0]] = IconItem[1]
+        return self._ReturnStamp(self.FileName)
+
+    def _ClosePack(self):
+        if self._Pack is not None:
+            self._Pack.close()
+        self._Pack = None
+        self._PackStamp = None
+        return
+
+    def _ReturnStamp(self, FileName: str):
+        try:
+            FileStat = os.stat(FileName)
+        except OSError:
+            return None
+        return (FileStat.st_mtime_ns, FileStat.st_size)
+
+
+# The shared command index
+CommandIndex = CommandInfoIndex()
+# The shared data file and its icon pack
+RibbonData = DataFileCache(
+    os.path.join(os.path.dirname(__file__), "RibbonDataFile.dat"),
+    os.path.join(os.path.dirname(__file__), "RibbonIcons.pack"),
+)
+# The shared icon registries
+CommandIcons = IconRegistry(MaxSize=2048, Fallback=RibbonData.ReturnCommandIcon)
+WorkbenchIcons = IconRegistry(MaxSize=256, Fallback=RibbonData.ReturnWorkbenchIcon)
+# The shared layouts of the button labels
+TextLayouts = TextLayoutCache()
+
+
+class IconThemeObserver:
+    """Parameter observer that clears the icon registries when the stylesheet or theme of FreeCAD is changed."""
+
+    Settings = ["StyleSheet", "Theme"]
+
+    def OnChange(self, ParamGrp, Reason):
+        """Called by FreeCAD when a parameter of the main window is changed."""
+        if Reason in self.Settings:
+            CommandIcons.Clear()
+            WorkbenchIcons.Clear()
+        return
+
+
+IconTheme = IconThemeObserver()
+try:
+    App.ParamGet("User parameter:BaseApp/Preferences/MainWindow").Attach(IconTheme)
+except Exception:
+    pass
@@ -27,34 +27,40 @@ import textwrap
 from PySide.QtGui import (
     QIcon,
     QAction,
-    QFontMetrics,
-    QFont,
-    QFontDatabase,
-    QTextOption,
     QCursor,
     QPalette,
-    QEnterEvent,
+    QPainter,
+    QColor,
+    QPen,
 )
 from PySide.QtWidgets import (
     QToolButton,
-    QVBoxLayout,
-    QHBoxLayout,
-    QLabel,
+    QToolBar,
     QMenu,
-    QSpacerItem,
-    QSizePolicy,
-    QTextEdit,
     QStyleOption,
-    QFrame,
+    QStyle,
+    QWidget,
     QGraphicsEffect,
 )
-from PySide.QtCore import Qt, QSize, QRect, QMargins, QEvent
+from PySide.QtCore import (
+    Qt,
+    QSize,
+    QRect,
+    QMargins,
+    QEvent,
+    QPoint,
+    QObject,
+    QCoreApplication,
+    QVariantAnimation,
+    QEasingCurve,
+)
 
 import os
 import sys
 import Parameters_Ribbon
 import Standard_Functions_RIbbon as StandardFunctions
 import StyleMapping
+from Cache_Ribbon import TextLayouts
 
 # Get the resources
 pathIcons = Parameters_Ribbon.ICON_LOCATION
@@ -70,9 +76,272 @@ sys.path.append(pathPackages)
 translate = App.Qt.translate
 
 
-class CustomControls:
+def SetRibbonPart(Widget, Part: str):
+    """
+    Set the property that is used by the stylesheet of the ribbon to style a button.
+    See StyleMapping.ReturnRibbonStyleSheet.
+    """
+    Widget.setProperty("RibbonPart", Part)
+    return
+
+
+class ScrollController(QObject):
+    """
+    Scrolls to a target position with one animation.
+
+    The position is read and set with the given functions, e.g. of a scrollbar.
+    Scrolling again while the animation runs moves the target of the animation, instead of
+    queuing another scroll.
+    """
 
-    def LargeCustomToolButton(
+    def __init__(
+        self,
+        ReturnPosition,
+        SetPosition,
+        ReturnRange,
+        Duration: int = 150,
+        parent=None,
+    ):
+        """
+        ReturnPosition: function that returns the current position as an int.
+        SetPosition: function that sets the position.
+        ReturnRange: function that returns the minimum and maximum position as a tuple.
+        Duration: duration of the animation in ms.
+        """
+        super().__init__(parent)
+        self.ReturnPosition = ReturnPosition
+        self.SetPosition = SetPosition
+        self.ReturnRange = ReturnRange
+        self.Target = 0
+
+        # One animation per controller. Scrolling again moves its end value
+        self.Animation = QVariantAnimation(self)
+        self.Animation.setDuration(Duration)
+        self.Animation.setEasingCurve(QEasingCurve.Type.OutCubic)
+        self.Animation.valueChanged.connect(lambda Value: self.SetPosition(int(Value)))
+
+    def ScrollBy(self, Distance: int):
+        """Scroll the distance from the current target, or from the current position when there is no animation."""
+        Target = self.ReturnPosition()
+        if self.Animation.state() == QVariantAnimation.State.Running:
+            Target = self.Target
+            self.Animation.stop()
+
+        Minimum, Maximum = self.ReturnRange()
+        Target = max(Minimum, min(Maximum, Target + Distance))
+        if Target == self.ReturnPosition():
+            return
+        self.Target = Target
+
+        self.Animation.setStartValue(self.ReturnPosition())
+        self.Animation.setEndValue(Target)
+        self.Animation.start()
+        return
+
+
+class ChildWatcher(QObject):
+    """
+    Event filter that reports the new child widgets of the watched widgets.
+
+    A child is reported when it is polished, because then it is fully created.
+    Only children of the given type are reported.
+    Children that are not polished yet, are only noted with ChildAdded.
+    """
+
+    def __init__(self, ChildType, ReportChild, parent=None):
+        """
+        ChildType: the type of the children to report.
+        ReportChild: function that is called with every new child of that type.
+        """
+        super().__init__(parent)
+        self.ChildType = ChildType
+        self.ReportChild = ReportChild
+        # Set to True when a child is added. Set back to False by Flush
+        self.ChildAdded = False
+
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Type.ChildAdded:
+            self.ChildAdded = True
+        if event.type() == QEvent.Type.ChildPolished:
+            Child = event.child()
+            if isinstance(Child, self.ChildType):
+                self.ReportChild(Child)
+        # Never swallow the event
+        return False
+
+    def Flush(self):
+        """Polish the added children that are not polished yet, to report them now."""
+        if self.ChildAdded is True:
+            self.ChildAdded = False
+            # Qt polishes new widgets from the event loop. Do that now
+            QCoreApplication.sendPostedEvents(None, QEvent.Type.PolishRequest)
+        return
+
+
+class ToolbarRegistry(QObject):
+    """
+    Registry of the toolbars of the main window, by object name, and of their buttons.
+
+    The toolbars are collected once. After that, new toolbars are reported by a ChildWatcher
+    and deleted toolbars are removed. The buttons of a toolbar are collected on first use and
+    collected again after actions or children are added to or removed from the toolbar.
+    The text index of the buttons is built again after an action of the toolbar changed.
+    New toolbars and toolbars that are shown, hidden or moved are kept as changed toolbars,
+    until they are handled with ClearChangedToolbars.
+    """
+
+    # The events of a toolbar that change its buttons
+    ButtonEvents = [
+        QEvent.Type.ActionAdded,
+        QEvent.Type.ActionRemoved,
+        QEvent.Type.ChildAdded,
+        QEvent.Type.ChildRemoved,
+    ]
+    # The events of a toolbar that can change the text of its buttons
+    TextEvents = ButtonEvents + [QEvent.Type.ActionChanged]
+    # The events of a toolbar that change its visibility or its place
+    VisibilityEvents = [
+        QEvent.Type.ShowToParent,
+        QEvent.Type.HideToParent,
+        QEvent.Type.ParentChange,
+    ]
+
+    def __init__(self, MainWindow, parent=None):
+        super().__init__(parent)
+        self.MainWindow = MainWindow
+        # id of the toolbar -> QToolBar
+        self.Toolbars = {}
+        # object name -> QToolBar. When names are used twice, the first toolbar is kept
+        self.ToolbarNames = {}
+        # id of the toolbar -> list of QToolButtons and -> {button text: first QToolButton}
+        self.Buttons = {}
+        self.ButtonTexts = {}
+        # id of the toolbar -> QToolBar, for new toolbars and changed visibility
+        self.ChangedToolbars = {}
+
+        # Watch the main window and the statusbar for new toolbars
+        self.NewToolbars = []
+        self.Watcher = ChildWatcher(QToolBar, self.NewToolbars.append, self)
+        MainWindow.installEventFilter(self.Watcher)
+        for Widget in [MainWindow.statusBar()] + MainWindow.findChildren(
+            QWidget, "StatusBarArea"
+        ):
+            Widget.installEventFilter(self.Watcher)
+        # Collect all existing toolbars on first use
+        self.NewToolbars.extend(MainWindow.findChildren(QToolBar))
+
+    def eventFilter(self, obj, event):
+        if event.type() in self.ButtonEvents:
+            self.Buttons.pop(id(obj), None)
+        if event.type() in self.TextEvents:
+            self.ButtonTexts.pop(id(obj), None)
+        if event.type() in self.VisibilityEvents and id(obj) in self.Toolbars:
+            self.ChangedToolbars[id(obj)] = self.Toolbars[id(obj)]
+        # Never swallow the event
+        return False
+
+    def Update(self):
+        """Add the new toolbars."""
+        # Report the toolbars that are added, but not polished yet
+        self.Watcher.Flush()
+
+        for Toolbar in self.NewToolbars:
+            Key = id(Toolbar)
+            if Key in self.Toolbars:
+                continue
+            self.Toolbars[Key] = Toolbar
+            self.ChangedToolbars[Key] = Toolbar
+            Name = Toolbar.objectName()
+            if Name not in self.ToolbarNames:
+                self.ToolbarNames[Name] = Toolbar
+            Toolbar.installEventFilter(self)
+            Toolbar.destroyed.connect(
+                lambda obj=None, Key=Key, Name=Name: self.Forget(Key, Name)
+            )
+        self.NewToolbars.clear()
+        return
+
+    def ReturnChangedToolbars(self) -> list:
+        """Returns the new toolbars and the shown, hidden or moved toolbars."""
+        self.Update()
+        return list(self.ChangedToolbars.values())
+
+    def ClearChangedToolbars(self):
+        """Mark the changed toolbars as handled."""
+        self.ChangedToolbars.clear()
+        return
+
+    def Forget(self, Key: int, Name: str):
+        """Remove a deleted toolbar."""
+        Toolbar = self.Toolbars.pop(Key, None)
+        if Toolbar is not None and self.ToolbarNames.get(Name) is Toolbar:
+            del self.ToolbarNames[Name]
+            # Use the next toolbar with the same name, if there is one
+            for Other in self.Toolbars.values():
+                if Other.objectName() == Name:
+                    self.ToolbarNames[Name] = Other
+                    break
+        self.Buttons.pop(Key, None)
+        self.ButtonTexts.pop(Key, None)
+        self.ChangedToolbars.pop(Key, None)
+        return
+
+    def ReturnToolbar(self, Name: str):
+        """Returns the toolbar with this object name, or None."""
+        self.Update()
+        return self.ToolbarNames.get(Name)
+
+    def ReturnButtons(self, Name: str) -> list:
+        """Returns a new list with all QToolButtons of the toolbar with this object name."""
+        Toolbar = self.ReturnToolbar(Name)
+        if Toolbar is None:
+            return []
+        Buttons = self.Buttons.get(id(Toolbar))
+        if Buttons is None:
+            Buttons = Toolbar.findChildren(QToolButton)
+            self.Buttons[id(Toolbar)] = Buttons
+        return list(Buttons)
+
+    def ReturnButtonTexts(self, Name: str) -> dict:
+        """Returns the first QToolButton per text, of the toolbar with this object name."""
+        Toolbar = self.ReturnToolbar(Name)
+        if Toolbar is None:
+            return {}
+        ButtonTexts = self.ButtonTexts.get(id(Toolbar))
+        if ButtonTexts is None:
+            ButtonTexts = {}
+            for Button in self.ReturnButtons(Name):
+                ButtonTexts.setdefault(Button.text(), Button)
+            self.ButtonTexts[id(Toolbar)] = ButtonTexts
+        return ButtonTexts
+
+
+class RibbonCommandButton(QToolButton):
+    """
+    A button of the ribbon that paints its icon, text and menu arrow itself.
+
+    The button has a command area, that triggers the action, and a menu area, that opens
+    the menu. The label is part of the menu area when there is a menu, otherwise it is part
+    of the command area. Large buttons are laid out vertically (icon, label, arrow),
+    small and medium buttons horizontally.
+    """
+
+    __slots__ = (
+        "Large",
+        "Menu",
+        "Lines",
+        "FontSize",
+        "IconRect",
+        "LabelRect",
+        "ArrowRect",
+        "CommandArea",
+        "MenuArea",
+        "TextOffset",
+        "HoverArea",
+    )
+
+    def __init__(
+        self,
         Text: str,
         Action: QAction,
         Icon: QIcon,
@@ -80,499 +349,104 @@ class CustomControls:
         ButtonSize: QSize,
         FontSize: int = 11,
         showText=True,
-        TextAlignment=Qt.AlignmentFlag.AlignTop | Qt.AlignmentFlag.AlignHCenter,
         setWordWrap=True,
+        ElideMode=False,
         MaxNumberOfLines=2,
         Menu: QMenu = None,
-        MenuButtonSpace=10,
+        MenuButtonSpace=16,
+        Large=False,
+        parent=None,
+    ):
+        super().__init__(parent)
+        self.Large = Large
+        # Only show a menu when there is more than one action
+        self.Menu = None
+        if Menu is not None and len(Menu.actions()) > 1:
+            self.Menu = Menu
+        self.Lines = []
+        self.FontSize = FontSize
+        self.IconRect = QRect()
+        self.LabelRect = QRect()
+        self.ArrowRect = QRect()
+        self.CommandArea = QRect()
+        self.MenuArea = QRect()
+        self.TextOffset = 0
+        # The highlighted area: "Command", "Menu" or ""
+        self.HoverArea = ""
+
+        self.setDefaultAction(Action)
+        if Icon is not None:
+            self.setIcon(Icon)
+        self.setFocusPolicy(Qt.FocusPolicy.NoFocus)
+        self.setMouseTracking(True)
+        self.setFont(TextLayouts.ReturnFont(FontSize))
+
+        Text = Text.strip()
+        if showText is False:
+            Text = ""
+        if Large is True:
+            self.SetLargeLayout(
+                Text,
+                IconSize,
+                ButtonSize,
+                setWordWrap,
+                MaxNumberOfLines,
+                MenuButtonSpace,
+            )
+        else:
+            self.SetSmallLayout(
+                Text,
+                ButtonSize,
+                setWordWrap,
+                ElideMode,
+                MaxNumberOfLines,
+                MenuButtonSpace,
+            )
+
+    def SetLargeLayout(
+        self, Text, IconSize, ButtonSize, setWordWrap, MaxNumberOfLines, MenuButtonSpace
     ):
-        # Define the controls
-        btn = QToolButton()
-        CommandButton = QToolButton()
-        ArrowButton = QToolButton()
-        Layout = QVBoxLayout()
-        Label_Text = QTextEdit()
-
-        # Set the default stylesheet
-        StyleSheet_Addition_Button = (
-            "QToolButton, QToolButton:hover {background-color: "
-            + StyleMapping.ReturnStyleItem("Background_Color")
-            + ";border: none"
-            + ";}"
-        )
-        btn.setStyleSheet(StyleSheet_Addition_Button)
-        # Define the parameters
-        CommandButtonHeight = 0
+        """Icon on top, the label below it and the arrow at the bottom."""
+        FontMetrics = TextLayouts.ReturnFontMetrics(self.FontSize)
+        CommandButtonHeight = ButtonSize.height()
+        LabelHeight = 0
         TextWidth = 0
         Space = 6
-        if showText is False:
+        if Text == "":
             Space = 0
-        # Remove any trailing spaces
-        Text = Text.strip()
-        # Set the buttonSize
-        CommandButton.setFixedSize(ButtonSize)
-        CommandButtonHeight = ButtonSize.height()
-        # Set the icon and its size
-        CommandButton.setIcon(Icon)
-        CommandButton.setIconSize(IconSize.expandedTo(CommandButton.size()))
-        # Set the content margins to zero
-        CommandButton.setContentsMargins(0, 0, 0, 0)
-        # Add a actions if there is only one
-        if len(Menu.actions()) == 0:
-            CommandButton.addAction(Action)
-        CommandButton.setDefaultAction(Action)
-
-        # Define a vertical layout
-        Layout = QVBoxLayout()
-        # Add the command button
-        Layout.addWidget(CommandButton)
-        Layout.setAlignment(TextAlignment)
-        # Set the content margins to zero
-        Layout.setContentsMargins(0, 0, 0, 0)
-
-        # if showText is False:
         if MenuButtonSpace < 10:
             MenuButtonSpace = 10
 
-        # If text must not be show, set the text to an empty string
-        # Still create a label to set up the button properly
-        if showText is True and Text != "":
-            # Create a label with the correct properties
-            # Label_Text = QTextEdit()
-            Label_Text.setReadOnly(True)
-            Label_Text.setFrameShape(QFrame.Shape.NoFrame)
-            Label_Text.setFrameShadow(QFrame.Shadow.Plain)
-            Label_Text.setTextInteractionFlags(Qt.TextInteractionFlag.NoTextInteraction)
-            Label_Text.setHorizontalScrollBarPolicy(
-                Qt.ScrollBarPolicy.ScrollBarAlwaysOff
-            )
-            Label_Text.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
-            Label_Text.document().setDocumentMargin(0)
-            Label_Text.viewport().setCursor(Qt.CursorShape.ArrowCursor)
-            Label_Text.setFocusPolicy(Qt.FocusPolicy.NoFocus)
-            # Set the font
-            Font = QFont()
-            Font.setPixelSize(FontSize)
-            Label_Text.setFont(Font)
-            # change the menubutton space because text is included in the click area
+        if Text != "":
             MenuButtonSpace = 10
             # Determine the height of a single row
-            SingleHeight = QFontMetrics(Font).boundingRect(Text).height() + 3
-            Label_Text.setMinimumHeight(SingleHeight * 1)
-            Label_Text.setMaximumHeight(SingleHeight * MaxNumberOfLines)
-            # Set the width of the label based on the size of the button
-            Label_Text.setFixedWidth(ButtonSize.width())
-
-            # If there is no WordWrap, set the ElideMode and the max number of lines to 1.
+            SingleHeight = FontMetrics.boundingRect(Text).height() + 3
             if setWordWrap is False:
-                # Determine the maximum length per line
-                FontMetrics = QFontMetrics(Text)
-                maxWidth = 0
-                maxLength = 0
-                for c in Text:
-                    maxWidth = maxWidth + FontMetrics.horizontalAdvance(c, -1)
-                    if maxWidth < ButtonSize.width():
-                        maxLength = maxLength + 1
-                    if maxWidth >= ButtonSize.width():
-                        limit = maxLength - 3
-                        Text = Text[:limit].strip() + "..."
-                        break
-                # Set the text with a placeholder
-                Label_Text.setWordWrapMode(QTextOption.WrapMode.NoWrap)
-                Label_Text.setText(Text)
-                # Set the maximum number of lines to 1
-                MaxNumberOfLines = 1
-                # Set the proper alignment
-                Label_Text.setAlignment(TextAlignment)
-                # Lower the height when there is a menu
-                if Menu is not None and len(Menu.actions()) > 1:
-                    Label_Text.setFixedHeight(SingleHeight)
-                else:
-                    Label_Text.setFixedHeight(SingleHeight + Space)
-
-            # If wordwrap is enabled, set the text and height accordingly
-            if setWordWrap is True:
-                # Set the wrap mode
-                Label_Text.setWordWrapMode(QTextOption.WrapMode.WordWrap)
-                # Determine the maximum length per line
-                FontMetrics = QFontMetrics(Font)
-                maxWidth = 0
-                maxLength = 0
-                for c in Text:
-                    maxWidth = maxWidth + FontMetrics.horizontalAdvance(c, -1)
-                    if maxWidth < ButtonSize.width():
-                        maxLength = maxLength + 1
-                    if maxWidth >= ButtonSize.width():
-                        break
-                maxLength = maxLength + 3
-
-                # Get the first text line
-                line1 = StandardFunctions.ReturnWrappedText(
-                    Text, maxLength, MaxNumberOfLines, True
-                )[0]
-                # Set the alignment
-                Label_Text.setAlignment(TextAlignment)
-                # Add the line
-                Label_Text.append(line1)
-                # get the text width
-                TextWidth = FontMetrics.horizontalAdvance(line1, -1)
-                # Set the correct height. Avoid a too big difference in icon sizes by only decreasing the height when there is a menu.
-                if Menu is not None and len(Menu.actions()) > 1:
-                    Label_Text.setFixedHeight(SingleHeight)
-                else:
-                    Label_Text.setFixedHeight((SingleHeight * MaxNumberOfLines) - Space)
-                # Try to get the second line if there is one
-                try:
-                    line2 = StandardFunctions.ReturnWrappedText(
-                        Text, maxLength, MaxNumberOfLines, True
-                    )[1]
-                    # Set the alignment
-                    Label_Text.setAlignment(TextAlignment)
-                    # Add the line
-                    Label_Text.append(line2)
-                    # Set the correct height
-                    Label_Text.setFixedHeight((SingleHeight * MaxNumberOfLines) - Space)
-                    # Update the text width if neccesary
-                    if FontMetrics.horizontalAdvance(line2, -1) > TextWidth:
-                        TextWidth = TextWidth = FontMetrics.horizontalAdvance(line2, -1)
-                except Exception:
-                    pass
-
-            # Add the label with alignment
-            Layout.addWidget(Label_Text)
-            CommandButtonHeight = CommandButtonHeight - Label_Text.height()
-
-        if Menu is not None and len(Menu.actions()) > 1:
-            # Define a menu
-            ArrowButton.setMenu(Menu)
-            ArrowButton.setPopupMode(QToolButton.ToolButtonPopupMode.InstantPopup)
-            # Set the height according the space for the menubutton
-            ArrowButton.setFixedHeight(MenuButtonSpace)
-            # Set the width according the commandbutton
-            ArrowButton.setFixedWidth(ButtonSize.width() + Space)
-            ArrowButton.adjustSize()
-            # Set the arrow to none
-            ArrowButton.setArrowType(Qt.ArrowType.NoArrow)
-            # Set the content margins
-            ArrowButton.setContentsMargins(0, 0, 0, 0)
-            # Add the Arrow button to the layout
-            Layout.addWidget(ArrowButton)
-
-            # Add the label to the area where the user can invoke the menu
-            if showText is True:
-                # Create custom events
-                #
-                # Peform a menu click when clicked on the label
-                def mouseClickevent(event):
-                    ArrowButton.animateClick()
-
-                Label_Text.mousePressEvent = lambda mouseClick: mouseClickevent(
-                    mouseClick
-                )
-                ArrowButton.mousePressEvent = lambda mouseClick: mouseClickevent(
-                    mouseClick
-                )
-
-                # Change the background color for commandbutton and label on hovering (CSS)
-                def enterEventCustom(event):
-                    BorderColor = StyleMapping.ReturnStyleItem("Border_Color")
-                    if Parameters_Ribbon.CUSTOM_COLORS_ENABLED:
-                        BorderColor = Parameters_Ribbon.COLOR_BORDERS
-                    if Parameters_Ribbon.BORDER_TRANSPARANT:
-                        BorderColor = StyleMapping.ReturnStyleItem(
-                            "Background_Color_Hover"
-                        )
-                    StyleSheet_Addition_Arrow = (
-                        "QToolButton, QTextEdit {background-color: "
-                        + StyleMapping.ReturnStyleItem("Background_Color_Hover")
-                        + ";border: 0.5px solid"
-                        + BorderColor
-                        + ";border-top: 0px solid"
-                        + StyleMapping.ReturnStyleItem("Background_Color_Hover")
-                        + ";border-top-left-radius: 0px;border-bottom-left-radius: 2px;"
-                        + "border-top-right-radius: 0px;border-bottom-right-radius: 2px"
-                        + ";margin: 0px"
-                        + ";spacing: 0px"
-                        + ";}"
-                        + """QToolButton::menu-indicator {
-                                subcontrol-origin: padding;
-                                subcontrol-position: center top;
-                            }"""
-                    )
-                    StyleSheet_Addition_Label = (
-                        "QToolButton, QTextEdit {background-color: "
-                        + StyleMapping.ReturnStyleItem("Background_Color_Hover")
-                        + ";border: 0.5px solid"
-                        + BorderColor
-                        + ";border-bottom: 0px solid"
-                        + StyleMapping.ReturnStyleItem("Background_Color_Hover")
-                        + ";border-top-left-radius: 2px;border-bottom-left-radius: 0px;"
-                        + "border-top-right-radius: 2px;border-bottom-right-radius: 0px"
-                        + ";margin: 0px"
-                        + ";spacing: 0px"
-                        + ";}"
-                    )
-                    StyleSheet_Addition_Button = (
-                        "QToolButton, QTextEdit {background-color: "
-                        + StyleMapping.ReturnStyleItem("Background_Color")
-                        + ";border: none"
-                        + ";}"
-                    )
-                    btn.setStyleSheet(StyleSheet_Addition_Button)
-                    if ArrowButton.underMouse():
-                        Label_Text.setStyleSheet(StyleSheet_Addition_Label)
-                        ArrowButton.setStyleSheet(StyleSheet_Addition_Arrow)
-                    if Label_Text.underMouse():
-                        Label_Text.setStyleSheet(StyleSheet_Addition_Label)
-                        ArrowButton.setStyleSheet(StyleSheet_Addition_Arrow)
-
-                Label_Text.enterEvent = lambda enterEvent: enterEventCustom(enterEvent)
-                ArrowButton.enterEvent = lambda enterEvent: enterEventCustom(enterEvent)
-
-            if showText is False:
-                # Change the background color for commandbutton and label on hovering (CSS)
-                def enterEventCustom_2(event):
-                    BorderColor = StyleMapping.ReturnStyleItem("Border_Color")
-                    if Parameters_Ribbon.CUSTOM_COLORS_ENABLED:
-                        BorderColor = Parameters_Ribbon.COLOR_BORDERS
-                    if Parameters_Ribbon.BORDER_TRANSPARANT:
-                        BorderColor = StyleMapping.ReturnStyleItem(
-                            "Background_Color_Hover"
-                        )
-                    StyleSheet_Addition_Arrow = (
-                        "QToolButton, QTextEdit {background-color: "
-                        + StyleMapping.ReturnStyleItem("Background_Color_Hover")
-                        + ";border: 0.5px solid"
-                        + BorderColor
-                        + ";border-radius: 2px"
-                        + ";margin: 0px"
-                        + ";spacing: 0px"
-                        + ";}"
-                        + """QToolButton::menu-indicator {
-                                subcontrol-origin: padding;
-                                subcontrol-position: center top;
-                            }"""
-                    )
-                    StyleSheet_Addition_Button = (
-                        "QToolButton, QTextEdit {background-color: "
-                        + StyleMapping.ReturnStyleItem("Background_Color")
-                        + ";border: none"
-                        + ";}"
-                    )
-                    btn.setStyleSheet(StyleSheet_Addition_Button)
-                    if ArrowButton.underMouse():
-                        ArrowButton.setStyleSheet(StyleSheet_Addition_Arrow)
-                    if Label_Text.underMouse():
-                        ArrowButton.setStyleSheet(StyleSheet_Addition_Arrow)
-
-                Label_Text.enterEvent = lambda enterEvent: enterEventCustom_2(
-                    enterEvent
-                )
-                ArrowButton.enterEvent = lambda enterEvent: enterEventCustom_2(
-                    enterEvent
-                )
-
-            # restore the stylesheets on leaving
-            def leaveEventCustom(event):
-                StyleSheet = StyleMapping.ReturnStyleSheet(
-                    control="toolbutton",
-                    radius="2px",
-                )
-                StyleSheet_Addition = """QToolButton::menu-indicator {
-                    subcontrol-origin: padding;
-                    subcontrol-position: center top;
-                }"""
-                Label_Text.setStyleSheet(StyleSheet)
-                ArrowButton.setStyleSheet(StyleSheet_Addition + StyleSheet)
-
-            Label_Text.leaveEvent = lambda leaveEvent: leaveEventCustom(leaveEvent)
-            ArrowButton.leaveEvent = lambda leaveEvent: leaveEventCustom(leaveEvent)
-
-            CommandButtonHeight = CommandButtonHeight - ArrowButton.height()
-        else:
-            MenuButtonSpace = 0
-            if showText is True:
-                # Create custom events
-                #
-                # Peform a menu click when clicked on the label
-                def mouseClickevent(event):
-                    CommandButton.animateClick()
-
-                Label_Text.mousePressEvent = lambda mouseClick: mouseClickevent(
-                    mouseClick
-                )
-
-                # Change the background color for commandbutton and label on hovering (CSS)
-                def enterEventCustom(event):
-                    BorderColor = StyleMapping.ReturnStyleItem("Border_Color")
-                    if Parameters_Ribbon.CUSTOM_COLORS_ENABLED:
-                        BorderColor = Parameters_Ribbon.COLOR_BORDERS
-                    if Parameters_Ribbon.BORDER_TRANSPARANT:
-                        BorderColor = StyleMapping.ReturnStyleItem(
-                            "Background_Color_Hover"
-                        )
-                    StyleSheet_Addition_Label = (
-                        "QToolButton, QTextEdit {background-color: "
-                        + StyleMapping.ReturnStyleItem("Background_Color_Hover")
-                        + ";border: 0.5px solid"
-                        + BorderColor
-                        + ";border-top: 0px solid"
-                        + StyleMapping.ReturnStyleItem("Background_Color_Hover")
-                        + ";border-top-left-radius: 0px;border-bottom-left-radius: 2px;"
-                        + "border-top-right-radius: 0px;border-bottom-right-radius: 2px"
-                        + ";margin: 0px"
-                        + ";spacing: 0px"
-                        + ";}"
-                    )
-                    StyleSheet_Addition_Command = (
-                        "QToolButton, QTextEdit {background-color: "
-                        + StyleMapping.ReturnStyleItem("Background_Color_Hover")
-                        + ";border: 0.5px solid"
-                        + BorderColor
-                        + ";border-bottom: 0px solid"
-                        + StyleMapping.ReturnStyleItem("Background_Color_Hover")
-                        + ";border-top-left-radius: 2px;border-bottom-left-radius: 0px;"
-                        + "border-top-right-radius: 2px;border-bottom-right-radius: 0px"
-                        + ";margin: 0px"
-                        + ";spacing: 0px"
-                        + ";}"
-                    )
-                    StyleSheet_Addition_Button = (
-                        "QToolButton, QTextEdit {background-color: "
-                        + StyleMapping.ReturnStyleItem("Background_Color")
-                        + ";border: none"
-                        + ";}"
+                # Shorten the text when it is longer than the button
+                self.Lines = [
+                    TextLayouts.ReturnElidedText(
+                        Text, self.FontSize, ButtonSize.width()
                     )
-                    btn.setStyleSheet(StyleSheet_Addition_Button)
-                    if CommandButton.underMouse():
-                        Label_Text.setStyleSheet(StyleSheet_Addition_Label)
-                        CommandButton.setStyleSheet(StyleSheet_Addition_Command)
-                    if Label_Text.underMouse():
-                        Label_Text.setStyleSheet(StyleSheet_Addition_Label)
-                        CommandButton.setStyleSheet(StyleSheet_Addition_Command)
-
-                Label_Text.enterEvent = lambda enterEvent: enterEventCustom(enterEvent)
-                CommandButton.enterEvent = lambda enterEvent: enterEventCustom(
-                    enterEvent
-                )
-
-            if showText is False:
-                # Change the background color for commandbutton and label on hovering (CSS)
-                def enterEventCustom_2(event):
-                    BorderColor = StyleMapping.ReturnStyleItem("Border_Color")
-                    if Parameters_Ribbon.CUSTOM_COLORS_ENABLED:
-                        BorderColor = Parameters_Ribbon.COLOR_BORDERS
-                    if Parameters_Ribbon.BORDER_TRANSPARANT:
-                        BorderColor = StyleMapping.ReturnStyleItem(
-                            "Background_Color_Hover"
-                        )
-                    StyleSheet_Addition_Command = (
-                        "QToolButton, QTextEdit {background-color: "
-                        + StyleMapping.ReturnStyleItem("Background_Color_Hover")
-                        + ";border: 0.5px solid"
-                        + BorderColor
-                        + ";border-radius: 2px"
-                        + ";margin: 0px"
-                        + ";spacing: 0px"
-                        + ";}"
-                    )
-                    StyleSheet_Addition_Button = (
-                        "QToolButton, QTextEdit {background-color: "
-                        + StyleMapping.ReturnStyleItem("Background_Color")
-                        + ";border: none"
-                        + ";}"
-                    )
-                    btn.setStyleSheet(StyleSheet_Addition_Button)
-                    if CommandButton.underMouse():
-                        CommandButton.setStyleSheet(StyleSheet_Addition_Command)
-                    if Label_Text.underMouse():
-                        CommandButton.setStyleSheet(StyleSheet_Addition_Command)
-
-                Label_Text.enterEvent = lambda enterEvent: enterEventCustom_2(
-                    enterEvent
-                )
-                CommandButton.enterEvent = lambda enterEvent: enterEventCustom_2(
-                    enterEvent
-                )
-
-            # restore the stylesheets on leaving
-            def leaveEventCustom(event):
-                StyleSheet = StyleMapping.ReturnStyleSheet(
-                    control="toolbutton",
-                    radius="2px",
-                )
-                StyleSheet_Addition = (
-                    "QToolButton, QToolButton:hover, QTextEdit, QTextEdit:hover {background-color: "
-                    + StyleMapping.ReturnStyleItem("Background_Color")
-                    + ";border: 0.5px solid"
-                    + StyleMapping.ReturnStyleItem("Background_Color")
-                    + ";}"
+                ]
+                LabelHeight = SingleHeight + Space
+                if self.Menu is not None:
+                    LabelHeight = SingleHeight
+            else:
+                # Get the text lines and the text width. Allow three characters more than what fits on a line
+                Lines, TextWidth = TextLayouts.ReturnWrappedText(
+                    Text, self.FontSize, ButtonSize.width(), MaxNumberOfLines, 3
                 )
-                Label_Text.setStyleSheet(StyleSheet_Addition + StyleSheet)
-                CommandButton.setStyleSheet(StyleSheet)
-
-            Label_Text.leaveEvent = lambda leaveEvent: leaveEventCustom(leaveEvent)
-            CommandButton.leaveEvent = lambda leaveEvent: leaveEventCustom(leaveEvent)
-
-            Label_Text.setToolTip(CommandButton.toolTip())
-
-        # Set the spacing to zero. If not, the CSS styling will show gaps
-        Layout.setSpacing(0)
-        # Add the layout to the button
-        btn.setLayout(Layout)
-
-        # Set the stylesheet
-        StyleSheet = StyleMapping.ReturnStyleSheet(control="toolbutton", radius="2px")
-        StyleSheet_Addition_Label = (
-            "QToolButton, QTextEdit {background-color: "
-            + StyleMapping.ReturnStyleItem("Background_Color")
-            + ";border: 0.5px solid"
-            + StyleMapping.ReturnStyleItem("Background_Color")
-            + ";border-top: 0px solid"
-            + StyleMapping.ReturnStyleItem("Background_Color")
-            + ";border-radius: 2px"
-            + ";margin: 0px"
-            + ";spacing: 0px"
-            + ";}"
-        )
-        StyleSheet_Addition_Command = (
-            "QToolButton, QTextEdit {background-color: "
-            + StyleMapping.ReturnStyleItem("Background_Color")
-            + ";border: 0.5px solid"
-            + StyleMapping.ReturnStyleItem("Background_Color")
-            + ";border-bottom: 0px solid"
-            + StyleMapping.ReturnStyleItem("Background_Color")
-            + ";border-radius: 2px"
-            + ";margin: 0px"
-            + ";spacing: 0px"
-            + ";}"
-        )
-        StyleSheet_Addition_Button = (
-            "QToolButton, QTextEdit {background-color: "
-            + StyleMapping.ReturnStyleItem("Background_Color")
-            + ";border: none"
-            + ";}"
-        )
-        StyleSheet_Addition_Arrow = (
-            "QToolButton, QTextEdit {background-color: "
-            + StyleMapping.ReturnStyleItem("Background_Color")
-            + ";border: 0.5px solid"
-            + StyleMapping.ReturnStyleItem("Background_Color")
-            + ";border-top: 0px solid"
-            + StyleMapping.ReturnStyleItem("Background_Color")
-            + ";border-radius: 2px"
-            + ";margin: 0px"
-            + ";spacing: 0px"
-            + ";}"
-            + """QToolButton::menu-indicator {
-                    subcontrol-origin: padding;
-                    subcontrol-position: center top;
-                }"""
-        )
-        CommandButton.setStyleSheet(StyleSheet_Addition_Command + StyleSheet)
-        ArrowButton.setStyleSheet(StyleSheet_Addition_Arrow + StyleSheet)
-        Label_Text.setStyleSheet(StyleSheet_Addition_Label + StyleSheet)
-        btn.setStyleSheet(StyleSheet_Addition_Button + StyleSheet)
+                self.Lines = list(Lines)
+                # Avoid a too big difference in icon sizes by only decreasing the height when there is a menu.
+                LabelHeight = (SingleHeight * MaxNumberOfLines) - Space
+                if self.Menu is not None and len(Lines) == 1:
+                    LabelHeight = SingleHeight
+            CommandButtonHeight = CommandButtonHeight - LabelHeight
+
+        ArrowHeight = 0
+        if self.Menu is not None:
+            ArrowHeight = MenuButtonSpace
+            CommandButtonHeight = CommandButtonHeight - ArrowHeight
 
         # Set the final sizes
         width = ButtonSize.width()
@@ -580,154 +454,57 @@ class CustomControls:
             width = CommandButtonHeight + Space
         if TextWidth > 0 and TextWidth > CommandButtonHeight + Space:
             width = TextWidth + Space
-        Label_Text.setFixedWidth(width)
-        ArrowButton.setFixedWidth(width)
-        CommandButton.setFixedSize(QSize(width, CommandButtonHeight))
-        btn.setFixedSize(QSize(width, ButtonSize.height()))
-
-        # Return the button
-        return btn
-
-    def CustomToolButton(
-        Text: str,
-        Action: QAction,
-        Icon: QIcon,
-        IconSize: QSize,
-        ButtonSize: QSize,
-        FontSize: int = 11,
-        showText=True,
-        TextAlignment=Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignLeft,
-        TextPositionAlignment=Qt.AlignmentFlag.AlignTop | Qt.AlignmentFlag.AlignLeft,
-        setWordWrap=True,
-        ElideMode=False,
-        MaxNumberOfLines=2,
-        Menu: QMenu = None,
-        MenuButtonSpace=16,
+        self.setFixedSize(QSize(width, ButtonSize.height()))
+        self.setIconSize(IconSize.expandedTo(ButtonSize))
+
+        self.IconRect = QRect(0, 0, width, CommandButtonHeight)
+        self.LabelRect = QRect(0, CommandButtonHeight, width, LabelHeight)
+        self.ArrowRect = QRect(0, ButtonSize.height() - ArrowHeight, width, ArrowHeight)
+        self.SetAreas()
+        return
+
+    def SetSmallLayout(
+        self,
+        Text,
+        ButtonSize,
+        setWordWrap,
+        ElideMode,
+        MaxNumberOfLines,
+        MenuButtonSpace,
     ):
-        # Define the controls
-        btn = QToolButton()
-        CommandButton = QToolButton()
-        ArrowButton = QToolButton()
-        Layout = QHBoxLayout()
-        Label_Text = QTextEdit()
-        # Set the default stylesheet
-        StyleSheet_Addition_Button = (
-            "QToolButton, QToolButton:hover {background-color: "
-            + StyleMapping.ReturnStyleItem("Background_Color")
-            + ";border: none"
-            + ";}"
-        )
-        btn.setStyleSheet(StyleSheet_Addition_Button)
-        # Define the parameters
+        """Icon on the left, the label next to it and the arrow on the right."""
+        FontMetrics = TextLayouts.ReturnFontMetrics(self.FontSize)
+        Height = ButtonSize.height()
         TextWidth = 0
         space = 6
-        # Remove any trailing spaces
-        Text = Text.strip()
-        # Set the buttonSize
-        CommandButton.setFixedSize(ButtonSize)
-        # Set the icon and its size
-        CommandButton.setIcon(Icon)
-        CommandButton.setIconSize(IconSize)
-        # Set the content margins to zero
-        CommandButton.setContentsMargins(0, 0, 0, 0)
-        # Add a actions if there is only one
-        if len(Menu.actions()) == 0:
-            CommandButton.addAction(Action)
-        CommandButton.setDefaultAction(Action)
-
-        # Define a vertical layout
-        Layout = QHBoxLayout()
-        # Add the command button
-        Layout.addWidget(CommandButton)
-        Layout.setAlignment(TextPositionAlignment)
-
-        # Set the content margins to zero
-        Layout.setContentsMargins(0, 0, 0, 0)
-
-        # if showText is False:
         if MenuButtonSpace < 12:
             MenuButtonSpace = 12
 
-        # If text must be shown wrapped, add a layout with label
-        if showText is True and Text != "":
-            # Create a label
-            # Label_Text = QTextEdit()
-            Label_Text.setReadOnly(True)
-            Label_Text.setFrameShape(QFrame.Shape.NoFrame)
-            Label_Text.setFrameShadow(QFrame.Shadow.Plain)
-            Label_Text.setTextInteractionFlags(Qt.TextInteractionFlag.NoTextInteraction)
-            Label_Text.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
-            Label_Text.setHorizontalScrollBarPolicy(
-                Qt.ScrollBarPolicy.ScrollBarAlwaysOff
-            )
-            Label_Text.document().setDocumentMargin(0)
-            Label_Text.viewport().setCursor(Qt.CursorShape.ArrowCursor)
-            Label_Text.setFocusPolicy(Qt.FocusPolicy.NoFocus)
-            Label_Text.setSizeAdjustPolicy(QTextEdit.SizeAdjustPolicy.AdjustToContents)
-            Label_Text.setFixedHeight(CommandButton.height())
-            # Set the font
-            Font = QFont()
-            Font.setPixelSize(FontSize)
-            Label_Text.setFont(Font)
-            FontMetrics = QFontMetrics(Font)
+        if Text != "":
             if setWordWrap is True:
-                Label_Text.setWordWrapMode(QTextOption.WrapMode.WordWrap)
-                # Determine the maximum length per line
-                FontMetrics = QFontMetrics(Font)
-                maxWidth = 0
-                maxLength = 0
-                for c in Text:
-                    maxWidth = maxWidth + FontMetrics.horizontalAdvance(c, -1)
-                    if maxWidth < ButtonSize.width() * 2:
-                        maxLength = maxLength + 1
-                    if maxWidth >= ButtonSize.width() * 2:
-                        break
-                # Get the first text line
-                line1 = StandardFunctions.ReturnWrappedText(
-                    Text, maxLength, MaxNumberOfLines, True
+                # Get the text lines. A line can be twice the width of the button
+                Lines = TextLayouts.ReturnWrappedText(
+                    Text, self.FontSize, ButtonSize.width() * 2, MaxNumberOfLines
                 )[0]
-                # Add the line with a space to avoid te need to set spacing. (Spacing breaks the hover background)
-                Label_Text.append(" " + line1)
-                # Try to get the second line if there is one
-                try:
-                    line2 = StandardFunctions.ReturnWrappedText(
-                        Text, maxLength, MaxNumberOfLines, True
-                    )[1]
-                    # Add the line with a space to avoid te need to set spacing. (Spacing breaks the hover background)
-                    Label_Text.append(" " + line2)
-                    if (
-                        FontMetrics.tightBoundingRect(line1).width()
-                        > FontMetrics.tightBoundingRect(line2).width()
-                    ):
-                        # Update a parameter for the width
-                        TextWidth = FontMetrics.tightBoundingRect(line1).width()
-                    else:
-                        # Update a parameter for the width
-                        TextWidth = FontMetrics.tightBoundingRect(line2).width()
-                except Exception:
-                    # Correct the margin to set the arrow vertical center (bug in Qt)
-                    marginCorrection = (
-                        CommandButton.height() - FontMetrics.boundingRect(Text).height()
-                    ) / 2
-                    Label_Text.setViewportMargins(0, marginCorrection, 0, 0)
-                    # Update a parameter for the width
-                    TextWidth = FontMetrics.tightBoundingRect(line1).width()
-
-                # Adjust the size
-                Label_Text.setMaximumWidth(TextWidth + space)
-                # Update a parameter for the width
+                TextWidth = 0
+                for Line in Lines:
+                    TextWidth = max(
+                        TextWidth, FontMetrics.tightBoundingRect(Line).width()
+                    )
                 TextWidth = TextWidth + space
+                # Add the lines with a space to keep a distance from the icon
+                self.Lines = [" " + Line for Line in Lines]
+                if len(Lines) == 1:
+                    # Center the line vertically
+                    self.TextOffset = int(
+                        (Height - FontMetrics.boundingRect(Text).height()) / 2
+                    )
 
-                # If the text is higher than the commandbutton, switch to no wrap
+                # If the text is higher than the button, switch to no wrap
                 if (
-                    FontMetrics.boundingRect(line1).height() * MaxNumberOfLines
+                    FontMetrics.boundingRect(Lines[0]).height() * MaxNumberOfLines
                 ) > ButtonSize.height():
                     setWordWrap = False
-                    # reset the values
-                    TextWidth = 0
-                    Label_Text.setMaximumWidth(
-                        2000
-                    )  # set to a extra large value to avoid clipping
                     StandardFunctions.Print(
                         "Medium button is too small for text wrap!\n wrap setting is ignored",
                         "Warning",
@@ -736,382 +513,163 @@ class CustomControls:
             if setWordWrap is False:
                 # if the text must be elided, return a updated text
                 if ElideMode is True:
-                    # Determine the maximum length per line
-                    FontMetrics = QFontMetrics(Text)
-                    maxWidth = 0
-                    maxLength = 0
-                    for c in Text:
-                        maxWidth = maxWidth + FontMetrics.horizontalAdvance(c, -1)
-                        if maxWidth < ButtonSize.width() * 3:
-                            maxLength = maxLength + 1
-                        if maxWidth >= ButtonSize.width() * 3:
-                            limit = maxLength - 3
-                            Text = Text[:limit].strip() + "..."
-                            break
-                # Set the number of lines to 1 and disable wrap
-                MaxNumberOfLines = 1
-                Label_Text.setWordWrapMode(QTextOption.WrapMode.NoWrap)
-                # Add the line with a space to avoid te need to set spacing. (Spacing breaks the hover background)
-                Label_Text.setText(" " + Text)
-                # Update the size
-                Label_Text.adjustSize()
-                Label_Text.setFixedHeight(CommandButton.height())
-                # Correct the margin to set the arrow vertical center (bug in Qt)
-                marginCorrection = (
-                    CommandButton.height() - FontMetrics.boundingRect(Text).height()
-                ) / 2
-                Label_Text.setViewportMargins(0, marginCorrection, 0, 0)
-                # Update the width parameter
-                TextWidth = FontMetrics.boundingRect(Text).width() + space
-            # Set the text alignment
-            TextAlignment = Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignLeft
-            Label_Text.setAlignment(TextAlignment)
-            # Set the margins to zero
-            Label_Text.setContentsMargins(0, 0, 0, 0)
-            # Add the label with alignment
-            Layout.addWidget(Label_Text)
-
-        if Menu is not None and len(Menu.actions()) > 1:
-            # Define a menu
-            ArrowButton.setMenu(Menu)
-            ArrowButton.setPopupMode(QToolButton.ToolButtonPopupMode.InstantPopup)
-            # Set the height according the space for the menubutton
-            ArrowButton.setFixedHeight(CommandButton.height())
-            # Set the width according the commandbutton
-            ArrowButton.setFixedWidth(MenuButtonSpace)
-            ArrowButton.adjustSize()
-            # Set the arrow to none. It will be defined via CSS
-            ArrowButton.setArrowType(Qt.ArrowType.NoArrow)
-            # Set the content margins
-            ArrowButton.setContentsMargins(0, 0, 0, 0)
-            # Add the Arrow button to the layout
-            Layout.addWidget(ArrowButton)
-
-            # Add the label to the area where the user can invoke the menu
-            if showText is True:
-                # Create custom events
-                #
-                # Peform a menu click when clicked on the label
-                def mouseClickevent(event):
-                    ArrowButton.animateClick()
-
-                Label_Text.mousePressEvent = lambda mouseClick: mouseClickevent(
-                    mouseClick
-                )
-                ArrowButton.mousePressEvent = lambda mouseClick: mouseClickevent(
-                    mouseClick
-                )
-
-                # Change the background color for commandbutton and label on hovering (CSS)
-                def enterEventCustom(event):
-                    BorderColor = StyleMapping.ReturnStyleItem("Border_Color")
-                    if Parameters_Ribbon.CUSTOM_COLORS_ENABLED:
-                        BorderColor = Parameters_Ribbon.COLOR_BORDERS
-                    if Parameters_Ribbon.BORDER_TRANSPARANT:
-                        BorderColor = StyleMapping.ReturnStyleItem(
-                            "Background_Color_Hover"
-                        )
-                    StyleSheet_Addition_Label = (
-                        "QToolButton, QTextEdit { "
-                        + "background-color: "
-                        + StyleMapping.ReturnStyleItem("Background_Color_Hover")
-                        + ";border: 0.5px solid"
-                        + BorderColor
-                        + ";border-right: 0px solid"
-                        + StyleMapping.ReturnStyleItem("Background_Color_Hover")
-                        + ";border-top-left-radius: 2px;border-bottom-left-radius: 2px;"
-                        + "border-top-right-radius: 0px;border-bottom-right-radius: 0px"
-                        + ";margin: 0px"
-                        + ";spacing: 0px"
-                        + ";}"
+                    Text = TextLayouts.ReturnElidedText(
+                        Text, self.FontSize, ButtonSize.width() * 3
                     )
-                    StyleSheet_Addition_Arrow = (
-                        "QToolButton, QTextEdit { "
-                        + "background-color: "
-                        + StyleMapping.ReturnStyleItem("Background_Color_Hover")
-                        + ";border: 0.5px solid"
-                        + BorderColor
-                        + ";border-left: 0px solid"
-                        + StyleMapping.ReturnStyleItem("Background_Color_Hover")
-                        + ";border-top-left-radius: 0px;border-bottom-left-radius: 0px;"
-                        + "border-top-right-radius: 2px;border-bottom-right-radius: 2px"
-                        + ";margin: 0px"
-                        + ";spacing: 0px"
-                        + ";}"
-                    )
-                    StyleSheet_Addition_Button = (
-                        "QToolButton:hover {background-color: "
-                        + StyleMapping.ReturnStyleItem("Background_Color")
-                        + ";border: none"
-                        + ";}"
-                    )
-                    btn.setStyleSheet(StyleSheet_Addition_Button)
-                    if ArrowButton.underMouse():
-                        ArrowButton.setStyleSheet(StyleSheet_Addition_Arrow)
-                        Label_Text.setStyleSheet(StyleSheet_Addition_Label)
-                    if Label_Text.underMouse():
-                        ArrowButton.setStyleSheet(StyleSheet_Addition_Arrow)
-                        Label_Text.setStyleSheet(StyleSheet_Addition_Label)
-
-                Label_Text.enterEvent = lambda enterEvent: enterEventCustom(enterEvent)
-                ArrowButton.enterEvent = lambda enterEvent: enterEventCustom(enterEvent)
-
-            if showText is False:
-                # Change the background color for commandbutton and label on hovering (CSS)
-                def enterEventCustom_2(event):
-                    BorderColor = StyleMapping.ReturnStyleItem("Border_Color")
-                    if Parameters_Ribbon.CUSTOM_COLORS_ENABLED:
-                        BorderColor = Parameters_Ribbon.COLOR_BORDERS
-                    if Parameters_Ribbon.BORDER_TRANSPARANT:
-                        BorderColor = StyleMapping.ReturnStyleItem(
-                            "Background_Color_Hover"
-                        )
-                    StyleSheet_Addition_Arrow = (
-                        "QToolButton, QTextEdit { "
-                        + "background-color: "
-                        + StyleMapping.ReturnStyleItem("Background_Color_Hover")
-                        + ";border: 0.5px solid"
-                        + BorderColor
-                        + ";border-radius: 2px"
-                        + ";margin: 0px"
-                        + ";spacing: 0px"
-                        + ";}"
-                    )
-                    StyleSheet_Addition_Button = (
-                        "QToolButton:hover {background-color: "
-                        + StyleMapping.ReturnStyleItem("Background_Color")
-                        + ";border: none"
-                        + ";}"
-                    )
-                    btn.setStyleSheet(StyleSheet_Addition_Button)
-                    if ArrowButton.underMouse():
-                        ArrowButton.setStyleSheet(StyleSheet_Addition_Arrow)
-                    if Label_Text.underMouse():
-                        ArrowButton.setStyleSheet(StyleSheet_Addition_Arrow)
-
-                Label_Text.enterEvent = lambda enterEvent: enterEventCustom_2(
-                    enterEvent
-                )
-                ArrowButton.enterEvent = lambda enterEvent: enterEventCustom_2(
-                    enterEvent
-                )
-
-            # restore the stylesheets on leaving
-            def leaveEventCustom(event):
-                StyleSheet = StyleMapping.ReturnStyleSheet(
-                    control="toolbutton",
-                    radius="2px",
-                )
-                StyleSheet_Addition = (
-                    "QToolButton, QToolButton:hover, QTextEdit, QTextEdit:hover {background-color: "
-                    + StyleMapping.ReturnStyleItem("Background_Color")
-                    + ";border: none"
-                    + ";}"
-                )
-                Label_Text.setStyleSheet(StyleSheet + StyleSheet_Addition)
-                ArrowButton.setStyleSheet(StyleSheet + StyleSheet_Addition)
-
-            Label_Text.leaveEvent = lambda leaveEvent: leaveEventCustom(leaveEvent)
-            ArrowButton.leaveEvent = lambda leaveEvent: leaveEventCustom(leaveEvent)
-        else:
-            # Add the label to the area where the user can invoke the menu
-            if showText is True:
-                # Create custom events
-                #
-                # Peform a menu click when clicked on the label
-                def mouseClickevent(event):
-                    CommandButton.animateClick()
-
-                Label_Text.mousePressEvent = lambda mouseClick: mouseClickevent(
-                    mouseClick
-                )
-                ArrowButton.mousePressEvent = lambda mouseClick: mouseClickevent(
-                    mouseClick
-                )
-
-                # Change the background color for commandbutton and label on hovering (CSS)
-                def enterEventCustom(event):
-                    BorderColor = StyleMapping.ReturnStyleItem("Border_Color")
-                    if Parameters_Ribbon.CUSTOM_COLORS_ENABLED:
-                        BorderColor = Parameters_Ribbon.COLOR_BORDERS
-                    if Parameters_Ribbon.BORDER_TRANSPARANT:
-                        BorderColor = StyleMapping.ReturnStyleItem(
-                            "Background_Color_Hover"
-                        )
-                    StyleSheet_Addition_Label = (
-                        "QToolButton, QTextEdit { "
-                        + "background-color: "
-                        + StyleMapping.ReturnStyleItem("Background_Color_Hover")
-                        + ";border: 0.5px solid"
-                        + BorderColor
-                        + ";border-left: 0px solid"
-                        + StyleMapping.ReturnStyleItem("Background_Color_Hover")
-                        + ";border-top-left-radius: 0px;border-bottom-left-radius: 0px;"
-                        + "border-top-right-radius: 2px;border-bottom-right-radius: 2px"
-                        + ";margin: 0px"
-                        + ";spacing: 0px"
-                        + ";}"
-                    )
-                    StyleSheet_Addition_Command = (
-                        "QToolButton, QTextEdit { "
-                        + "background-color: "
-                        + StyleMapping.ReturnStyleItem("Background_Color_Hover")
-                        + ";border: 0.5px solid"
-                        + BorderColor
-                        + ";border-right: 0px solid"
-                        + StyleMapping.ReturnStyleItem("Background_Color_Hover")
-                        + ";border-top-left-radius: 2px;border-bottom-left-radius: 2px;"
-                        + "border-top-right-radius: 0px;border-bottom-right-radius: 0px"
-                        + ";margin: 0px"
-                        + ";spacing: 0px"
-                        + ";}"
-                    )
-                    StyleSheet_Addition_Button = (
-                        "QToolButton, QToolButton:hover {background-color: "
-                        + StyleMapping.ReturnStyleItem("Background_Color")
-                        + ";border: none"
-                        + ";}"
-                    )
-                    btn.setStyleSheet(StyleSheet_Addition_Button)
-                    if CommandButton.underMouse():
-                        CommandButton.setStyleSheet(StyleSheet_Addition_Command)
-                        Label_Text.setStyleSheet(StyleSheet_Addition_Label)
-                    if Label_Text.underMouse():
-                        CommandButton.setStyleSheet(StyleSheet_Addition_Command)
-                        Label_Text.setStyleSheet(StyleSheet_Addition_Label)
-
-                Label_Text.enterEvent = lambda enterEvent: enterEventCustom(enterEvent)
-                CommandButton.enterEvent = lambda enterEvent: enterEventCustom(
-                    enterEvent
-                )
-
-            if showText is False:
-                # Change the background color for commandbutton and label on hovering (CSS)
-                def enterEventCustom_2(event):
-                    BorderColor = StyleMapping.ReturnStyleItem("Border_Color")
-                    if Parameters_Ribbon.CUSTOM_COLORS_ENABLED:
-                        BorderColor = Parameters_Ribbon.COLOR_BORDERS
-                    if Parameters_Ribbon.BORDER_TRANSPARANT:
-                        BorderColor = StyleMapping.ReturnStyleItem(
-                            "Background_Color_Hover"
-                        )
-                    StyleSheet_Addition_Command = (
-                        "QToolButton, QTextEdit { "
-                        + "background-color: "
-                        + StyleMapping.ReturnStyleItem("Background_Color_Hover")
-                        + ";border: 0.5px solid"
-                        + BorderColor
-                        + ";border-radius: 2px"
-                        + ";margin: 0px"
-                        + ";spacing: 0px"
-                        + ";}"
-                    )
-                    StyleSheet_Addition_Button = (
-                        "QToolButton, QToolButton:hover {background-color: "
-                        + StyleMapping.ReturnStyleItem("Background_Color")
-                        + ";border: none"
-                        + ";}"
-                    )
-                    btn.setStyleSheet(StyleSheet_Addition_Button)
-                    if CommandButton.underMouse():
-                        CommandButton.setStyleSheet(StyleSheet_Addition_Command)
-                    if Label_Text.underMouse():
-                        CommandButton.setStyleSheet(StyleSheet_Addition_Command)
-
-                Label_Text.enterEvent = lambda enterEvent: enterEventCustom_2(
-                    enterEvent
-                )
-                CommandButton.enterEvent = lambda enterEvent: enterEventCustom_2(
-                    enterEvent
+                self.Lines = [" " + Text]
+                # Center the line vertically
+                self.TextOffset = int(
+                    (Height - FontMetrics.boundingRect(Text).height()) / 2
                 )
+                TextWidth = FontMetrics.boundingRect(Text).width() + space
 
-            # restore the stylesheets on leaving
-            def leaveEventCustom(event):
-                StyleSheet = StyleMapping.ReturnStyleSheet(
-                    control="toolbutton",
-                    radius="2px",
-                )
-                StyleSheet_Addition = (
-                    "QToolButton, QToolButton:hover, QTextEdit, QTextEdit:hover {background-color: "
-                    + StyleMapping.ReturnStyleItem("Background_Color")
-                    + ";border: none"
-                    + ";}"
+        ArrowWidth = 0
+        if self.Menu is not None:
+            ArrowWidth = MenuButtonSpace
+
+        width = ButtonSize.width() + TextWidth + ArrowWidth
+        self.setFixedSize(QSize(width, Height))
+        self.setIconSize(ButtonSize)
+
+        self.IconRect = QRect(0, 0, ButtonSize.width(), Height)
+        self.LabelRect = QRect(ButtonSize.width(), 0, TextWidth, Height)
+        self.ArrowRect = QRect(width - ArrowWidth, 0, ArrowWidth, Height)
+        self.SetAreas()
+        return
+
+    def SetAreas(self):
+        """Divide the button in the area for the command and the area for the menu."""
+        if self.Menu is None:
+            self.CommandArea = self.rect()
+            self.MenuArea = QRect()
+            return
+        self.CommandArea = QRect(self.IconRect)
+        self.MenuArea = QRect(self.ArrowRect)
+        if len(self.Lines) > 0:
+            self.MenuArea = self.MenuArea.united(self.LabelRect)
+        return
+
+    def SetHoverArea(self, Position: QPoint):
+        HoverArea = ""
+        if self.MenuArea.contains(Position):
+            HoverArea = "Menu"
+        elif self.CommandArea.contains(Position):
+            HoverArea = "Command"
+        if HoverArea != self.HoverArea:
+            self.HoverArea = HoverArea
+            self.update()
+        return
+
+    def ShowMenu(self):
+        """Show the menu below the menu area, like a button with an instant popup."""
+        self.HoverArea = "Menu"
+        self.setDown(True)
+        self.Menu.exec_(self.mapToGlobal(QPoint(self.MenuArea.left(), self.height())))
+        self.setDown(False)
+        self.SetHoverArea(self.mapFromGlobal(QCursor.pos()))
+        return
+
+    def enterEvent(self, event):
+        self.SetHoverArea(self.mapFromGlobal(QCursor.pos()))
+        super().enterEvent(event)
+        return
+
+    def leaveEvent(self, event):
+        self.HoverArea = ""
+        self.update()
+        super().leaveEvent(event)
+        return
+
+    def mouseMoveEvent(self, event):
+        self.SetHoverArea(event.pos())
+        super().mouseMoveEvent(event)
+        return
+
+    def mousePressEvent(self, event):
+        if (
+            self.Menu is not None
+            and event.button() == Qt.MouseButton.LeftButton
+            and self.MenuArea.contains(event.pos())
+        ):
+            self.ShowMenu()
+            return
+        super().mousePressEvent(event)
+        return
+
+    def hitButton(self, Position: QPoint) -> bool:
+        # Only a click on the command area triggers the action
+        return self.CommandArea.contains(Position)
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+
+        # Draw the background
+        BackgroundColor = QColor(StyleMapping.ReturnStyleItem("Background_Color"))
+        if BackgroundColor.isValid():
+            painter.fillRect(self.rect(), BackgroundColor)
+
+        # Draw the highlighted area
+        Area = QRect()
+        if self.HoverArea == "Command" or (self.isDown() and self.Menu is None):
+            Area = self.CommandArea
+        if self.HoverArea == "Menu":
+            Area = self.MenuArea
+        if Area.isEmpty() is False and self.isEnabled():
+            painter.setPen(QPen(QColor(StyleMapping.ReturnHighlightBorderColor()), 1))
+            painter.setBrush(
+                QColor(StyleMapping.ReturnStyleItem("Background_Color_Hover"))
+            )
+            painter.drawRoundedRect(Area.adjusted(0, 0, -1, -1), 2, 2)
+
+        # Draw the icon
+        Mode = QIcon.Mode.Normal
+        if self.isEnabled() is False:
+            Mode = QIcon.Mode.Disabled
+        State = QIcon.State.Off
+        if self.isChecked():
+            State = QIcon.State.On
+        IconSize = self.iconSize().boundedTo(self.IconRect.size())
+        IconRect = QRect(QPoint(0, 0), IconSize)
+        IconRect.moveCenter(self.IconRect.center())
+        self.icon().paint(painter, IconRect, Qt.AlignmentFlag.AlignCenter, Mode, State)
+
+        FontColor = QColor(StyleMapping.ReturnStyleItem("FontColor"))
+        if self.isEnabled() is False:
+            FontColor.setAlphaF(0.5)
+
+        # Draw the text
+        if len(self.Lines) > 0:
+            painter.setFont(self.font())
+            painter.setPen(FontColor)
+            Alignment = Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignTop
+            if self.Large is True:
+                Alignment = Qt.AlignmentFlag.AlignHCenter | Qt.AlignmentFlag.AlignTop
+            LineHeight = self.fontMetrics().lineSpacing()
+            Top = self.LabelRect.top() + self.TextOffset
+            for Line in self.Lines:
+                if Top >= self.LabelRect.bottom():
+                    break
+                painter.drawText(
+                    QRect(
+                        self.LabelRect.left(), Top, self.LabelRect.width(), LineHeight
+                    ),
+                    Alignment,
+                    Line,
                 )
-                Label_Text.setStyleSheet(StyleSheet + StyleSheet_Addition)
-                CommandButton.setStyleSheet(StyleSheet + StyleSheet_Addition)
-
-            Label_Text.leaveEvent = lambda leaveEvent: leaveEventCustom(leaveEvent)
-            CommandButton.leaveEvent = lambda leaveEvent: leaveEventCustom(leaveEvent)
-
-            # Copy the tooltip from the commandbutton to the label
-            Label_Text.setToolTip(CommandButton.toolTip())
-
-            # Set the menubutton space to zero because there is no menu
-            MenuButtonSpace = 0
-
-        # Set the minimum height for the button
-        CommandButton.setMinimumHeight(ButtonSize.height())
-        # Set spacing to zero (highlight background will have gaps otherwise)
-        Layout.setSpacing(0)
-
-        # Add the layout
-        btn.setLayout(Layout)
-        # Set the stylesheet for the controls
-        StyleSheet = StyleMapping.ReturnStyleSheet(control="toolbutton")
-        StyleSheet_Addition_Label = (
-            "QToolButton, QTextEdit { "
-            + "background-color: "
-            + StyleMapping.ReturnStyleItem("Background_Color")
-            + ";border: 0.5px solid"
-            + StyleMapping.ReturnStyleItem("Background_Color")
-            + ";border-left: 0px solid"
-            + StyleMapping.ReturnStyleItem("Background_Color")
-            + ";border-radius: 2px"
-            + ";margin: 0px"
-            + ";spacing: 0px"
-            + ";}"
-        )
-        StyleSheet_Addition_Command = (
-            "QToolButton, QTextEdit { "
-            + "background-color: "
-            + StyleMapping.ReturnStyleItem("Background_Color")
-            + ";border: 0.5px solid"
-            + StyleMapping.ReturnStyleItem("Background_Color")
-            + ";border-right: 0px solid"
-            + StyleMapping.ReturnStyleItem("Background_Color")
-            + ";border-radius: 2px"
-            + ";margin: 0px"
-            + ";spacing: 0px"
-            + ";}"
-        )
-        StyleSheet_Addition_Arrow = (
-            "QToolButton, QTextEdit { "
-            + "background-color: "
-            + StyleMapping.ReturnStyleItem("Background_Color")
-            + ";border: 0.5px solid"
-            + StyleMapping.ReturnStyleItem("Background_Color")
-            + ";border-left: 0px solid"
-            + StyleMapping.ReturnStyleItem("Background_Color")
-            + ";border-radius: 2px"
-            + ";margin: 0px"
-            + ";spacing: 0px"
-            + ";}"
-        )
-        StyleSheet_Addition_button = (
-            "QToolButton, QToolButton:hover, QTextEdit, QTextEdit:hover {background-color: "
-            + StyleMapping.ReturnStyleItem("Background_Color")
-            + ";border: 0px solid"
-            + StyleMapping.ReturnStyleItem("Background_Color")
-            + ";}"
-        )
-        CommandButton.setStyleSheet(StyleSheet_Addition_Command + StyleSheet)
-        ArrowButton.setStyleSheet(StyleSheet_Addition_Arrow + StyleSheet)
-        Label_Text.setStyleSheet(StyleSheet_Addition_Label + StyleSheet)
-        btn.setStyleSheet(StyleSheet_Addition_button + StyleSheet)
-
-        # Set the correct dimensions
-        btn.setFixedWidth(CommandButton.width() + MenuButtonSpace + TextWidth)
-        btn.setFixedHeight(CommandButton.height())
-
-        # return the new button
-        return btn
+                Top = Top + LineHeight
+
+        # Draw the arrow of the menu with the style, like the menu indicator of a toolbutton
+        if self.Menu is not None:
+            Option = QStyleOption()
+            Option.initFrom(self)
+            Option.rect = QRect(0, 0, 8, 8)
+            Option.rect.moveCenter(self.ArrowRect.center())
+            if self.Large is True:
+                Option.rect.moveTop(self.ArrowRect.top())
+            Option.palette.setColor(QPalette.ColorRole.ButtonText, FontColor)
+            self.style().drawPrimitive(
+                QStyle.PrimitiveElement.PE_IndicatorArrowDown, Option, painter, self
+            )
+        painter.end()
+        return
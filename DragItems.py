@@ -79,7 +79,8 @@ from PySide.QtCore import (
     Slot,
     QRect,
 )
-from CustomWidgets import CustomControls
+from CustomWidgets import RibbonCommandButton
+from Cache_Ribbon import RibbonData
 
 import json
 import os
@@ -91,7 +92,6 @@ import LoadSettings_Ribbon
 import LoadLicenseForm_Ribbon
 import Standard_Functions_RIbbon as StandardFunctions
 from Standard_Functions_RIbbon import CommandInfoCorrections
-import Serialize_Ribbon
 import StyleMapping
 import platform
 import math
@@ -1656,28 +1656,14 @@ class ModernMenu(RibbonBar):
                                 StandardFunctions.Print(
                                     f"An icon retrieved from data file for '{CommandName}'"
                                 )
-                                DataFile = os.path.join(
-                                    os.path.dirname(__file__), "RibbonDataFile.dat"
-                                )
-
-                                if os.path.exists(DataFile) is True:
-                                    Data = {}
-                                    # read ribbon structure from JSON file
-                                    with open(DataFile, "r") as file:
-                                        Data.update(json.load(file))
-                                    file.close()
+                                if RibbonData.Exists() is True:
                                     try:
-                                        # Load the lists for the deserialized icons
-                                        for IconItem in Data["Command_Icons"]:
-                                            # This works only for FreeCAD Commands
-                                            CommandName_Icon = action.data()
-                                            if CommandName_Icon == IconItem[0]:
-                                                Icon: QIcon = (
-                                                    Serialize_Ribbon.deserializeIcon(
-                                                        IconItem[1]
-                                                    )
-                                                )
-                                                action.setIcon(Icon)
+                                        # Decode only the icon for this command. This works only for FreeCAD Commands
+                                        Icon = RibbonData.ReturnCommandIcon(
+                                            action.data()
+                                        )
+                                        if Icon is not None:
+                                            action.setIcon(Icon)
                                     except Exception as e:
                                         if Parameters_Ribbon.DEBUG_MODE is True:
                                             StandardFunctions.Print(
@@ -1719,10 +1705,7 @@ class ModernMenu(RibbonBar):
                                     Parameters_Ribbon.ICON_SIZE_SMALL,
                                     Parameters_Ribbon.ICON_SIZE_SMALL,
                                 )
-                                Menu = QMenu()
-                                if button.menu() is not None:
-                                    Menu = button.menu()
-                                btn = CustomControls.CustomToolButton(
+                                btn = RibbonCommandButton(
                                     Text=action.text(),
                                     Action=action,
                                     Icon=action.icon(),
@@ -1733,7 +1716,7 @@ class ModernMenu(RibbonBar):
                                     setWordWrap=False,
                                     ElideMode=False,
                                     MaxNumberOfLines=2,
-                                    Menu=Menu,
+                                    Menu=button.menu(),
                                     MenuButtonSpace=16,
                                 )
                                 # add the button as large button
@@ -1757,10 +1740,7 @@ class ModernMenu(RibbonBar):
                                     Parameters_Ribbon.ICON_SIZE_MEDIUM,
                                     Parameters_Ribbon.ICON_SIZE_MEDIUM,
                                 )
-                                Menu = QMenu()
-                                if button.menu() is not None:
-                                    Menu = button.menu()
-                                btn = CustomControls.CustomToolButton(
+                                btn = RibbonCommandButton(
                                     Text=action.text(),
                                     Action=action,
                                     Icon=action.icon(),
@@ -1770,7 +1750,7 @@ class ModernMenu(RibbonBar):
                                     showText=showText,
                                     setWordWrap=Parameters_Ribbon.WRAPTEXT_MEDIUM,
                                     MaxNumberOfLines=2,
-                                    Menu=Menu,
+                                    Menu=button.menu(),
                                     MenuButtonSpace=16,
                                 )
                                 # add the button as large button
@@ -1793,10 +1773,7 @@ class ModernMenu(RibbonBar):
                                     Parameters_Ribbon.ICON_SIZE_LARGE,
                                     Parameters_Ribbon.ICON_SIZE_LARGE,
                                 )
-                                Menu = QMenu()
-                                if button.menu() is not None:
-                                    Menu = button.menu()
-                                btn: QToolButton = CustomControls.LargeCustomToolButton(
+                                btn = RibbonCommandButton(
                                     Text=action.text(),
                                     Action=action,
                                     Icon=action.icon(),
@@ -1806,8 +1783,9 @@ class ModernMenu(RibbonBar):
                                     showText=showText,
                                     setWordWrap=Parameters_Ribbon.WRAPTEXT_LARGE,
                                     MaxNumberOfLines=2,
-                                    Menu=Menu,
+                                    Menu=button.menu(),
                                     MenuButtonSpace=16,
+                                    Large=True,
                                 )
                                 # add the button as large button
                                 panel.addLargeWidget(
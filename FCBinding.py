@@ -81,22 +81,19 @@ from PySide.QtCore import (
     Slot,
     QRect,
 )
-from CustomWidgets import CustomControls
+from CustomWidgets import RibbonCommandButton, ScrollController, SetRibbonPart, ToolbarRegistry
 
 import json
 import os
 import sys
-import webbrowser
-import LoadDesign_Ribbon
 import Parameters_Ribbon
-import LoadSettings_Ribbon
-import LoadLicenseForm_Ribbon
 import Standard_Functions_RIbbon as StandardFunctions
-from Standard_Functions_RIbbon import CommandInfoCorrections
-import Serialize_Ribbon
+from Cache_Ribbon import CommandIndex, CommandIcons, WorkbenchIcons, RibbonData
+from Profiler_Ribbon import StartupProfiler
 import StyleMapping
 import platform
 import math
+import time
 
 # Get the resources
 pathIcons = Parameters_Ribbon.ICON_LOCATION
@@ -116,7 +113,7 @@ from pyqtribbon_local.ribbonbar import RibbonMenu, RibbonBar
 from pyqtribbon_local.panel import RibbonPanel
 from pyqtribbon_local.toolbutton import RibbonToolButton
 from pyqtribbon_local.separator import RibbonSeparator
-from pyqtribbon_local.category import RibbonCategoryLayoutButton
+from pyqtribbon_local.category import RibbonCategory, RibbonCategoryLayoutButton
 
 # import pyqtribbon_local as pyqtribbon
 # from pyqtribbon.ribbonbar import RibbonMenu, RibbonBar
@@ -143,9 +140,31 @@ class ModernMenu(RibbonBar):
     ribbonStructure = {}
     wbNameMapping = {}
     isWbLoaded = {}
+    # The workbenches that are activated for new panels and dropdown buttons
+    ActivatedWorkbenches = []
     MainWindowLoaded = False
     LeaveEventEnabled = True
 
+    # Placeholders for building the panels of tabs in the background, while the application is idle.
+    # The panels of a tab are built one by one. PanelBuilders holds the unfinished tabs per tab name
+    PanelBuilders = {}
+    PrebuildTimer = None
+    HoveredTab = -1
+    # The time in seconds that one idle slice may use
+    PrebuildSliceTime = 0.01
+    # The number of recently used workbenches that are remembered between sessions
+    RecentTabsCount = 5
+
+    # Placeholders for the animated scrolling. ScrollControllers holds the controller per tab name.
+    ScrollControllers = {}
+    TabBarScrollController = None
+    # The distance in pixels of one scroll step of a tab
+    ScrollStep = 50
+
+    # Placeholder for the registry of the classic toolbars and their buttons, by name.
+    # Used to hide the classic toolbars and to build the panels without searching the main window
+    ClassicToolbars = None
+
     # use icon size from FreeCAD preferences
     iconSize = Parameters_Ribbon.ICON_SIZE_SMALL
     ApplicationButtonSize = Parameters_Ribbon.APP_ICON_SIZE
@@ -176,10 +195,6 @@ class ModernMenu(RibbonBar):
     # Create the list for the commands
     List_Commands = []
 
-    # Create the lists for the deserialized icons
-    List_CommandIcons = []
-    List_WorkBenchIcons = []
-
     # Declare the custom overlay function states
     OverlayToggled = False
     TransparancyToggled = False
@@ -199,12 +214,18 @@ class ModernMenu(RibbonBar):
 
         # connect the signals
         self.connectSignals()
+        # Keep the command index up-to-date when workbenches are loaded
+        mw.workbenchActivated.connect(CommandIndex.OnWorkbenchActivated)
 
         # read ribbon structure from JSON file
+        StartupProfiler.Mark("Load RibbonStructure.json")
+        # Keep the text of the file, to check later if it must be written
         with open(Parameters_Ribbon.RIBBON_STRUCTURE_JSON, "r") as file:
-            self.ribbonStructure.update(json.load(file))
+            RibbonStructureText = file.read()
         file.close()
+        self.ribbonStructure.update(json.loads(RibbonStructureText))
 
+        StartupProfiler.Mark("Load data file")
         DataFile2 = os.path.join(os.path.dirname(__file__), "RibbonDataFile2.dat")
         if os.path.exists(DataFile2) is True:
             Data = {}
@@ -219,6 +240,7 @@ class ModernMenu(RibbonBar):
                 pass
 
         # if FreeCAD is version 0.21 create a custom toolbar "Individual Views"
+        StartupProfiler.Mark("Update ribbon structure")
         if int(App.Version()[0]) == 0 and int(App.Version()[1]) <= 21:
             StandardFunctions.CreateToolbar(
                 Name="Individual views",
@@ -344,11 +366,10 @@ class ModernMenu(RibbonBar):
             if ViewsRibbon_Inlist is False:
                 ListIgnoredToolbars.append("Views - Ribbon")
         self.ribbonStructure["ignoredToolbars"] = ListIgnoredToolbars
-        # write the change to the json file
-        # Writing to sample.json
-        with open(Parameters_Ribbon.RIBBON_STRUCTURE_JSON, "w") as outfile:
-            json.dump(self.ribbonStructure, outfile, indent=4)
-        outfile.close()
+        # write the change to the json file. Only if something is changed
+        NewRibbonStructureText = json.dumps(self.ribbonStructure, indent=4)
+        if NewRibbonStructureText != RibbonStructureText:
+            StandardFunctions.WriteFileAtomic(Parameters_Ribbon.RIBBON_STRUCTURE_JSON, NewRibbonStructureText)
 
         # Get the address of the repository address
         PackageXML = os.path.join(os.path.dirname(__file__), "package.xml")
@@ -356,38 +377,18 @@ class ModernMenu(RibbonBar):
         if self.ReproAdress != "" or self.ReproAdress is not None:
             print(translate("FreeCAD Ribbon", "FreeCAD Ribbon: ") + self.ReproAdress)
 
-        # Set the icon size if parameters has none
+        # Set the icon size if parameters has none. Only missing or changed settings are written
         Parameters_Ribbon.Settings.WriteSettings()
 
-        # Activate the workbenches used in the new panels otherwise the panel stays empty
-        try:
-            if "newPanels" in self.ribbonStructure:
-                for WorkBenchName in self.ribbonStructure["newPanels"]:
-                    for NewPanel in self.ribbonStructure["newPanels"][WorkBenchName]:
-                        # Get the commands from the custom panel
-                        Commands = self.ribbonStructure["newPanels"][WorkBenchName][NewPanel]
-
-                        # Get the command and its original toolbar
-                        for CommandItem in Commands:
-                            if CommandItem[1] != "General" and CommandItem[1] != "Global":
-                                # Activate the workbench if not loaded
-                                Gui.activateWorkbench(CommandItem[1])
-        except Exception as e:
-            if Parameters_Ribbon.DEBUG_MODE is True:
-                StandardFunctions.Print(
-                    f"new panels have wrong format. Please create them again!\n{e}",
-                    "Error",
-                )
-            pass
-
-        # Activate the workbenches used in the dropdown buttons otherwise the button stays empty
+        # Activate the workbenches used in the dropdown buttons of the quick access toolbar.
+        # The workbenches for new panels and dropdown buttons in the ribbon are activated when their tab is built.
+        StartupProfiler.Mark("Workbench pre-activation")
         try:
-            if "dropdownButtons" in self.ribbonStructure:
-                for DropDownCommand, Commands in self.ribbonStructure["dropdownButtons"].items():
-                    for CommandItem in Commands:
-                        if CommandItem[1] != "General" and CommandItem[1] != "Global":
-                            # Activate the workbench if not loaded
-                            Gui.activateWorkbench(CommandItem[1])
+            QuickAccessDropDowns = []
+            for CommandName in self.ribbonStructure["quickAccessCommands"]:
+                if CommandName.endswith("_ddb"):
+                    QuickAccessDropDowns.append([CommandName, ""])
+            self.ActivateWorkbenches(self.ReturnWorkbenchesForCommands(QuickAccessDropDowns))
         except Exception as e:
             if Parameters_Ribbon.DEBUG_MODE is True:
                 StandardFunctions.Print(
@@ -397,11 +398,16 @@ class ModernMenu(RibbonBar):
             pass
 
         # Create the ribbon
+        StartupProfiler.Mark("CreateMenus")
         self.CreateMenus()  # Create the menus
+        StartupProfiler.Mark("createModernMenu")
         self.createModernMenu()  # Create the ribbon
+        StartupProfiler.Mark("onUserChangedWorkbench")
         self.onUserChangedWorkbench(False)  # Set the dockwidget and ribbonheight as done after changing from workbench
 
-        # Set the custom stylesheet
+        # Set the custom stylesheet. The stylesheet is assembled first and set once on the ribbon.
+        # The buttons of the ribbon are styled by the same stylesheet with dynamic properties.
+        StartupProfiler.Mark("Stylesheet assembly")
         StyleSheet = Path(Parameters_Ribbon.STYLESHEET).read_text()
         # modify the stylesheet to set the border and background for a toolbar and menu
         hexColor = StyleMapping.ReturnStyleItem("Background_Color")
@@ -416,7 +422,6 @@ class ModernMenu(RibbonBar):
                 "\n\nRibbonBar {border: none;background: solid " + hexColor + ";color: " + hexColor + ";}"
             )
             StyleSheet = StyleSheet_Addition_2 + StyleSheet + StyleSheet_Addition
-        self.setStyleSheet(StyleSheet)
 
         # If the text for the tabs is set to be disabled, update the stylesheet
         if Parameters_Ribbon.TABBAR_STYLE == 1:
@@ -438,7 +443,6 @@ class ModernMenu(RibbonBar):
                         }"""
             )
             StyleSheet = StyleSheet_Addition_3 + StyleSheet
-            self.setStyleSheet(StyleSheet)
 
         # Add an addition for selected tabs
         StyleSheet_Addition_4 = (
@@ -458,7 +462,6 @@ class ModernMenu(RibbonBar):
                 + """;}"""
             )
         StyleSheet = StyleSheet_Addition_4 + StyleSheet
-        self.setStyleSheet(StyleSheet)
 
         # Add an addition for Font sizes
         StyleSheet_Addition_5 = """
@@ -477,9 +480,13 @@ class ModernMenu(RibbonBar):
             { font-size:11px;}
                 QTabBar {font-size:14px;}"""
         StyleSheet = StyleSheet_Addition_5 + StyleSheet
+
+        # Add the stylesheet for the buttons of the ribbon
+        StyleSheet = StyleSheet + StyleMapping.ReturnRibbonStyleSheet()
         self.setStyleSheet(StyleSheet)
 
         # get the state of the mainwindow
+        StartupProfiler.Mark("Finish ribbon setup")
         self.MainWindowLoaded = True
 
         # Set these settings and connections at init
@@ -510,6 +517,9 @@ class ModernMenu(RibbonBar):
         # override the default scroll behavior with a custom function
         self.tabBar().wheelEvent = lambda event_tabBar: self.wheelEvent_TabBar(event_tabBar)
         self.wheelEvent = lambda event_CC: self.wheelEvent_CC(event_CC)
+        # prebuild the tab under the mouse
+        self.tabBar().setMouseTracking(True)
+        self.tabBar().mouseMoveEvent = lambda event_TabBar: self.mouseMoveEvent_TabBar(event_TabBar)
         self.tabBar().setFocusPolicy(Qt.FocusPolicy.StrongFocus)
         self.currentCategory().setFocusPolicy(Qt.FocusPolicy.StrongFocus)
 
@@ -518,8 +528,8 @@ class ModernMenu(RibbonBar):
         # So they are set in self.BuildPanels()
         #
         # Set the scroll buttons on the tabbar
-        ScrollLeftButton_Tab: QToolButton = self.tabBar().findChildren(QToolButton)[0]
-        ScrollRightButton_Tab: QToolButton = self.tabBar().findChildren(QToolButton)[1]
+        ScrollLeftButton_Tab: QToolButton = self.tabBarScrollButtons()[0]
+        ScrollRightButton_Tab: QToolButton = self.tabBarScrollButtons()[1]
         # get the icons
         ScrollLeftButton_Tab_Icon = StyleMapping.ReturnStyleItem("ScrollLeftButton_Tab")
         ScrollRightButton_Tab_Icon = StyleMapping.ReturnStyleItem("ScrollRightButton_Tab")
@@ -534,26 +544,30 @@ class ModernMenu(RibbonBar):
             )
         if ScrollLeftButton_Tab_Icon is not None:
             ScrollLeftButton_Tab.setStyleSheet(StyleSheet)
+            ScrollLeftButton_Tab.setArrowType(Qt.ArrowType.NoArrow)
             ScrollLeftButton_Tab.setIcon(ScrollLeftButton_Tab_Icon)
         else:
-            ScrollRightButton_Tab.setToolButtonStyle(Qt.ToolButtonStyle.ToolButtonTextOnly)
+            ScrollLeftButton_Tab.setArrowType(Qt.ArrowType.LeftArrow)
         if ScrollRightButton_Tab_Icon is not None:
             ScrollRightButton_Tab.setStyleSheet(StyleSheet)
+            ScrollRightButton_Tab.setArrowType(Qt.ArrowType.NoArrow)
             ScrollRightButton_Tab.setIcon(ScrollRightButton_Tab_Icon)
         else:
             ScrollRightButton_Tab.setArrowType(Qt.ArrowType.RightArrow)
+        # Connect the custom click event
+        ScrollLeftButton_Tab.mousePressEvent = lambda clickLeft: self.on_ScrollButton_Tab_clicked(clickLeft, -1)
+        ScrollRightButton_Tab.mousePressEvent = lambda clickRight: self.on_ScrollButton_Tab_clicked(clickRight, 1)
 
         # Add a custom close event to show the original menubar again
         self.closeEvent = lambda close: self.closeEvent(close)
 
-        # Remove persistant toolbars
+        # Remove persistant toolbars. Only write the values that are not empty yet
         PersistentToolbars = App.ParamGet("User parameter:Tux/PersistentToolbars/User").GetGroups()
         for Group in PersistentToolbars:
             Parameter = App.ParamGet("User parameter:Tux/PersistentToolbars/User/" + Group)
-            Parameter.SetString("Top", "")
-            Parameter.SetString("Left", "")
-            Parameter.SetString("Right", "")
-            Parameter.SetString("Bottom", "")
+            for Area in ["Top", "Left", "Right", "Bottom"]:
+                if Parameter.GetString(Area) != "":
+                    Parameter.SetString(Area, "")
 
         # Connect shortcuts
         #
@@ -565,6 +579,7 @@ class ModernMenu(RibbonBar):
         ToolTip = f"{KeyCombination}"
         self.applicationOptionButton().setToolTip(ToolTip)
 
+        StartupProfiler.Mark()
         return
 
     def closeEvent(self, event):
@@ -634,12 +649,8 @@ class ModernMenu(RibbonBar):
                 NoClicks = 1
 
             # go back or forward based on x.
-            if x == 1:
-                for i in range(NoClicks):
-                    self.currentCategory().scrollPrevious()
-            if x == -1:
-                for i in range(NoClicks):
-                    self.currentCategory().scrollNext()
+            # Scrolling again before the animation is finished, moves the target of the animation
+            self.ReturnScrollController(self.currentCategory()).ScrollBy(-x * NoClicks * self.ScrollStep)
         return
 
     # used to scroll the tabbar horizontally, when it's wider than the screen
@@ -650,21 +661,51 @@ class ModernMenu(RibbonBar):
             delta = event.angleDelta().y()
             x += delta and delta // abs(delta)
 
-            ScrollButtons_Tab = self.tabBar().children()
-            ScrollLeftButton_Tab: QToolButton = ScrollButtons_Tab[0]
-            ScrollRightButton_Tab: QToolButton = ScrollButtons_Tab[1]
-
             NoClicks = Parameters_Ribbon.Settings.GetIntSetting("TabBar_Scroll")
             if NoClicks == 0 or NoClicks is None:
                 NoClicks = 1
 
             # go back or forward based on x.
-            if x == 1:
-                for i in range(NoClicks):
-                    ScrollLeftButton_Tab.click()
-            if x == -1:
-                for i in range(NoClicks):
-                    ScrollRightButton_Tab.click()
+            # Scrolling again before the animation is finished, moves the target of the animation
+            self.ReturnTabBarScrollController().ScrollBy(-x * NoClicks * self.ScrollStep)
+        return
+
+    def ReturnScrollController(self, category: RibbonCategory) -> ScrollController:
+        """Returns the controller for the animated scrolling of a tab. The controller is created on first use."""
+        Controller = self.ScrollControllers.get(category.title())
+        if Controller is None:
+            ScrollBar = category._categoryScrollArea.horizontalScrollBar()
+            Controller = ScrollController(
+                ScrollBar.value,
+                ScrollBar.setValue,
+                lambda: (ScrollBar.minimum(), ScrollBar.maximum()),
+                parent=category,
+            )
+            self.ScrollControllers[category.title()] = Controller
+        return Controller
+
+    def ReturnTabBarScrollController(self) -> ScrollController:
+        """Returns the controller for the animated scrolling of the tabbar. The controller is created on first use."""
+        if self.TabBarScrollController is None:
+            ScrollBar = self.tabBarScrollArea().horizontalScrollBar()
+            self.TabBarScrollController = ScrollController(
+                ScrollBar.value,
+                ScrollBar.setValue,
+                lambda: (ScrollBar.minimum(), ScrollBar.maximum()),
+                parent=self,
+            )
+        return self.TabBarScrollController
+
+    # used to build the panels of the tab under the mouse, before it is clicked
+    def mouseMoveEvent_TabBar(self, event):
+        TabBar = self.tabBar()
+        type(TabBar).mouseMoveEvent(TabBar, event)
+
+        index = TabBar.tabAt(event.pos())
+        if index != self.HoveredTab:
+            self.HoveredTab = index
+            if index >= 0 and self.isWbLoaded.get(TabBar.tabText(index), True) is False:
+                self.SchedulePrebuild()
         return
 
     def connectSignals(self):
@@ -867,6 +908,10 @@ class ModernMenu(RibbonBar):
                 param_string = param_string + "," + WorkbenchOrderedList[i]
         Parameters_Ribbon.Settings.SetStringSetting("TabOrder", param_string)
 
+        # The categories are created again. Forget the panels that are partly built
+        self.PanelBuilders = {}
+        self.ScrollControllers = {}
+
         # add category for each workbench
         for i in range(len(WorkbenchOrderedList)):
             for workbenchName, workbench in list(Gui.listWorkbenches().items()):
@@ -1111,6 +1156,13 @@ class ModernMenu(RibbonBar):
                         ListScripts[i],
                         lambda i=i + 1: self.LoadMarcoFreeCAD(ListScripts[i - 1]),
                     )
+        # Add a button to show the report of the startup profiler, when it is enabled
+        if Parameters_Ribbon.PROFILE_STARTUP is True:
+            ProfileButton = RibbonMenu.addAction(translate("FreeCAD Ribbon", "Startup profile"))
+            ProfileButton.setToolTip(
+                translate("FreeCAD Ribbon", "Show the timing of the ribbon startup in the report view")
+            )
+            ProfileButton.triggered.connect(StartupProfiler.PrintReport)
         # Set the RibbonMenu
         self.RibbonMenu = RibbonMenu
 
@@ -1171,15 +1223,22 @@ class ModernMenu(RibbonBar):
         self.HelpMenu = HelpMenu
         return
 
+    # The dialogs are imported when they are opened for the first time, to keep loading the ribbon fast
     def loadDesignMenu(self):
+        import LoadDesign_Ribbon
+
         LoadDesign_Ribbon.main()
         return
 
     def loadSettingsMenu(self):
+        import LoadSettings_Ribbon
+
         LoadSettings_Ribbon.main()
         return
 
     def on_AboutButton_clicked(self):
+        import LoadLicenseForm_Ribbon
+
         LoadLicenseForm_Ribbon.main()
         return
 
@@ -1192,6 +1251,8 @@ class ModernMenu(RibbonBar):
                 self.ReproAdress = self.ReproAdress + "/"
 
             Adress = self.ReproAdress + "wiki"
+            import webbrowser
+
             webbrowser.open(Adress, new=2, autoraise=True)
         return
 
@@ -1201,6 +1262,8 @@ class ModernMenu(RibbonBar):
                 self.ReproAdress = self.ReproAdress + "/"
 
             Adress = self.ReproAdress + """wiki/06-%E2%80%90-Change-log"""
+            import webbrowser
+
             webbrowser.open(Adress, new=2, autoraise=True)
         return
 
@@ -1301,14 +1364,20 @@ class ModernMenu(RibbonBar):
             return
 
         # hide normal toolbars
-        self.hideClassicToolbars()
+        with StartupProfiler.Phase("hideClassicToolbars"):
+            self.hideClassicToolbars()
 
         # switch tab if necessary
         self.updateCurrentTab()
 
         # create panels. Do this after updateCurrentTab.
         # Otherwise, the sketcher workbench won;t be loaded properly the first time
-        self.buildPanels()
+        with StartupProfiler.Phase("buildPanels"):
+            self.buildPanels()
+
+        # Remember the workbench and build the tabs that are likely to be opened next
+        self.UpdateRecentTabs(workbench.name())
+        self.SchedulePrebuild()
         return
 
     def onTabBarClicked(self):
@@ -1325,11 +1394,30 @@ class ModernMenu(RibbonBar):
     def ToggleApplicationButton(self):
         self.applicationOptionButton().showMenu()
 
-    def buildPanels(self):
-        # Get the active workbench and get its name
+    def buildPanels(self, TabIndex: int = None):
+        """
+        Builds the panels of a tab. Without an index, the current tab is built.
+        A tab that is partly built in the background is finished instead.
+        """
+        if TabIndex is None:
+            TabIndex = self.tabBar().currentIndex()
+
+        Builder = self.PanelBuilders.pop(self.tabBar().tabText(TabIndex), None)
+        if Builder is None:
+            Builder = self.BuildPanelsStepwise(TabIndex)
+        for Step in Builder:
+            pass
+        return
+
+    def BuildPanelsStepwise(self, TabIndex: int):
+        """
+        Builds the panels of a tab. This is a generator that stops after each panel,
+        so the panels of a tab can also be built in idle slices by PrebuildSlice.
+        """
+        # Get the workbench of the tab and get its name
         #
-        workbenchTitle = self.tabBar().tabText(self.tabBar().currentIndex())
-        workbenchName = self.tabBar().tabData(self.tabBar().currentIndex())
+        workbenchTitle = self.tabBar().tabText(TabIndex)
+        workbenchName = self.tabBar().tabData(TabIndex)
         if workbenchName is None:
             return
         workbench = Gui.getWorkbench(workbenchName)
@@ -1338,6 +1426,19 @@ class ModernMenu(RibbonBar):
         tabName = workbenchTitle
         if tabName in self.isWbLoaded and (self.isWbLoaded[tabName] or tabName == ""):
             return
+        category = self.category(tabName)
+
+        # Activate the workbenches used in the new panels and dropdown buttons of this tab.
+        # Otherwise the panels and buttons stay empty
+        try:
+            NewPanelCommands = self.ReturnNewPanelCommands(workbenchName)
+            self.ActivateWorkbenches(self.ReturnWorkbenchesForCommands(NewPanelCommands))
+        except Exception as e:
+            if Parameters_Ribbon.DEBUG_MODE is True:
+                StandardFunctions.Print(f"new panels have wrong format. Please create them again!\n{e}", "Error")
+
+        # Make sure that the command index is up-to-date
+        CommandIndex.Validate()
 
         # Get the list of toolbars from the active workbench
         ListToolbars: list = workbench.listToolbars()
@@ -1415,7 +1516,7 @@ class ModernMenu(RibbonBar):
 
             # Create the panel, use the toolbar name as title
             title = StandardFunctions.TranslationsMapping(workbenchName, toolbar)
-            panel: RibbonPanel = self.currentCategory().addPanel(
+            panel: RibbonPanel = category.addPanel(
                 title=title,
                 showPanelOptionButton=True,
             )
@@ -1424,8 +1525,7 @@ class ModernMenu(RibbonBar):
             # get list of all buttons in toolbar
             allButtons: list = []
             try:
-                TB = mw.findChildren(QToolBar, toolbar)
-                allButtons = TB[0].findChildren(QToolButton)
+                allButtons = self.ReturnToolbarRegistry().ReturnButtons(toolbar)
                 # remove empty buttons
                 for i in range(len(allButtons)):
                     button: QToolButton = allButtons[i]
@@ -1613,7 +1713,7 @@ class ModernMenu(RibbonBar):
                             # get the action text
                             text = action.text()
                             try:
-                                text = StandardFunctions.CommandInfoCorrections(action.data())["ActionText"]
+                                text = CommandIndex.ActionText(action.data())
                             except Exception:
                                 pass
 
@@ -1635,17 +1735,15 @@ class ModernMenu(RibbonBar):
 
                                 # Check if the original menutext is different
                                 # if so use the alternative, otherwise use original
-                                for CommandName in Gui.listCommands():
-                                    Command = Gui.Command.get(CommandName)
-                                    MenuName = CommandInfoCorrections(CommandName)["menuText"].replace("&", "")
-                                    if CommandName == action.data():
-                                        if (
-                                            MenuName
-                                            != self.ribbonStructure["workbenches"][workbenchName]["toolbars"][toolbar][
-                                                "commands"
-                                            ][action.data()]["text"]
-                                        ):
-                                            text = textJSON
+                                if CommandIndex.IsCommand(action.data()):
+                                    MenuName = CommandIndex.MenuText(action.data()).replace("&", "")
+                                    if (
+                                        MenuName
+                                        != self.ribbonStructure["workbenches"][workbenchName]["toolbars"][toolbar][
+                                            "commands"
+                                        ][action.data()]["text"]
+                                    ):
+                                        text = textJSON
 
                                 # the text would be overwritten again when the state of the action changes
                                 # (e.g. when getting enabled / disabled), therefore the action itself
@@ -1671,7 +1769,12 @@ class ModernMenu(RibbonBar):
                                 ][CommandName]["icon"]
                             except Exception:
                                 pass
-                            actionIcon = self.ReturnCommandIcon(action.data(), pixmap)
+                            # The icon of a group command changes to the icon of the last used command.
+                            # Load it from the command, instead of from the icon registry
+                            if button.menu() is not None:
+                                actionIcon = StandardFunctions.returnQiCons_Commands(action.data(), pixmap)
+                            else:
+                                actionIcon = self.ReturnCommandIcon(action.data(), pixmap)
                             if actionIcon is not None:
                                 action.setIcon(actionIcon)
 
@@ -1688,22 +1791,12 @@ class ModernMenu(RibbonBar):
                             # If the icon is still none, try to retrieve it from the data file
                             if action.icon() is None or (action.icon() is not None and action.icon().isNull()):
                                 StandardFunctions.Print(f"An icon retrieved from data file for '{CommandName}'")
-                                DataFile = os.path.join(os.path.dirname(__file__), "RibbonDataFile.dat")
-
-                                if os.path.exists(DataFile) is True:
-                                    Data = {}
-                                    # read ribbon structure from JSON file
-                                    with open(DataFile, "r") as file:
-                                        Data.update(json.load(file))
-                                    file.close()
+                                if RibbonData.Exists() is True:
                                     try:
-                                        # Load the lists for the deserialized icons
-                                        for IconItem in Data["Command_Icons"]:
-                                            # This works only for FreeCAD Commands
-                                            CommandName_Icon = action.data()
-                                            if CommandName_Icon == IconItem[0]:
-                                                Icon: QIcon = Serialize_Ribbon.deserializeIcon(IconItem[1])
-                                                action.setIcon(Icon)
+                                        # Decode only the icon for this command. This works only for FreeCAD Commands
+                                        Icon = RibbonData.ReturnCommandIcon(action.data())
+                                        if Icon is not None:
+                                            action.setIcon(Icon)
                                     except Exception as e:
                                         if Parameters_Ribbon.DEBUG_MODE is True:
                                             StandardFunctions.Print(
@@ -1745,10 +1838,7 @@ class ModernMenu(RibbonBar):
                                     Parameters_Ribbon.ICON_SIZE_SMALL,
                                     Parameters_Ribbon.ICON_SIZE_SMALL,
                                 )
-                                Menu = QMenu(self)
-                                if button.menu() is not None:
-                                    Menu = button.menu()
-                                btn = CustomControls.CustomToolButton(
+                                btn = RibbonCommandButton(
                                     Text=action.text(),
                                     Action=action,
                                     Icon=action.icon(),
@@ -1759,7 +1849,7 @@ class ModernMenu(RibbonBar):
                                     setWordWrap=False,
                                     ElideMode=False,
                                     MaxNumberOfLines=2,
-                                    Menu=Menu,
+                                    Menu=button.menu(),
                                     MenuButtonSpace=16,
                                 )
                                 # add the button as large button
@@ -1783,10 +1873,7 @@ class ModernMenu(RibbonBar):
                                     Parameters_Ribbon.ICON_SIZE_MEDIUM,
                                     Parameters_Ribbon.ICON_SIZE_MEDIUM,
                                 )
-                                Menu = QMenu(self)
-                                if button.menu() is not None:
-                                    Menu = button.menu()
-                                btn = CustomControls.CustomToolButton(
+                                btn = RibbonCommandButton(
                                     Text=action.text(),
                                     Action=action,
                                     Icon=action.icon(),
@@ -1796,7 +1883,7 @@ class ModernMenu(RibbonBar):
                                     showText=showText,
                                     setWordWrap=Parameters_Ribbon.WRAPTEXT_MEDIUM,
                                     MaxNumberOfLines=2,
-                                    Menu=Menu,
+                                    Menu=button.menu(),
                                     MenuButtonSpace=16,
                                 )
                                 # add the button as large button
@@ -1819,10 +1906,7 @@ class ModernMenu(RibbonBar):
                                     Parameters_Ribbon.ICON_SIZE_LARGE,
                                     Parameters_Ribbon.ICON_SIZE_LARGE,
                                 )
-                                Menu = QMenu(self)
-                                if button.menu() is not None:
-                                    Menu = button.menu()
-                                btn: QToolButton = CustomControls.LargeCustomToolButton(
+                                btn = RibbonCommandButton(
                                     Text=action.text(),
                                     Action=action,
                                     Icon=action.icon(),
@@ -1832,8 +1916,9 @@ class ModernMenu(RibbonBar):
                                     showText=showText,
                                     setWordWrap=Parameters_Ribbon.WRAPTEXT_LARGE,
                                     MaxNumberOfLines=2,
-                                    Menu=Menu,
+                                    Menu=button.menu(),
                                     MenuButtonSpace=16,
+                                    Large=True,
                                 )
                                 # add the button as large button
                                 panel.addLargeWidget(
@@ -1847,16 +1932,6 @@ class ModernMenu(RibbonBar):
                                         print(f"{action.text()} is ignored. Its size was: {buttonSize}")
                                 pass
 
-                            # Set the background always to background color.
-                            # Styling is managed in the custom button class
-                            StyleSheet_Addition_Button = (
-                                "QToolButton, QToolButton:hover {background-color: "
-                                + StyleMapping.ReturnStyleItem("Background_Color")
-                                + ";border: none"
-                                + ";}"
-                            )
-                            btn.setStyleSheet(StyleSheet_Addition_Button)
-
                             # add the button text to the shadowList for checking if buttons are already there.
                             shadowList.append(button.text())
 
@@ -1950,10 +2025,12 @@ class ModernMenu(RibbonBar):
                     OptionButton.setToolButtonStyle(Qt.ToolButtonStyle.ToolButtonTextBesideIcon)
                     OptionButton.setText("more...")
 
+            # Give the application the chance to handle its events before the next panel
+            yield panel
+
         self.isWbLoaded[tabName] = True
 
         # Set the previous/next buttons
-        category = self.currentCategory()
         ScrollLeftButton_Category: RibbonCategoryLayoutButton = category.findChildren(RibbonCategoryLayoutButton)[0]
         ScrollRightButton_Category: RibbonCategoryLayoutButton = category.findChildren(RibbonCategoryLayoutButton)[1]
         ScrollLeftButton_Category.setMinimumWidth(self.iconSize * 0.5)
@@ -1973,26 +2050,140 @@ class ModernMenu(RibbonBar):
         # Set the heihgt of the buttons
         ScrollLeftButton_Category.setFixedHeight(Parameters_Ribbon.ICON_SIZE_SMALL * 3)
         ScrollRightButton_Category.setFixedHeight(Parameters_Ribbon.ICON_SIZE_SMALL * 3)
-        # Set the stylesheet
-        ScrollLeftButton_Category.setStyleSheet(StyleMapping.ReturnStyleSheet("toolbutton"))
-        ScrollRightButton_Category.setStyleSheet(StyleMapping.ReturnStyleSheet("toolbutton"))
+        # Set the properties for the stylesheet of the ribbon
+        SetRibbonPart(ScrollLeftButton_Category, "ToolButton")
+        SetRibbonPart(ScrollRightButton_Category, "ToolButton")
         # Connect the custom click event
         ScrollLeftButton_Category.mousePressEvent = lambda clickLeft: self.on_ScrollButton_Category_clicked(
-            clickLeft, ScrollLeftButton_Category
+            clickLeft, category, -1
         )
         ScrollRightButton_Category.mousePressEvent = lambda clickRight: self.on_ScrollButton_Category_clicked(
-            clickRight, ScrollRightButton_Category
+            clickRight, category, 1
         )
 
         # Set the maximum height to a high value to prevent from the ribbon to be clipped off
-        self.currentCategory().setMinimumHeight(self.RibbonHeight)
-        self.currentCategory().setMaximumHeight(self.RibbonHeight)
+        category.setMinimumHeight(self.RibbonHeight)
+        category.setMaximumHeight(self.RibbonHeight)
         self.setRibbonHeight(self.RibbonHeight)
         return
 
-    def on_ScrollButton_Category_clicked(self, event, ScrollButton: RibbonCategoryLayoutButton):
-        for i in range(Parameters_Ribbon.RIBBON_CLICKSPEED):
-            ScrollButton.click()
+    def ReturnNewPanelCommands(self, workbenchName: str) -> list:
+        """Returns the commands of the new panels of a workbench and of the global new panels."""
+        NewPanelCommands = []
+        for WorkBenchItem in [workbenchName, "Global"]:
+            if WorkBenchItem in self.ribbonStructure["newPanels"]:
+                for Panel, Commands in self.ribbonStructure["newPanels"][WorkBenchItem].items():
+                    NewPanelCommands.extend(Commands)
+        return NewPanelCommands
+
+    def UpdateRecentTabs(self, workbenchName: str):
+        """Puts the workbench in front of the recently used workbenches, which are stored in the settings."""
+        RecentTabs = Parameters_Ribbon.Settings.GetStringSetting("RecentTabs").split(",")
+        if len(RecentTabs) > 0 and RecentTabs[0] == workbenchName:
+            return
+        RecentTabs = [workbenchName] + [Name for Name in RecentTabs if Name != "" and Name != workbenchName]
+        Parameters_Ribbon.Settings.SetStringSetting("RecentTabs", ",".join(RecentTabs[: self.RecentTabsCount]))
+        return
+
+    def ReturnPrebuildCandidates(self) -> list:
+        """
+        Returns the indexes of the tabs that are likely to be opened next and are not built yet.
+        In order of priority: the tab under the mouse, the recently used tabs and the neighbours of the current tab.
+        Only tabs of loaded workbenches are returned, because loading a workbench cannot be done in slices.
+        """
+        TabBar = self.tabBar()
+        CurrentIndex = TabBar.currentIndex()
+        Indexes = [self.HoveredTab]
+        for workbenchName in Parameters_Ribbon.Settings.GetStringSetting("RecentTabs").split(","):
+            for i in range(TabBar.count()):
+                if TabBar.tabData(i) == workbenchName:
+                    Indexes.append(i)
+        Indexes.extend([CurrentIndex + 1, CurrentIndex - 1])
+
+        Candidates = []
+        for index in Indexes:
+            if index < 0 or index >= TabBar.count() or index in Candidates:
+                continue
+            workbenchName = TabBar.tabData(index)
+            if workbenchName is None or self.isWbLoaded.get(TabBar.tabText(index)) is not False:
+                continue
+            try:
+                workbench = Gui.getWorkbench(workbenchName)
+                if not hasattr(workbench, "__Workbench__"):
+                    continue
+                # Skip tabs with new panels that need other workbenches to be loaded first
+                if len(self.ReturnWorkbenchesForCommands(self.ReturnNewPanelCommands(workbenchName))) > 0:
+                    continue
+            except Exception:
+                continue
+            Candidates.append(index)
+        return Candidates
+
+    def SchedulePrebuild(self):
+        """Starts building the likely next tabs, in slices that run when there are no other events to handle."""
+        if self.PrebuildTimer is None:
+            self.PrebuildTimer = QTimer(self)
+            self.PrebuildTimer.setSingleShot(True)
+            self.PrebuildTimer.setInterval(0)
+            self.PrebuildTimer.timeout.connect(self.PrebuildSlice)
+        if self.PrebuildTimer.isActive() is False:
+            self.PrebuildTimer.start()
+        return
+
+    def PrebuildSlice(self):
+        """Builds panels of the likely next tabs, until the time of one slice is used."""
+        StartTime = time.perf_counter()
+        Candidates = self.ReturnPrebuildCandidates()
+        while len(Candidates) > 0:
+            index = Candidates[0]
+            tabName = self.tabBar().tabText(index)
+            Builder = self.PanelBuilders.get(tabName)
+            if Builder is None:
+                Builder = self.BuildPanelsStepwise(index)
+                self.PanelBuilders[tabName] = Builder
+            try:
+                next(Builder)
+            except StopIteration:
+                # The tab is finished
+                self.PanelBuilders.pop(tabName, None)
+                Candidates = self.ReturnPrebuildCandidates()
+            except Exception as e:
+                # Remove the partly built panels. The tab will be built when it is opened
+                self.PanelBuilders.pop(tabName, None)
+                self.ClearCategory(self.category(tabName))
+                self.isWbLoaded[tabName] = None
+                Candidates.remove(index)
+                if Parameters_Ribbon.DEBUG_MODE is True:
+                    StandardFunctions.Print(f"Failed to build the tab {tabName} in the background\n{e}", "Warning")
+
+            if time.perf_counter() - StartTime > self.PrebuildSliceTime:
+                break
+
+        # Continue in the next slice, after the events that are waiting are handled
+        if len(Candidates) > 0:
+            self.PrebuildTimer.start()
+        return
+
+    def ClearCategory(self, category):
+        """Removes all panels and separators from a category."""
+        Layout = category._categoryLayout
+        while Layout.count() > 0:
+            Widget = Layout.takeAt(0).widget()
+            if Widget is not None:
+                Widget.deleteLater()
+        category.panels().clear()
+        return
+
+    def on_ScrollButton_Tab_clicked(self, event, Direction: int):
+        # Scroll the same distance as TABBAR_CLICKSPEED clicks, in one animation
+        Distance = Direction * Parameters_Ribbon.TABBAR_CLICKSPEED * self.ScrollStep
+        self.ReturnTabBarScrollController().ScrollBy(Distance)
+        return
+
+    def on_ScrollButton_Category_clicked(self, event, category: RibbonCategory, Direction: int):
+        # Scroll the same distance as RIBBON_CLICKSPEED clicks, in one animation
+        Distance = Direction * Parameters_Ribbon.RIBBON_CLICKSPEED * self.ScrollStep
+        self.ReturnScrollController(category).ScrollBy(Distance)
         return
 
     def updateCurrentTab(self):
@@ -2007,25 +2198,48 @@ class ModernMenu(RibbonBar):
         return
 
     def hideClassicToolbars(self):
-        for toolbar in mw.findChildren(QToolBar):
-            parentWidget = toolbar.parentWidget()
-            toolbar.setHidden(True)
-            # hide toolbars that are not in the statusBar and show toolbars that are in the statusbar.
-            if parentWidget.objectName() == "statusBar" or parentWidget.objectName() == "StatusBarArea":
+        # The first time, show the status area
+        if self.ClassicToolbars is None:
+            for Widget in mw.findChildren(QWidget, "StatusBarArea"):
+                Widget.show()
+        Toolbars = self.ReturnToolbarRegistry()
+
+        # Only handle the new toolbars and the toolbars that are shown, hidden or moved since the last time.
+        # (FreeCAD shows the toolbars of a workbench again when it is activated)
+        # Only change the toolbars that are not in the right state, so no show and hide events are sent for the rest
+        for toolbar in Toolbars.ReturnChangedToolbars():
+            Visible = self.ReturnClassicToolbarVisible(toolbar)
+            if Visible is True:
                 toolbar.setEnabled(True)
-                toolbar.setVisible(True)
-            # # # Show specific toolbars and go to the next
-            if toolbar.objectName() != "" and toolbar.objectName() in [
-                self.quickAccessToolBar().objectName(),
-                self.rightToolBar().objectName(),
-            ]:
-                toolbar.setEnabled(True)
-                toolbar.setVisible(True)
-        StatusArea = mw.findChildren(QWidget, "StatusBarArea")
-        for Widget in StatusArea:
-            Widget.show()
+            if toolbar.isHidden() is Visible:
+                toolbar.setVisible(Visible)
+        # The show and hide events of the loop above are handled too
+        Toolbars.ClearChangedToolbars()
         return
 
+    def ReturnToolbarRegistry(self) -> ToolbarRegistry:
+        """Returns the registry of the classic toolbars, with the new toolbars added. Created on first use."""
+        if self.ClassicToolbars is None:
+            self.ClassicToolbars = ToolbarRegistry(mw, self)
+        self.ClassicToolbars.Update()
+        return self.ClassicToolbars
+
+    def ReturnClassicToolbarVisible(self, toolbar: QToolBar) -> bool:
+        """Returns True for the toolbars that stay visible: the toolbars in the statusbar and of the ribbon."""
+        parentWidget = toolbar.parentWidget()
+        # hide toolbars that are not in the statusBar and show toolbars that are in the statusbar.
+        if parentWidget is not None and (
+            parentWidget.objectName() == "statusBar" or parentWidget.objectName() == "StatusBarArea"
+        ):
+            return True
+        # Show specific toolbars
+        if toolbar.objectName() != "" and toolbar.objectName() in [
+            self.quickAccessToolBar().objectName(),
+            self.rightToolBar().objectName(),
+        ]:
+            return True
+        return False
+
     def List_ReturnCustomToolbars(self):
         Toolbars = []
 
@@ -2059,39 +2273,36 @@ class ModernMenu(RibbonBar):
 
     def List_AddCustomToolBarToWorkbench(self, WorkBenchName, CustomToolbar):
         ButtonList = []
+        # The texts of the buttons in ButtonList
+        ButtonTexts = set()
 
         try:
             # Get the commands from the custom panel
             Commands = self.ribbonStructure["customToolbars"][WorkBenchName][CustomToolbar]["commands"]
+            Toolbars = self.ReturnToolbarRegistry()
 
             # Get the command and its original toolbar
             for key, value in list(Commands.items()):
-                # get the menu text from the command list
-                for CommandName in Gui.listCommands():
-                    # Get the english menutext
-                    MenuName = CommandInfoCorrections(CommandName)["menuText"]
+                # get the commands with this (english) menu text from the command index
+                for CommandName in CommandIndex.ReturnCommandNames(key):
                     # Get the translated menutext
-                    MenuNameTtranslated = CommandInfoCorrections(CommandName)["ActionText"]
+                    MenuNameTtranslated = CommandIndex.ActionText(CommandName)
 
-                    if MenuName == key:
-                        try:
-                            # Get the original toolbar as QToolbar
-                            OriginalToolBar = mw.findChild(QToolBar, value)
-                            # Go through all it's QtoolButtons
-                            for Child in OriginalToolBar.findChildren(QToolButton):
-                                # If the text of the QToolButton matches the menu text
-                                # Add it to the button list.
-                                IsInList = False
-                                for Toolbutton in ButtonList:
-                                    if Toolbutton.text() == Child.text():
-                                        IsInList = True
-
-                                if Child.text() == MenuNameTtranslated and IsInList is False:
-                                    ButtonList.append(Child)
-                        except Exception as e:
-                            if Parameters_Ribbon.DEBUG_MODE is True:
-                                StandardFunctions.Print(f"{e.with_traceback(e.__traceback__)}, 3", "Warning")
-                            continue
+                    try:
+                        # Get the first QToolButton of the original toolbar with the menu text
+                        # and add it to the button list. Check the text, in case it changed since the lookup
+                        Child = Toolbars.ReturnButtonTexts(value).get(MenuNameTtranslated)
+                        if (
+                            Child is not None
+                            and Child.text() == MenuNameTtranslated
+                            and MenuNameTtranslated not in ButtonTexts
+                        ):
+                            ButtonList.append(Child)
+                            ButtonTexts.add(MenuNameTtranslated)
+                    except Exception as e:
+                        if Parameters_Ribbon.DEBUG_MODE is True:
+                            StandardFunctions.Print(f"{e.with_traceback(e.__traceback__)}, 3", "Warning")
+                        continue
         except Exception:
             pass
 
@@ -2140,9 +2351,7 @@ class ModernMenu(RibbonBar):
                                         len(NewToolbutton.menu().actions())
 
                                     # Set the text for the toolbutton
-                                    NewToolbutton.setText(
-                                        CommandInfoCorrections(CommandName)["menuText"].replace("&", "")
-                                    )
+                                    NewToolbutton.setText(CommandIndex.MenuText(CommandName).replace("&", ""))
                                     # add it to the list
                                     ButtonList.append(NewToolbutton)
 
@@ -2224,12 +2433,12 @@ class ModernMenu(RibbonBar):
             QIcon: the command icon.
         """
 
-        icon = QIcon()
-        for item in self.List_CommandIcons:
-            if item[0] == CommandName:
-                icon = item[1]
-        if icon is None or (icon is not None and icon.isNull()):
-            icon = StandardFunctions.returnQiCons_Commands(CommandName, pixmap)
+        # An icon from another pixmap is not the icon of the command. Don't store it in the registry
+        if pixmap != "":
+            return StandardFunctions.returnQiCons_Commands(CommandName, pixmap)
+
+        # Get the icon from the shared registry. If it is not there, get it from FreeCAD
+        icon = CommandIcons.ReturnIcon(CommandName, Loader=StandardFunctions.returnQiCons_Commands)
         return icon
 
     def ReturnWorkbenchIcon(self, WorkBenchName: str, pixmap: str = "") -> QIcon:
@@ -2242,19 +2451,16 @@ class ModernMenu(RibbonBar):
         Returns:
             QIcon: the command icon.
         """
-        icon = QIcon()
-        for item in self.List_WorkBenchIcons:
-            if item[0] == WorkBenchName:
-                icon = item[1]
-                return icon
-        if icon is None or (icon is not None and icon.isNull()):
+
+        def LoadIcon(WorkBenchName: str):
             workbench = Gui.getWorkbench(WorkBenchName)
             icon = QIcon(workbench.Icon)
-            return icon
-        if icon is None or (icon is not None and icon.isNull()):
-            if pixmap != "":
+            if icon.isNull() and pixmap != "":
                 icon = Gui.getIcon(pixmap)
-                return icon
+            return icon
+
+        # Get the icon from the shared registry. If it is not there, get it from the workbench
+        icon = WorkbenchIcons.ReturnIcon(WorkBenchName, Loader=LoadIcon, Default=QIcon())
         return icon
 
     def CustomOverlay(self):
@@ -2356,6 +2562,58 @@ class ModernMenu(RibbonBar):
 
         return self.TransparancyToggled
 
+    def ReturnWorkbenchesForCommands(self, CommandItems: list) -> list:
+        """
+        Returns the workbenches that must be activated for a list of commands from a new panel or dropdown button.
+
+        Args:
+            CommandItems (list): [Command name, Workbench name] for each command. For dropdown buttons, the
+            workbenches of their commands are returned.
+
+        Returns:
+            list: The workbench names without duplicates, excluding the workbenches that are already activated.
+        """
+        WorkBenchNames = []
+        for CommandItem in CommandItems:
+            Items = [CommandItem]
+            if CommandItem[0].endswith("_ddb"):
+                Items = self.ribbonStructure.get("dropdownButtons", {}).get(CommandItem[0], [])
+            for Item in Items:
+                WorkBenchName = Item[1]
+                if WorkBenchName == "" or WorkBenchName == "General" or WorkBenchName == "Global":
+                    continue
+                if WorkBenchName not in WorkBenchNames and WorkBenchName not in self.ActivatedWorkbenches:
+                    WorkBenchNames.append(WorkBenchName)
+        return WorkBenchNames
+
+    def ActivateWorkbenches(self, WorkBenchNames: list):
+        """
+        Activates the workbenches in one batch, so their commands are available.
+        The signals and updates of the main window are suspended. Afterwards, the active workbench is restored.
+        """
+        if len(WorkBenchNames) == 0:
+            return
+
+        ActiveWorkbench = Gui.activeWorkbench().name()
+        self.disconnectSignals()
+        mw.setUpdatesEnabled(False)
+        try:
+            for WorkBenchName in WorkBenchNames:
+                try:
+                    Gui.activateWorkbench(WorkBenchName)
+                except Exception as e:
+                    if Parameters_Ribbon.DEBUG_MODE is True:
+                        StandardFunctions.Print(f"Failed to activate {WorkBenchName}\n{e}", "Warning")
+                self.ActivatedWorkbenches.append(WorkBenchName)
+            Gui.activateWorkbench(ActiveWorkbench)
+        finally:
+            mw.setUpdatesEnabled(True)
+            self.connectSignals()
+
+        # Activating workbenches shows their toolbars. Hide them again
+        self.hideClassicToolbars()
+        return
+
     def returnCustomDropDown(self, CommandName):
         actionList = []
 
@@ -2436,7 +2694,10 @@ class run:
             if disable:
                 return
 
-            ribbon = ModernMenu()
+            # Measure the startup phases, if enabled in the preferences
+            StartupProfiler.Start()
+            with StartupProfiler.Phase("ModernMenu"):
+                ribbon = ModernMenu()
             # Get the layout
             layout = ribbon.layout()
             # Set spacing and content margins to zero
@@ -2460,6 +2721,9 @@ class run:
             # Add the dockwidget to the main window
             mw.addDockWidget(Qt.DockWidgetArea.TopDockWidgetArea, ribbonDock)
 
+            # Report the startup phases when the event loop is running again
+            QTimer.singleShot(0, lambda: StartupProfiler.Stop(Parameters_Ribbon.PROFILE_LOCATION))
+
 
 # def UpdateRibbonStructureFile(RibbonStructureDict: dict = None, silent=True):
 #     """Function for add-on developers to update the RibbonStructureFile with their specific settings.
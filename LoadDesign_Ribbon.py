@@ -37,14 +37,17 @@ from PySide.QtWidgets import (
     QLineEdit,
     QSizePolicy,
     QRadioButton,
+    QProgressDialog,
+    QApplication,
 )
 from PySide.QtCore import Qt, SIGNAL, Signal, QObject, QThread, QSize
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 import sys
 import json
 from datetime import datetime
 import shutil
 import Standard_Functions_RIbbon as StandardFunctions
-from Standard_Functions_RIbbon import CommandInfoCorrections
+from Cache_Ribbon import CommandIndex, CommandIcons, WorkbenchIcons, RibbonData
 import Parameters_Ribbon
 import Serialize_Ribbon
 import webbrowser
@@ -102,10 +105,6 @@ class LoadDialog(Design_ui.Ui_Form):
 
     List_IgnoredToolbars_internal = []
 
-    # Create the lists for the deserialized icons
-    List_CommandIcons = []
-    List_WorkBenchIcons = []
-
     # Create a tomporary list for newly added dropdown buttons
     newDDBList = []
 
@@ -251,43 +250,36 @@ class LoadDialog(Design_ui.Ui_Form):
             if Answer == "yes":
                 self.on_ReloadWB_clicked()
 
-        # Load the lists for the deserialized icons
-        try:
-            for IconItem in Data["WorkBench_Icons"]:
-                Icon: QIcon = Serialize_Ribbon.deserializeIcon(IconItem[1])
-                item = [IconItem[0], Icon]
-                self.List_WorkBenchIcons.append(item)
-            # Load the lists for the deserialized icons
-            for IconItem in Data["Command_Icons"]:
-                Icon: QIcon = Serialize_Ribbon.deserializeIcon(IconItem[1])
-                item = [IconItem[0], Icon]
-                self.List_CommandIcons.append(item)
-        except Exception as e:
-            StandardFunctions.Print(f"{e.with_traceback(e.__traceback__)}", "Warning")
-            pass
-
         # check if the list with workbenches is up-to-date
+        # Workbenches that are installed or updated after the last data update are scanned again.
         missingWB = []
+        changedWB = []
+        KnownWorkbenches = [WorkBenchItem[0] for WorkBenchItem in self.List_Workbenches]
+        StoredFingerprints = Data.get("WorkBench_Fingerprints", {})
+        Fingerprints = StandardFunctions.ReturnWorkbenchFingerprints()
         for WorkBenchName in Gui.listWorkbenches():
-            for j in range(len(self.List_Workbenches)):
-                if WorkBenchName == self.List_Workbenches[j][0] or WorkBenchName == "NoneWorkbench":
-                    break
-                if j == len(self.List_Workbenches) - 1:
-                    missingWB.append(WorkBenchName)
-        if len(missingWB) > 0:
+            if WorkBenchName == "NoneWorkbench":
+                continue
+            if WorkBenchName not in KnownWorkbenches:
+                missingWB.append(WorkBenchName)
+            elif WorkBenchName in StoredFingerprints and StoredFingerprints[WorkBenchName] != Fingerprints.get(
+                WorkBenchName
+            ):
+                changedWB.append(WorkBenchName)
+        if len(missingWB) > 0 or len(changedWB) > 0:
             ListWB = "  "
-            for WB in missingWB:
+            for WB in missingWB + changedWB:
                 ListWB = ListWB + WB + "\n" + "  "
             Question = translate(
                 "FreeCAD Ribbon",
-                "The following workbenches were installed after the last data update: \n"
+                "The following workbenches were installed or updated after the last data update: \n"
                 "{}\n\n"
-                "Do you want to update the data?\n"
-                "This can take a while!",
+                "Do you want to update the data for these workbenches?",
             ).format(ListWB)
             Answer = StandardFunctions.Mbox(Question, "FreeCAD Ribbon", 1, "Question")
             if Answer == "yes":
-                self.on_ReloadWB_clicked()
+                if self.UpdateWorkbenches(missingWB + changedWB, Data.get("Language", "")) is False:
+                    StandardFunctions.Print(translate("FreeCAD Ribbon", "Updating the data is cancelled."), "Warning")
 
         # Add dropdownbuttons to the list of commands
         try:
@@ -297,7 +289,7 @@ class LoadDialog(Design_ui.Ui_Form):
                     IconName = ""
                     for CommandItem in self.List_Commands:
                         if CommandItem[0] == CommandName:
-                            IconName = StandardFunctions.CommandInfoCorrections(CommandItem[1])["pixmap"]
+                            IconName = CommandIndex.ReturnCommandInfo(CommandItem[1])["pixmap"]
                     self.List_Commands.append(
                         [
                             DropDownCommand,
@@ -324,12 +316,12 @@ class LoadDialog(Design_ui.Ui_Form):
                 for NewPanel in self.Dict_NewPanels["newPanels"][NewPanelWorkBench]:
                     for NewPanelCommand in self.Dict_NewPanels["newPanels"][NewPanelWorkBench][NewPanel]:
                         # get the icon for this command
-                        if CommandInfoCorrections(NewPanelCommand[0])["pixmap"] != "":
-                            IconName = CommandInfoCorrections(NewPanelCommand[0])["pixmap"]
+                        if CommandIndex.ReturnCommandInfo(NewPanelCommand[0])["pixmap"] != "":
+                            IconName = CommandIndex.ReturnCommandInfo(NewPanelCommand[0])["pixmap"]
                         else:
                             IconName = ""
-                        MenuName = CommandInfoCorrections(NewPanelCommand[0])["menuText"].replace("&", "")
-                        MenuNameTranslated = CommandInfoCorrections(NewPanelCommand[0])["ActionText"].replace("&", "")
+                        MenuName = CommandIndex.ReturnCommandInfo(NewPanelCommand[0])["menuText"].replace("&", "")
+                        MenuNameTranslated = CommandIndex.ActionText(NewPanelCommand[0]).replace("&", "")
                         self.List_Commands.append(
                             [
                                 NewPanelCommand[0],
@@ -765,202 +757,235 @@ class LoadDialog(Design_ui.Ui_Form):
         FreeCAD_preferences = App.ParamGet("User parameter:BaseApp/Preferences/General")
         FCLanguage = FreeCAD_preferences.GetString("Language")
 
-        # --- Workbenches ----------------------------------------------------------------------------------------------
+        # Store the current active workbench
+        ActiveWB = Gui.activeWorkbench().name()
+        # Make sure that the command info is retrieved again.
+        CommandIndex.Invalidate()
+
+        # --- Workbenches, toolbars and commands -----------------------------------------------------------------------
         #
-        # Create a list of all workbenches with their icon
-        self.List_Workbenches.clear()
+        # Activate each workbench once and collect its data. Keep the time per workbench
+        Timings = []
         List_Workbenches = Gui.listWorkbenches().copy()
         for WorkBenchName in List_Workbenches:
-            if str(WorkBenchName) != "" or WorkBenchName is not None:
-                if str(WorkBenchName) != "NoneWorkbench":
-                    Gui.activateWorkbench(WorkBenchName)
-                    WorkBench = Gui.getWorkbench(WorkBenchName)
-                    # Get the toolbar items
-                    ToolbarItems: dict = WorkBench.getToolbarItems()
-                    # Update the toolbar items with corrections
-                    ToolbarItems: dict = StandardFunctions.CorrectGetToolbarItems(ToolbarItems)
-
-                    IconName = ""
-                    IconName = str(Gui.getWorkbench(WorkBenchName).Icon)
-                    WorkbenchTitle = Gui.getWorkbench(WorkBenchName).MenuText
-                    WorkbenchTitleTranslated = StandardFunctions.TranslationsMapping(WorkBenchName, WorkbenchTitle)
-                    self.List_Workbenches.append(
-                        [
-                            str(WorkBenchName),
-                            IconName,
-                            WorkbenchTitle,
-                            ToolbarItems,
-                            WorkbenchTitleTranslated,
-                        ]
-                    )
-
-        # --- Toolbars ----------------------------------------------------------------------------------------------
+            if str(WorkBenchName) == "" or str(WorkBenchName) == "NoneWorkbench":
+                continue
+            StartTime = time.perf_counter()
+            try:
+                WorkbenchItem, Toolbars, Commands = self.ScanWorkbench(WorkBenchName)
+            except Exception as e:
+                StandardFunctions.Print(f"Failed to load {WorkBenchName}\n{e}", "Warning")
+                continue
+            Timings.append([WorkBenchName, time.perf_counter() - StartTime])
+            self.List_Workbenches.append(WorkbenchItem)
+            self.StringList_Toolbars.extend(Toolbars)
+            self.List_Commands.extend(Commands)
+
+        # Report the time per workbench, the slowest first
+        Timings.sort(key=lambda x: x[1], reverse=True)
+        Report = translate("FreeCAD Ribbon", "Time to load the data per workbench (s):")
+        for WorkBenchName, Seconds in Timings:
+            Report = Report + f"\n    {WorkBenchName}: {Seconds:.3f}"
+        StandardFunctions.Print(Report)
+
+        # --- Custom toolbars ------------------------------------------------------------------------------------------
         #
-        # Store the current active workbench
-        ActiveWB = Gui.activeWorkbench().name()
-        # Go through the list of workbenches
-        i = 0
-        for WorkBench in self.List_Workbenches:
-            wbToolbars = []
-            if WorkBench[0] != "General" and WorkBench[0] != "" and WorkBench[0] is not None:
-                Gui.activateWorkbench(WorkBench[0])
-                wbToolbars = Gui.getWorkbench(WorkBench[0]).listToolbars()
-                # Go through the toolbars
-                for Toolbar in wbToolbars:
-                    ToolBarTtranslated = StandardFunctions.TranslationsMapping(WorkBench[0], Toolbar)
-                    self.StringList_Toolbars.append([Toolbar, WorkBench[2], WorkBench[0], ToolBarTtranslated])
-
         # Add the custom toolbars
         CustomToolbars = self.List_ReturnCustomToolbars()
         for Customtoolbar in CustomToolbars:
             self.StringList_Toolbars.append(Customtoolbar)
+            # add also custom commands
+            WorkbenchTitle = Customtoolbar[1]
+            for WorkBench in self.List_Workbenches:
+                if WorkbenchTitle == WorkBench[2]:
+                    for CustomCommand in Customtoolbar[2]:
+                        self.List_Commands.append(self.ReturnCommandItem(CustomCommand, WorkBench[0]))
         CustomToolbars = self.List_ReturnCustomToolbars_Global()
         for Customtoolbar in CustomToolbars:
             self.StringList_Toolbars.append(Customtoolbar)
+            for CustomCommand in Customtoolbar[2]:
+                self.List_Commands.append(self.ReturnCommandItem(CustomCommand, Customtoolbar[1], EmptyIconName=None))
 
-        # --- Commands ----------------------------------------------------------------------------------------------
-        #
-        # Create a list of all commands with their icon
-        self.List_Commands.clear()
-        # Create a list of command names
-        CommandNames = []
-        for i in range(len(self.List_Workbenches)):
-            Gui.activateWorkbench(self.List_Workbenches[i][0])
-            WorkBench = Gui.getWorkbench(self.List_Workbenches[i][0])
-            # Get the toolbar items
-            ToolbarItems: dict = WorkBench.getToolbarItems()
-            # Update the toolbar items with corrections
-            ToolbarItems: dict = StandardFunctions.CorrectGetToolbarItems(ToolbarItems)
-
-            for key, value in list(ToolbarItems.items()):
-                for j in range(len(value)):
-                    Item = [value[j], self.List_Workbenches[i][0]]
-                    CommandNames.append(Item)
-
-        # Go through the list
-        for CommandName in CommandNames:
-            # get the command with this name
-            command = Gui.Command.get(CommandName[0])
-            WorkBenchName = CommandName[1]
-            if command is not None:
-                # get the icon for this command
-                if CommandInfoCorrections(CommandName[0])["pixmap"] != "":
-                    IconName = CommandInfoCorrections(CommandName[0])["pixmap"]
-                else:
-                    IconName = ""
-                MenuName = CommandInfoCorrections(CommandName[0])["menuText"].replace("&", "")
-                MenuNameTranslated = CommandInfoCorrections(CommandName[0])["ActionText"].replace("&", "")
-                self.List_Commands.append(
-                    [
-                        CommandName[0],
-                        IconName,
-                        MenuName,
-                        WorkBenchName,
-                        MenuNameTranslated,
-                    ]
-                )
-        # add also custom commands
-        Toolbars = self.List_ReturnCustomToolbars()
-        for Toolbar in Toolbars:
-            WorkbenchTitle = Toolbar[1]
-            for WorkBench in self.List_Workbenches:
-                if WorkbenchTitle == WorkBench[2]:
-                    WorkBenchName = WorkBench[0]
-                    for CustomCommand in Toolbar[2]:
-                        command = Gui.Command.get(CustomCommand)
-                        if CommandInfoCorrections(CustomCommand)["pixmap"] != "":
-                            IconName = CommandInfoCorrections(CustomCommand)["pixmap"]
-                        else:
-                            IconName = ""
-                        MenuName = CommandInfoCorrections(CustomCommand)["menuText"].replace("&", "")
-                        MenuNameTranslated = CommandInfoCorrections(CustomCommand)["ActionText"].replace("&", "")
-                        self.List_Commands.append(
-                            [
-                                CustomCommand,
-                                IconName,
-                                MenuName,
-                                WorkBenchName,
-                                MenuNameTranslated,
-                            ]
-                        )
-        Toolbars = self.List_ReturnCustomToolbars_Global()
-        for Toolbar in Toolbars:
-            for CustomCommand in Toolbar[2]:
-                command = Gui.Command.get(CustomCommand)
-                if CommandInfoCorrections(CustomCommand)["pixmap"] != "":
-                    IconName = CommandInfoCorrections(CustomCommand)["pixmap"]
-                else:
-                    IconName = None
-                MenuName = CommandInfoCorrections(CustomCommand)["menuText"].replace("&", "")
-                MenuNameTranslated = CommandInfoCorrections(CustomCommand)["ActionText"].replace("&", "")
-                self.List_Commands.append([CustomCommand, IconName, MenuName, Toolbar[1], MenuNameTranslated])
         # Add general commands
         if int(App.Version()[0]) > 0:
-            command = Gui.Command.get("Std_Measure")
-            if CommandInfoCorrections("Std_Measure")["pixmap"] != "":
-                IconName = CommandInfoCorrections("Std_Measure")["pixmap"]
-            else:
-                IconName = ""
-            MenuName = CommandInfoCorrections("Std_Measure")["menuText"].replace("&", "")
-            MenuNameTranslated = CommandInfoCorrections("Std_Measure")["ActionText"].replace("&", "")
-            self.List_Commands.append(["Std_Measure", IconName, MenuName, "General", MenuNameTranslated])
+            self.List_Commands.append(self.ReturnCommandItem("Std_Measure", "General"))
 
         # re-activate the workbench that was stored.
         Gui.activateWorkbench(ActiveWB)
 
         # --- Serialize Icons ------------------------------------------------------------------------------------------
         #
-        WorkbenchIcon = []
-        for WorkBenchItem in self.List_Workbenches:
+        # Encode the icons. If the user cancelled, restore the previous data
+        NewIconPack = Serialize_Ribbon.IconPackWriter()
+        if self.EncodeIcons(self.CollectIcons(), NewIconPack) is False:
+            StandardFunctions.Print(translate("FreeCAD Ribbon", "Reloading the data is cancelled."), "Warning")
+            self.__init__()
+            self.form.show()
+            return
+
+        # Write the icon pack and the lists to the data files
+        self.WriteDataFiles(FCLanguage, NewIconPack)
+
+        # run init again
+        self.__init__()
+
+        # Set the first tab active
+        self.form.tabWidget.setCurrentIndex(0)
+
+        # Show the dialog again
+        self.form.show()
+        return
+
+    def UpdateWorkbenches(self, WorkBenchNames: list, Language: str) -> bool:
+        """
+        Scans only the given (new or changed) workbenches and merges their data into the data files.
+
+        Args:
+            WorkBenchNames (list): Names of the workbenches to scan.
+            Language (str): The language of the data file.
+
+        Returns:
+            bool: False if the user cancelled. The lists are not changed then.
+        """
+        # Store the current active workbench
+        ActiveWB = Gui.activeWorkbench().name()
+
+        # Update copies of the lists. They replace the lists when the icons are encoded.
+        List_Workbenches = list(self.List_Workbenches)
+        StringList_Toolbars = list(self.StringList_Toolbars)
+        List_Commands = list(self.List_Commands)
+
+        # Remove the old data of these workbenches
+        for WorkBenchItem in list(List_Workbenches):
+            if WorkBenchItem[0] in WorkBenchNames:
+                OldCommands = []
+                for key, value in WorkBenchItem[3].items():
+                    OldCommands.extend(value)
+                List_Commands = [
+                    CommandItem
+                    for CommandItem in List_Commands
+                    if not (CommandItem[3] == WorkBenchItem[0] and CommandItem[0] in OldCommands)
+                ]
+                List_Workbenches.remove(WorkBenchItem)
+        StringList_Toolbars = [
+            ToolbarItem
+            for ToolbarItem in StringList_Toolbars
+            if not (len(ToolbarItem) > 3 and ToolbarItem[2] in WorkBenchNames)
+        ]
+
+        # Scan the workbenches
+        for WorkBenchName in WorkBenchNames:
+            StartTime = time.perf_counter()
+            try:
+                WorkbenchItem, Toolbars, Commands = self.ScanWorkbench(WorkBenchName)
+            except Exception as e:
+                StandardFunctions.Print(f"Failed to load {WorkBenchName}\n{e}", "Warning")
+                continue
+            List_Workbenches.append(WorkbenchItem)
+            StringList_Toolbars.extend(Toolbars)
+            List_Commands.extend(Commands)
+            StandardFunctions.Print(
+                translate("FreeCAD Ribbon", "Data updated for {} in {:.3f} s").format(
+                    WorkBenchName, time.perf_counter() - StartTime
+                )
+            )
+
+        # re-activate the workbench that was stored.
+        Gui.activateWorkbench(ActiveWB)
+
+        # Encode the icons of the scanned workbenches
+        NewIconPack = Serialize_Ribbon.IconPackWriter()
+        IconList = self.CollectIcons(WorkBenchNames, List_Workbenches, List_Commands)
+        if self.EncodeIcons(IconList, NewIconPack) is False:
+            return False
+        # Copy the other icons from the current icon pack.
+        # Icons of workbenches and commands that are no longer in the lists are left out
+        RibbonData.ReturnData()
+        IconPack = RibbonData.ReturnPack()
+        if IconPack is not None:
+            UpdatedIcons = {"workbenches": set(), "commands": set()}
+            for IconItem in IconList:
+                UpdatedIcons[IconItem[0]].add(IconItem[1])
+            UsedNames = {
+                "workbenches": {WorkBenchItem[0] for WorkBenchItem in List_Workbenches},
+                "commands": {CommandItem[0] for CommandItem in List_Commands},
+            }
+            for Section, Names in UpdatedIcons.items():
+                for Name in IconPack.names(Section):
+                    if Name not in Names and Name in UsedNames[Section]:
+                        NewIconPack.addEncodedIcon(Section, Name, IconPack.encodedIcon(Section, Name))
+
+        # Use the updated lists
+        self.List_Workbenches[:] = List_Workbenches
+        self.StringList_Toolbars[:] = StringList_Toolbars
+        self.List_Commands[:] = List_Commands
+
+        # Write the icon pack and the lists to the data files
+        self.WriteDataFiles(Language, NewIconPack)
+        return True
+
+    def CollectIcons(
+        self, WorkBenchNames: list = None, List_Workbenches: list = None, List_Commands: list = None
+    ) -> list:
+        """
+        Returns [section, name, QIcon] for the workbenches and commands in the lists.
+        If WorkBenchNames is given, only the icons of these workbenches and their commands are returned.
+        If the lists are not given, the lists of the dialog are used.
+        """
+        if List_Workbenches is None:
+            List_Workbenches = self.List_Workbenches
+        if List_Commands is None:
+            List_Commands = self.List_Commands
+
+        IconList = []
+        for WorkBenchItem in List_Workbenches:
             WorkBenchName = WorkBenchItem[0]
+            if WorkBenchNames is not None and WorkBenchName not in WorkBenchNames:
+                continue
             Icon = Gui.getIcon(WorkBenchItem[1])
             if Icon is not None and Icon.isNull() is False:
-                try:
-                    SerializedIcon = Serialize_Ribbon.serializeIcon(Icon)
-
-                    WorkbenchIcon.append([WorkBenchName, SerializedIcon])
-                    # add the icons also to the deserialized list
-                    self.List_WorkBenchIcons.append([WorkBenchName, Icon])
-                except Exception as e:
-                    if Parameters_Ribbon.DEBUG_MODE is True:
-                        StandardFunctions.Print(f"{e.with_traceback(e.__traceback__)}", "Warning")
+                IconList.append(["workbenches", WorkBenchName, Icon])
+                # add the icons also to the icon registry
+                WorkbenchIcons.Register(WorkBenchName, Icon)
 
-        CommandIcons = []
-        for CommandItem in self.List_Commands:
+        for CommandItem in List_Commands:
             CommandName = CommandItem[0]
+            if WorkBenchNames is not None and CommandItem[3] not in WorkBenchNames:
+                continue
             Icon = StandardFunctions.returnQiCons_Commands(CommandName, CommandItem[1])
             if Icon is not None and Icon.isNull() is False:
-                try:
-                    SerializedIcon = Serialize_Ribbon.serializeIcon(Icon)
+                IconList.append(["commands", CommandName, Icon])
+                # add the icons also to the icon registry
+                CommandIcons.Register(CommandName, Icon)
+        return IconList
 
-                    CommandIcons.append([CommandName, SerializedIcon])
-                    # add the icons also to the deserialized list
-                    self.List_CommandIcons.append([CommandName, Icon])
-                except Exception as e:
-                    if Parameters_Ribbon.DEBUG_MODE is True:
-                        StandardFunctions.Print(f"{e.with_traceback(e.__traceback__)}", "Warning")
+    def WriteDataFiles(self, Language: str, IconPack):
+        """Writes the icon pack and the lists of workbenches, toolbars and commands to the data files."""
+        # Close the current icon pack and write the new one
+        RibbonData.Invalidate()
+        IconPack.write(RibbonData.PackFileName)
 
         # Write the lists to a data file
         #
-        # clear the data file. If not exists, create it
-        DataFile = os.path.join(os.path.dirname(__file__), "RibbonDataFile.dat")
-        open(DataFile, "w").close()
-
-        # Open de data file, load it as json and then close it again
         Data = {}
         # Update the data
         Data["dataVersion"] = self.DataFileVersion
-        Data["Language"] = FCLanguage
+        Data["Language"] = Language
         Data["List_Workbenches"] = self.List_Workbenches
         Data["StringList_Toolbars"] = self.StringList_Toolbars
         Data["List_Commands"] = self.List_Commands
-        Data["WorkBench_Icons"] = WorkbenchIcon
-        Data["Command_Icons"] = CommandIcons
+        # The icons are stored in the icon pack
+        Data["WorkBench_Icons"] = []
+        Data["Command_Icons"] = []
+        # Store the fingerprints to detect changed workbenches
+        Data["WorkBench_Fingerprints"] = StandardFunctions.ReturnWorkbenchFingerprints()
         # Write to the data file
         DataFile = os.path.join(os.path.dirname(__file__), "RibbonDataFile.dat")
         with open(DataFile, "w") as outfile:
             json.dump(Data, outfile, indent=4)
         outfile.close()
+        # Make sure that the ribbon reads the new data file
+        RibbonData.Invalidate()
 
         # Write a second data file with the list of commands only
         Data2 = {}
@@ -971,15 +996,153 @@ class LoadDialog(Design_ui.Ui_Form):
             json.dump(Data2, outfile, indent=4)
         outfile.close()
 
-        # run init again
-        self.__init__()
+        # The icons are loaded again from FreeCAD or from the new icon pack
+        CommandIcons.Clear()
+        WorkbenchIcons.Clear()
+        return
 
-        # Set the first tab active
-        self.form.tabWidget.setCurrentIndex(0)
+    def ScanWorkbench(self, WorkBenchName: str) -> list:
+        """
+        Activates a workbench and collects its data.
 
-        # Show the dialog again
-        self.form.show()
-        return
+        Args:
+            WorkBenchName (str): Name of the workbench.
+
+        Returns:
+            list: [workbench item, list of toolbar items, list of command items], as stored in
+            List_Workbenches, StringList_Toolbars and List_Commands.
+        """
+        Gui.activateWorkbench(WorkBenchName)
+        WorkBench = Gui.getWorkbench(WorkBenchName)
+        # Get the toolbar items
+        ToolbarItems: dict = WorkBench.getToolbarItems()
+        # Update the toolbar items with corrections
+        ToolbarItems: dict = StandardFunctions.CorrectGetToolbarItems(ToolbarItems)
+
+        IconName = str(WorkBench.Icon)
+        WorkbenchTitle = WorkBench.MenuText
+        WorkbenchTitleTranslated = StandardFunctions.TranslationsMapping(WorkBenchName, WorkbenchTitle)
+        WorkbenchItem = [
+            str(WorkBenchName),
+            IconName,
+            WorkbenchTitle,
+            ToolbarItems,
+            WorkbenchTitleTranslated,
+        ]
+
+        # Go through the toolbars
+        Toolbars = []
+        if WorkBenchName != "General":
+            for Toolbar in WorkBench.listToolbars():
+                ToolBarTtranslated = StandardFunctions.TranslationsMapping(WorkBenchName, Toolbar)
+                Toolbars.append([Toolbar, WorkbenchTitle, WorkBenchName, ToolBarTtranslated])
+
+        # Go through the commands
+        Commands = []
+        for key, value in list(ToolbarItems.items()):
+            for CommandName in value:
+                if Gui.Command.get(CommandName) is not None:
+                    Commands.append(self.ReturnCommandItem(CommandName, WorkBenchName))
+
+        return [WorkbenchItem, Toolbars, Commands]
+
+    def ReturnCommandItem(self, CommandName: str, WorkBenchName: str, EmptyIconName="") -> list:
+        """
+        Returns the item for List_Commands:
+        [Command name, Icon name, Menu text, Workbench name, Translated menu text]
+        """
+        CommandInfo = CommandIndex.ReturnCommandInfo(CommandName)
+        IconName = EmptyIconName
+        if CommandInfo["pixmap"] != "":
+            IconName = CommandInfo["pixmap"]
+        MenuName = CommandInfo["menuText"].replace("&", "")
+        MenuNameTranslated = CommandIndex.ActionText(CommandName).replace("&", "")
+        return [CommandName, IconName, MenuName, WorkBenchName, MenuNameTranslated]
+
+    def EncodeIcons(self, IconList: list, IconPack) -> bool:
+        """
+        Adds icons to an icon pack. The icons are rendered to images on the GUI thread and the
+        images are encoded to PNG in a thread pool.
+
+        Args:
+            IconList (list): [section, name, QIcon] for each icon.
+            IconPack (Serialize_Ribbon.IconPackWriter): The icon pack to add the icons to.
+
+        Returns:
+            bool: False if the user cancelled.
+        """
+        # Show the progress
+        Progress = QProgressDialog(
+            translate("FreeCAD Ribbon", "Storing the icons..."),
+            translate("FreeCAD Ribbon", "Cancel"),
+            0,
+            len(IconList),
+            mw,
+        )
+        Progress.setWindowTitle("FreeCAD Ribbon")
+        Progress.setWindowModality(Qt.WindowModality.WindowModal)
+        Progress.setMinimumDuration(0)
+
+        # Limit the number of rendered images that are waiting to be encoded
+        MaxPending = 64
+        # Future -> position in the icon list
+        Pending = {}
+        # The encoded images per position in the icon list
+        Results = [None] * len(IconList)
+        Finished = 0
+        Cancelled = False
+
+        def CollectResults():
+            nonlocal Finished
+            Done, NotDone = wait(list(Pending.keys()), timeout=0.05, return_when=FIRST_COMPLETED)
+            for Future in Done:
+                i = Pending.pop(Future)
+                try:
+                    Results[i] = Future.result()
+                except Exception as e:
+                    if Parameters_Ribbon.DEBUG_MODE is True:
+                        StandardFunctions.Print(f"Failed to encode the icon for {IconList[i][1]}\n{e}", "Warning")
+                Finished = Finished + 1
+            Progress.setValue(Finished)
+            QApplication.processEvents()
+            return
+
+        Executor = ThreadPoolExecutor()
+        try:
+            for i in range(len(IconList)):
+                if Progress.wasCanceled() is True:
+                    Cancelled = True
+                    break
+                # QPixmap can only be used on the GUI thread. Render the images here
+                try:
+                    Images = Serialize_Ribbon.iconToImages(IconList[i][2])
+                    Pending[Executor.submit(Serialize_Ribbon.encodeImages, Images)] = i
+                except Exception as e:
+                    Finished = Finished + 1
+                    if Parameters_Ribbon.DEBUG_MODE is True:
+                        StandardFunctions.Print(f"Failed to render the icon for {IconList[i][1]}\n{e}", "Warning")
+                while len(Pending) >= MaxPending:
+                    CollectResults()
+            # Wait for the remaining icons
+            while len(Pending) > 0 and Cancelled is False:
+                if Progress.wasCanceled() is True:
+                    Cancelled = True
+                    break
+                CollectResults()
+        finally:
+            for Future in Pending.keys():
+                Future.cancel()
+            Executor.shutdown(wait=True)
+            Progress.close()
+
+        if Cancelled is True:
+            return False
+
+        # Add the encoded icons in the original order
+        for i in range(len(IconList)):
+            if Results[i] is not None:
+                IconPack.addEncodedIcon(IconList[i][0], IconList[i][1], Results[i])
+        return True
 
     # region - Control functions----------------------------------------------------------------------
     # Add all toolbars of the selected workbench to the toolbar list(QComboBox)
@@ -1475,14 +1638,11 @@ class LoadDialog(Design_ui.Ui_Form):
                                 MenuName = ToolbarCommand[4].replace("&", "")
 
                                 # get the icon for this command if there isn't one, leave it None
-                                Icon = QIcon()
-                                for item in self.List_CommandIcons:
-                                    if item[0] == ToolbarCommand[0]:
-                                        Icon = item[1]
+                                Icon = CommandIcons.ReturnIcon(ToolbarCommand[0], Default=QIcon())
                                 if Icon is None:
                                     Command = Gui.Command.get(CommandName)
                                     if Command is not None:
-                                        Icon = Gui.getIcon(CommandInfoCorrections(CommandName)["pixmap"])
+                                        Icon = Gui.getIcon(CommandIndex.ReturnCommandInfo(CommandName)["pixmap"])
                                         action = Command.getAction()
                                         try:
                                             if len(action) > 1:
@@ -1647,10 +1807,7 @@ class LoadDialog(Design_ui.Ui_Form):
                                         ListWidgetItem = QListWidgetItem()
                                         ListWidgetItem.setText(MenuName)
                                         ListWidgetItem.setData(Qt.ItemDataRole.UserRole, CommandItem)
-                                        Icon = QIcon()
-                                        for item in self.List_CommandIcons:
-                                            if item[0] == CommandItem[0]:
-                                                Icon = item[1]
+                                        Icon = CommandIcons.ReturnIcon(CommandItem[0], Default=QIcon())
                                         if Icon is None:
                                             Icon = Gui.getIcon(CommandItem[1])
                                         if Icon is not None:
@@ -1933,14 +2090,11 @@ class LoadDialog(Design_ui.Ui_Form):
                                     ListWidgetItem = QListWidgetItem()
                                     ListWidgetItem.setText(MenuName)
                                     ListWidgetItem.setData(Qt.ItemDataRole.UserRole, CommandName)
-                                    Icon = QIcon()
-                                    for item in self.List_CommandIcons:
-                                        if item[0] == Commands[0][0]:
-                                            Icon = item[1]
+                                    Icon = CommandIcons.ReturnIcon(Commands[0][0], Default=QIcon())
                                     if Icon is None:
                                         for CommandItem in self.List_Commands:
                                             if Commands[0][0] == CommandItem[0]:
-                                                IconName = StandardFunctions.CommandInfoCorrections(CommandItem[0])[
+                                                IconName = CommandIndex.ReturnCommandInfo(CommandItem[0])[
                                                     "pixmap"
                                                 ]
                                         Icon = StandardFunctions.returnQiCons_Commands(CommandName, IconName)
@@ -1962,12 +2116,9 @@ class LoadDialog(Design_ui.Ui_Form):
                                             ListWidgetItem = QListWidgetItem()
                                             ListWidgetItem.setText(MenuName)
                                             ListWidgetItem.setData(Qt.ItemDataRole.UserRole, CommandName)
-                                            Icon = None
-                                            for item in self.List_CommandIcons:
-                                                if item[0] == CommandName:
-                                                    Icon = item[1]
+                                            Icon = CommandIcons.ReturnIcon(CommandName)
                                             if Icon is None:
-                                                IconName = StandardFunctions.CommandInfoCorrections(CommandName)[
+                                                IconName = CommandIndex.ReturnCommandInfo(CommandName)[
                                                     "pixmap"
                                                 ]
                                                 Icon = StandardFunctions.returnQiCons_Commands(CommandName, IconName)
@@ -2095,16 +2246,13 @@ class LoadDialog(Design_ui.Ui_Form):
 
         # Add the dropdown button to the command list widgets
         FirstCommand = DropDownButton[0][0]
-        Icon = None
         IconName = ""
-        for item in self.List_CommandIcons:
-            if item[0] == FirstCommand:
-                Icon = item[1]
+        Icon = CommandIcons.ReturnIcon(FirstCommand)
         if Icon is None:
             IconName = ""
             for CommandItem in self.List_Commands:
                 if CommandItem[0] == FirstCommand:
-                    IconName = StandardFunctions.CommandInfoCorrections(CommandItem[0])["pixmap"]
+                    IconName = CommandIndex.ReturnCommandInfo(CommandItem[0])["pixmap"]
             Icon = StandardFunctions.returnQiCons_Commands(FirstCommand, IconName)
         ListWidgetItem = QListWidgetItem()
         ListWidgetItem.setText(DropDownName)
@@ -2457,7 +2605,7 @@ class LoadDialog(Design_ui.Ui_Form):
             def SortCommands(item):
                 try:
                     if "separator" not in item.lower():
-                        MenuName = CommandInfoCorrections(item)["menuText"].replace("&", "")
+                        MenuName = CommandIndex.ReturnCommandInfo(item)["menuText"].replace("&", "")
                         if MenuName == "":
                             for CommandItem in self.List_Commands:
                                 if CommandItem[0] == item:
@@ -2535,7 +2683,7 @@ class LoadDialog(Design_ui.Ui_Form):
 
                     # if not, continue
                     if f"{CommandName}, {WorkBenchName}" not in ShadowList and CommandName is not None:
-                        MenuName = StandardFunctions.CommandInfoCorrections(CommandName)["menuText"]
+                        MenuName = CommandIndex.ReturnCommandInfo(CommandName)["menuText"]
                         if CommandName.endswith("_ddb"):
                             MenuName = CommandName
                         if MenuName == "":
@@ -2545,7 +2693,7 @@ class LoadDialog(Design_ui.Ui_Form):
                                 if MenuName == "":
                                     continue
 
-                        IconName = StandardFunctions.CommandInfoCorrections(CommandName)["pixmap"]
+                        IconName = CommandIndex.ReturnCommandInfo(CommandName)["pixmap"]
                         if CommandName.endswith("_ddb") and "dropdownButtons" in self.Dict_DropDownButtons:
                             for (
                                 DropDownCommand,
@@ -2558,18 +2706,14 @@ class LoadDialog(Design_ui.Ui_Form):
                         # get the icon for this command if there isn't one, leave it None
                         Icon = StandardFunctions.returnQiCons_Commands(CommandName)
                         if Icon is None:
-                            for item in self.List_CommandIcons:
-                                if item[0] == CommandName:
-                                    Icon = item[1]
-                                    break
-                                if CommandName.endswith("_ddb") and "dropdownButtons" in self.Dict_DropDownButtons:
-                                    for (
-                                        DropDownCommand,
-                                        Commands,
-                                    ) in self.Dict_DropDownButtons["dropdownButtons"].items():
-                                        if Commands[0][0] == item[0]:
-                                            Icon = item[1]
-                                            break
+                            Icon = CommandIcons.ReturnIcon(CommandName)
+                        if Icon is None and CommandName.endswith("_ddb"):
+                            # Use the icon of the first command of the dropdown button
+                            try:
+                                Commands = self.Dict_DropDownButtons["dropdownButtons"][CommandName]
+                                Icon = CommandIcons.ReturnIcon(Commands[0][0])
+                            except Exception:
+                                pass
 
                         # Set the default check states
                         checked_small = Qt.CheckState.Checked
@@ -2610,14 +2754,14 @@ class LoadDialog(Design_ui.Ui_Form):
                                     continue
 
                         MenuNameTabelWidgetItem = ""
-                        if MenuNameJson != CommandInfoCorrections(ToolbarCommand)["menuText"].replace("&", ""):
+                        if MenuNameJson != CommandIndex.ReturnCommandInfo(ToolbarCommand)["menuText"].replace("&", ""):
                             MenuNameTabelWidgetItem = MenuNameJson
                         elif MenuName.endswith("_ddb"):
                             MenuNameTabelWidgetItem = MenuName.replace("_ddb", "")
                         else:
                             for CommandItem in self.List_Commands:
                                 if CommandItem[0] == CommandName:
-                                    MenuNameTabelWidgetItem = StandardFunctions.CommandInfoCorrections(CommandName)[
+                                    MenuNameTabelWidgetItem = CommandIndex.ReturnCommandInfo(CommandName)[
                                         "ActionText"
                                     ]
                         if MenuNameTabelWidgetItem == "":
@@ -3127,10 +3271,7 @@ class LoadDialog(Design_ui.Ui_Form):
                 ListWidgetItem_IW = QListWidgetItem()
                 ListWidgetItem_IW.setText(WorkbenchTitle)
                 ListWidgetItem_IW.setData(Qt.ItemDataRole.UserRole, workbench)
-                Icon = QIcon()
-                for item in self.List_WorkBenchIcons:
-                    if item[0] == WorkbenchName:
-                        Icon = item[1]
+                Icon = WorkbenchIcons.ReturnIcon(WorkbenchName, Default=QIcon())
                 if Icon is None:
                     Icon = Gui.getIcon(workbench[1])
 
@@ -3276,15 +3417,12 @@ class LoadDialog(Design_ui.Ui_Form):
                             if DropDownCommand == CommandName:
                                 CommandName_Icon = Commands[0][0]
                     # Get the icon name
-                    IconName = StandardFunctions.CommandInfoCorrections(CommandName_Icon)["pixmap"]
+                    IconName = CommandIndex.ReturnCommandInfo(CommandName_Icon)["pixmap"]
                     # get the icon for this command if there isn't one, leave it None
                     Icon = StandardFunctions.returnQiCons_Commands(CommandName_Icon, IconName)
                     # If the icon is still None, get the icon from the iconlist
                     if Icon is None or (Icon is not None and Icon.isNull()):
-                        for item in self.List_CommandIcons:
-                            if item[0] == CommandName_Icon:
-                                Icon = item[1]
-                                break
+                        Icon = CommandIcons.ReturnIcon(CommandName_Icon, Default=Icon)
 
                     # Define a new ListWidgetItem.
                     textAddition = ""
@@ -4214,15 +4352,12 @@ class LoadDialog(Design_ui.Ui_Form):
                                 if DropDownCommand == CommandName:
                                     CommandName_Icon = Commands[0][0]
                         # Get the icon name
-                        IconName = StandardFunctions.CommandInfoCorrections(CommandName_Icon)["pixmap"]
+                        IconName = CommandIndex.ReturnCommandInfo(CommandName_Icon)["pixmap"]
                         # get the icon for this command if there isn't one, leave it None
                         Icon = StandardFunctions.returnQiCons_Commands(CommandName_Icon, IconName)
                         # If the icon is still None, get the icon from the iconlist
                         if Icon is None or (Icon is not None and Icon.isNull()):
-                            for item in self.List_CommandIcons:
-                                if item[0] == CommandName_Icon:
-                                    Icon = item[1]
-                                    break
+                            Icon = CommandIcons.ReturnIcon(CommandName_Icon, Default=Icon)
 
                         # Define a new ListWidgetItem.
                         ListWidgetItem = QListWidgetItem()
@@ -4296,15 +4431,12 @@ class LoadDialog(Design_ui.Ui_Form):
                                     if DropDownCommand == CommandName:
                                         CommandName_Icon = Commands[0][0]
                             # Get the icon name
-                            IconName = StandardFunctions.CommandInfoCorrections(CommandName_Icon)["pixmap"]
+                            IconName = CommandIndex.ReturnCommandInfo(CommandName_Icon)["pixmap"]
                             # get the icon for this command if there isn't one, leave it None
                             Icon = StandardFunctions.returnQiCons_Commands(CommandName_Icon, IconName)
                             # If the icon is still None, get the icon from the iconlist
                             if Icon is None or (Icon is not None and Icon.isNull()):
-                                for item in self.List_CommandIcons:
-                                    if item[0] == CommandName_Icon:
-                                        Icon = item[1]
-                                        break
+                                Icon = CommandIcons.ReturnIcon(CommandName_Icon, Default=Icon)
 
                             Text = MenuNameTranslated
                             ListWidgetItem = QListWidgetItem()
@@ -4328,19 +4460,16 @@ class LoadDialog(Design_ui.Ui_Form):
 
                 if IsInlist is False:
                     # Define a new ListWidgetItem.
-                    Icon = None
-                    for item in self.List_CommandIcons:
-                        if item[0] == CommandName:
-                            Icon = item[1]
-                        if str(CommandName).endswith("_ddb") and "dropdownButtons" in self.Dict_DropDownButtons:
-                            for (
-                                DropDownCommand,
-                                Commands,
-                            ) in self.Dict_DropDownButtons["dropdownButtons"].items():
-                                if Commands[0][0] == item[0]:
-                                    Icon = item[1]
+                    Icon = CommandIcons.ReturnIcon(CommandName)
+                    if str(CommandName).endswith("_ddb"):
+                        # Use the icon of the first command of the dropdown button
+                        try:
+                            Commands = self.Dict_DropDownButtons["dropdownButtons"][CommandName]
+                            Icon = CommandIcons.ReturnIcon(Commands[0][0], Default=Icon)
+                        except Exception:
+                            pass
                     if Icon is None:
-                        IconName = StandardFunctions.CommandInfoCorrections(CommandName)["pixmap"]
+                        IconName = CommandIndex.ReturnCommandInfo(CommandName)["pixmap"]
                         if str(CommandName).endswith("_ddb") and "dropdownButtons" in self.Dict_DropDownButtons:
                             for (
                                 DropDownCommand,
@@ -32,53 +32,114 @@ translate = App.Qt.translate
 preferences = App.ParamGet("User parameter:BaseApp/Preferences/Mod/FreeCAD-Ribbon")
 
 
+class SettingsSnapshot:
+    """
+    In-memory copy of the settings of the ribbon.
+
+    The values are stored per type and name, as returned by the parameter group.
+    A parameter observer removes a setting when it is changed, so it is read again on next use.
+    The version is increased on every change. Other caches can use it to see if a setting is changed.
+    """
+
+    # The types of the parameter group, as returned by GetContents()
+    Types = ["String", "Boolean", "Integer", "Unsigned Long", "Float"]
+
+    def __init__(self):
+        # (Type, setting name) -> value
+        self.Values = {}
+        self.Version = 0
+        # Without an observer, a changed setting would not be noticed.
+        # In that case, the settings are always read from the parameter group
+        self.Enabled = False
+
+    def Load(self, ParamGrp):
+        """Copy all settings of the parameter group and observe it for changes."""
+        self.Values.clear()
+        try:
+            for Type, Name, Value in ParamGrp.GetContents():
+                self.Values[(Type, Name)] = Value
+            ParamGrp.Attach(self)
+            self.Enabled = True
+        except Exception:
+            self.Values.clear()
+            self.Enabled = False
+        self.Version = self.Version + 1
+        return
+
+    def OnChange(self, ParamGrp, Reason):
+        """Called by FreeCAD when a setting of the ribbon is changed."""
+        for Type in self.Types:
+            self.Values.pop((Type, Reason), None)
+        self.Version = self.Version + 1
+        return
+
+    def Get(self, Type: str, settingName: str, ReadSetting):
+        """Returns the stored setting. When it is not stored, it is read with ReadSetting(settingName)."""
+        Key = (Type, settingName)
+        if Key in self.Values:
+            return self.Values[Key]
+
+        result = ReadSetting(settingName)
+        if self.Enabled is True:
+            self.Values[Key] = result
+        return result
+
+
 class Settings:
 
     # region -- Functions to read the settings from the FreeCAD Parameters
     # and make sure that a None type result is ""
     def GetStringSetting(settingName: str) -> str:
-        result = preferences.GetString(settingName)
+        result = Snapshot.Get("String", settingName, preferences.GetString)
 
         if result.lower() == "none":
             result = ""
         return result
 
     def GetIntSetting(settingName: str) -> int:
-        result = preferences.GetInt(settingName)
+        result = Snapshot.Get("Integer", settingName, preferences.GetInt)
         if result == "":
             result = None
         return result
 
     def GetFloatSetting(settingName: str) -> int:
-        result = preferences.GetFloat(settingName)
+        result = Snapshot.Get("Float", settingName, preferences.GetFloat)
         if result == "":
             result = None
         return result
 
     def GetBoolSetting(settingName: str) -> bool:
-        result = preferences.GetBool(settingName)
+        result = Snapshot.Get("Boolean", settingName, preferences.GetBool)
         if str(result).lower() == "none":
             result = False
         return result
 
     def GetColorSetting(settingName: str) -> object:
         # Create a tuple from the int value of the color
-        result = QColor.fromRgba(preferences.GetUnsigned(settingName)).toTuple()
+        result = QColor.fromRgba(
+            Snapshot.Get("Unsigned Long", settingName, preferences.GetUnsigned)
+        ).toTuple()
 
         # correct the order of the tuple and divide them by 255
         result = (result[3] / 255, result[0] / 255, result[1] / 255, result[2] / 255)
 
         return result
 
+    def Version() -> int:
+        """Returns a number that is increased every time a setting of the ribbon is changed."""
+        return Snapshot.Version
+
     # endregion
 
     # region - Functions to write settings to the FreeCAD Parameters
     #
-    #
+    # A setting is only written when it is missing or when its value is changed.
+    # The default passed to the Get functions differs from the value, so a missing setting is detected.
     def SetStringSetting(settingName: str, value: str):
         if value.lower() == "none":
             value = ""
-        preferences.SetString(settingName, value)
+        if preferences.GetString(settingName, value + "_") != value:
+            preferences.SetString(settingName, value)
         return
 
     def SetBoolSetting(settingName: str, value):
@@ -86,11 +147,17 @@ class Settings:
             Bool = True
         if str(value).lower() == "none" or str(value).lower() != "true":
             Bool = False
-        preferences.SetBool(settingName, Bool)
+        if preferences.GetBool(settingName, not Bool) != Bool:
+            preferences.SetBool(settingName, Bool)
         return
 
     def SetIntSetting(settingName: str, value: int):
         if str(value).lower() != "":
+            if (
+                isinstance(value, int)
+                and preferences.GetInt(settingName, value + 1) == value
+            ):
+                return
             preferences.SetInt(settingName, value)
         return
 
@@ -158,6 +225,10 @@ class Settings:
         Settings.SetStringSetting("CustomPanelPosition", DEFAULT_PANEL_POSITION_CUSTOM)
 
 
+# The settings are read from memory. The snapshot is kept up-to-date by a parameter observer
+Snapshot = SettingsSnapshot()
+Snapshot.Load(preferences)
+
 # region - Define the resources ----------------------------------------------------------------------------------------
 ICON_LOCATION = os.path.join(os.path.dirname(__file__), "Resources", "icons")
 STYLESHEET_LOCATION = os.path.join(
@@ -383,6 +454,14 @@ if Settings.GetBoolSetting("DebugMode") is None:
     Settings.SetBoolSetting("DebugMode", DEBUG_MODE)
 # endregion ------------------------------------------------------------------------------------------------------------
 
+# region - Get the startup profiler mode -------------------------------------------------------------------------------
+# Enable with the parameter "ProfileStartup" or the environment variable FREECAD_RIBBON_PROFILE=1
+PROFILE_STARTUP = Settings.GetBoolSetting("ProfileStartup")
+if os.environ.get("FREECAD_RIBBON_PROFILE", "0") not in ["", "0"]:
+    PROFILE_STARTUP = True
+PROFILE_LOCATION = os.path.join(os.path.dirname(__file__), "StartupProfile.json")
+# endregion ------------------------------------------------------------------------------------------------------------
+
 # region - Navigation settings -----------------------------------------------------------------------------------------
 SHOW_ON_HOVER = Settings.GetBoolSetting("ShowOnHover")
 if Settings.GetBoolSetting("ShowOnHover") is None:
@@ -0,0 +1,143 @@
+# *************************************************************************
+# *                                                                       *
+# * Copyright (c) 2019-2024 Paul Ebbers                                   *
+# *                                                                       *
+# * This program is free software; you can redistribute it and/or modify  *
+# * it under the terms of the GNU Lesser General Public License (LGPL)    *
+# * as published by the Free Software Foundation; either version 3 of     *
+# * the License, or (at your option) any later version.                   *
+# * for detail see the LICENCE text file.                                 *
+# *                                                                       *
+# * This program is distributed in the hope that it will be useful,       *
+# * but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# * GNU Library General Public License for more details.                  *
+# *                                                                       *
+# * You should have received a copy of the GNU Library General Public     *
+# * License along with this program; if not, write to the Free Software   *
+# * Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# * USA                                                                   *
+# *                                                                       *
+# *************************************************************************
+
+# Timing of the startup phases of the ribbon.
+import FreeCAD as App
+import json
+import time
+from contextlib import contextmanager
+
+import Parameters_Ribbon
+import Standard_Functions_RIbbon as StandardFunctions
+
+# Define the translation
+translate = App.Qt.translate
+
+
+class PhaseProfiler:
+    """
+    Measures the time of named phases. Phases can be nested and can be measured more than once.
+    When the profiler is disabled, measuring a phase does nothing.
+    """
+
+    def __init__(self, Enabled: bool = False):
+        self.Enabled = Enabled
+        # Phase name -> [total time in seconds, number of calls], in order of first use
+        self.Phases = {}
+        # The start time of the profiler and the report of the last run
+        self.StartTime = None
+        self.LastReport = None
+        # The name and start time of the phase started with Mark()
+        self.MarkName = ""
+        self.MarkTime = None
+
+    def Start(self):
+        """Start a new run. Previous results are removed."""
+        self.Phases = {}
+        self.StartTime = time.perf_counter()
+        self.MarkName = ""
+        self.MarkTime = None
+        return
+
+    @contextmanager
+    def Phase(self, Name: str):
+        """Measure the code in a with-statement as the phase with the given name."""
+        if self.Enabled is False or self.StartTime is None:
+            yield
+            return
+        StartTime = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._AddTime(Name, time.perf_counter() - StartTime)
+
+    def Mark(self, Name: str = ""):
+        """
+        End the phase started by the previous mark and start a new phase with the given name.
+        Use this for consecutive phases in one function. An empty name only ends the previous phase.
+        """
+        if self.Enabled is False or self.StartTime is None:
+            return
+        Time = time.perf_counter()
+        if self.MarkTime is not None:
+            self._AddTime(self.MarkName, Time - self.MarkTime)
+        self.MarkName = Name
+        self.MarkTime = None
+        if Name != "":
+            self.MarkTime = Time
+        return
+
+    def _AddTime(self, Name: str, Duration: float):
+        Phase = self.Phases.setdefault(Name, [0.0, 0])
+        Phase[0] = Phase[0] + Duration
+        Phase[1] = Phase[1] + 1
+        return
+
+    def Stop(self, FileName: str = "") -> dict:
+        """
+        Stop the run. The report is printed to the report view and, if a file name is given,
+        written to a JSON file.
+
+        Returns:
+            dict: {"total": seconds, "phases": [{"name", "seconds", "calls"}, ...]}
+        """
+        if self.Enabled is False or self.StartTime is None:
+            return None
+        # End a phase that is still open
+        self.Mark()
+
+        Report = {
+            "total": time.perf_counter() - self.StartTime,
+            "phases": [
+                {"name": Name, "seconds": Phase[0], "calls": Phase[1]}
+                for Name, Phase in self.Phases.items()
+            ],
+        }
+        self.StartTime = None
+        self.LastReport = Report
+
+        self.PrintReport()
+        if FileName != "":
+            try:
+                with open(FileName, "w") as outfile:
+                    json.dump(Report, outfile, indent=4)
+            except Exception as e:
+                StandardFunctions.Print(f"{e}", "Warning")
+        return Report
+
+    def PrintReport(self):
+        """Print the report of the last run to the report view."""
+        if self.LastReport is None:
+            return
+        Text = translate("FreeCAD Ribbon", "Ribbon startup: {:.3f} s").format(
+            self.LastReport["total"]
+        )
+        for Phase in self.LastReport["phases"]:
+            Text = Text + "\n    {}: {:.3f} s ({}x)".format(
+                Phase["name"], Phase["seconds"], Phase["calls"]
+            )
+        StandardFunctions.Print(Text)
+        return
+
+
+# The profiler for the startup of the ribbon
+StartupProfiler = PhaseProfiler(Parameters_Ribbon.PROFILE_STARTUP)
@@ -1,6 +1,6 @@
 import typing
 
-from PySide.QtGui import QIcon, QPaintEvent, QResizeEvent, QColor
+from PySide.QtGui import QIcon, QResizeEvent, QColor
 from PySide.QtWidgets import (
     QToolButton,
     QSizePolicy,
@@ -105,12 +105,15 @@ class RibbonCategoryLayoutWidget(QFrame):
                                                              QSizePolicy.Policy.Minimum))  # fmt: skip
         self._mainLayout.addWidget(self._nextButton, 0, Qt.AlignmentFlag.AlignVCenter)
 
-        # Auto set the visibility of the scroll buttons
-        self.autoSetScrollButtonsVisible()
-
-    def paintEvent(self, a0: QPaintEvent) -> None:
-        """Override the paint event to draw the background."""
-        super().paintEvent(a0)
+        # Auto set the visibility of the scroll buttons, when the contents are scrolled or
+        # when the size of the contents or the scroll area changes
+        horizontalScrollBar = self._categoryScrollArea.horizontalScrollBar()
+        horizontalScrollBar.rangeChanged.connect(
+            lambda minimum, maximum: self.autoSetScrollButtonsVisible()
+        )
+        horizontalScrollBar.valueChanged.connect(
+            lambda value: self.autoSetScrollButtonsVisible()
+        )
         self.autoSetScrollButtonsVisible()
 
     def resizeEvent(self, a0: QResizeEvent) -> None:
@@ -119,29 +122,34 @@ class RibbonCategoryLayoutWidget(QFrame):
         self.autoSetScrollButtonsVisible()
 
     def autoSetScrollButtonsVisible(self):
-        """Set the visibility of the scroll buttons."""
+        """Set the visibility and icon size of the scroll buttons, only when they change."""
         horizontalScrollBar = self._categoryScrollArea.horizontalScrollBar()
-        self._previousButton.setVisible(
-            horizontalScrollBar.value() > horizontalScrollBar.minimum()
-        )
-        self._nextButton.setVisible(
-            horizontalScrollBar.value() < horizontalScrollBar.maximum()
-        )
-        self._previousButton.setIconSize(QSize(12, self.size().height() - 15))
-        self._nextButton.setIconSize(QSize(12, self.size().height() - 15))
+        iconSize = QSize(12, self.size().height() - 15)
+        for button, visible in (
+            (
+                self._previousButton,
+                horizontalScrollBar.value() > horizontalScrollBar.minimum(),
+            ),
+            (
+                self._nextButton,
+                horizontalScrollBar.value() < horizontalScrollBar.maximum(),
+            ),
+        ):
+            if button.isHidden() == visible:
+                button.setVisible(visible)
+            if button.iconSize() != iconSize:
+                button.setIconSize(iconSize)
 
     def scrollPrevious(self):
         """Scroll the category to the previous widget."""
         horizontalScrollBar = self._categoryScrollArea.horizontalScrollBar()
         horizontalScrollBar.setValue(horizontalScrollBar.value() - 50)
-        self.autoSetScrollButtonsVisible()
 
     def scrollNext(self):
         """Scroll the category to the next widget."""
         self._categoryScrollArea.horizontalScrollBar().setValue(
             self._categoryScrollArea.horizontalScrollBar().value() + 50
         )
-        self.autoSetScrollButtonsVisible()
 
     def addWidget(self, widget: QWidget):
         """Add a widget to the category layout.
@@ -4,8 +4,6 @@ import functools
 import re
 from typing import Any, Callable, Dict, List, Union, overload
 
-import numpy as np
-
 from PySide.QtGui import QIcon, QKeySequence
 from PySide.QtWidgets import (
     QToolButton,
@@ -63,7 +61,14 @@ class RibbonPanelTitle(QLabel):
 
 
 class RibbonGridLayoutManager(object):
-    """Grid Layout Manager."""
+    """Grid Layout Manager.
+
+    The free rows of each column are stored as a bitmask, bit ``row`` is set when the cell is
+    free. Cells are only taken, never released, so a column without space for a number of
+    rows will never get that space. Per number of rows, the first column with space is kept,
+    and the columns before it are not searched again. This way placing a widget takes
+    amortized constant time, also in panels with many widgets.
+    """
 
     def __init__(self, rows: int):
         """Create a new grid layout manager.
@@ -71,7 +76,32 @@ class RibbonGridLayoutManager(object):
         :param rows: The number of rows in the grid layout.
         """
         self.rows = rows
-        self.cells = np.ones((rows, 1), dtype=bool)
+        #: Bitmask of a column without widgets.
+        self.emptyColumn = (1 << rows) - 1
+        #: The free rows per column.
+        self.columns = [self.emptyColumn]
+        #: The first column with space, per number of rows.
+        self.firstColumns = {}
+        #: The last column of which the first row is used, -1 if there is none.
+        self.lastColumnInFirstRow = -1
+
+    @staticmethod
+    def _fittingRows(free: int, rowSpan: int) -> int:
+        """Return the bitmask of the rows where rowSpan rows are free."""
+        fits = free
+        for i in range(1, rowSpan):
+            fits &= free >> i
+        return fits
+
+    def _firstColumn(self, rowSpan: int) -> int:
+        """Return the first column that has space for rowSpan rows."""
+        col = self.firstColumns.get(rowSpan, 0)
+        while col < len(self.columns) and not self._fittingRows(
+            self.columns[col], rowSpan
+        ):
+            col += 1
+        self.firstColumns[rowSpan] = col
+        return col
 
     def request_cells(
         self, rowSpan: int = 1, colSpan: int = 1, mode: RibbonSpaceFindMode = ColumnWise
@@ -85,36 +115,52 @@ class RibbonGridLayoutManager(object):
         """
         if rowSpan > self.rows:
             raise ValueError("RowSpan is too large")
+        columns = self.columns
         if mode == ColumnWise:
-            for row in range(self.cells.shape[0] - rowSpan + 1):
-                for col in range(self.cells.shape[1] - colSpan + 1):
-                    if self.cells[row : row + rowSpan, col : col + colSpan].all():
-                        self.cells[row : row + rowSpan, col : col + colSpan] = False
-                        return row, col
+            # Find the first free row, and for that row the first free column
+            found = None
+            for col in range(self._firstColumn(rowSpan), len(columns) - colSpan + 1):
+                free = columns[col]
+                for i in range(col + 1, col + colSpan):
+                    free &= columns[i]
+                fits = self._fittingRows(free, rowSpan)
+                if fits:
+                    row = (fits & -fits).bit_length() - 1
+                    if found is None or row < found[0]:
+                        found = (row, col)
+                        if row == 0:
+                            break
+            if found is not None:
+                row, col = found
+                self._occupy(row, rowSpan, col, colSpan)
+                return row, col
         else:
-            for col in range(self.cells.shape[1]):
-                if self.cells[0, col:].all():
-                    if self.cells.shape[1] - col < colSpan:
-                        self.cells = np.append(
-                            self.cells,
-                            np.ones(
-                                (self.rows, colSpan - (self.cells.shape[1] - col)),
-                                dtype=bool,
-                            ),
-                            axis=1,
-                        )
-                    self.cells[0, col:] = False
-                    return 0, col
-        cols = self.cells.shape[1]
-        colSpan1 = colSpan
-        if self.cells[:, -1].all():
-            cols -= 1
-            colSpan1 -= 1
-        self.cells = np.append(
-            self.cells, np.ones((self.rows, colSpan1), dtype=bool), axis=1
-        )
-        self.cells[:rowSpan, cols : cols + colSpan] = False
-        return 0, cols
+            # Find the first column from which the first row is free up to the last column
+            col = self.lastColumnInFirstRow + 1
+            if col < len(columns):
+                if len(columns) - col < colSpan:
+                    columns.extend(
+                        [self.emptyColumn] * (colSpan - (len(columns) - col))
+                    )
+                self._occupy(0, 1, col, len(columns) - col)
+                return 0, col
+        # Add columns. An empty last column is used as the first column
+        col = len(columns)
+        if columns[-1] == self.emptyColumn:
+            col -= 1
+        columns.extend([self.emptyColumn] * (col + colSpan - len(columns)))
+        self._occupy(0, rowSpan, col, colSpan)
+        return 0, col
+
+    def _occupy(self, row: int, rowSpan: int, col: int, colSpan: int):
+        """Mark the cells as used."""
+        mask = ~(((1 << rowSpan) - 1) << row)
+        for i in range(col, col + colSpan):
+            self.columns[i] &= mask
+        if row == 0:
+            self.lastColumnInFirstRow = max(
+                self.lastColumnInFirstRow, col + colSpan - 1
+            )
 
 
 class RibbonPanelItemWidget(QFrame):
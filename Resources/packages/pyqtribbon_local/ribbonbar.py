@@ -28,7 +28,12 @@ from .category import (
 from .constants import RibbonCategoryStyle, RibbonStyle, contextColors
 from .menu import RibbonMenu
 from .tabbar import RibbonTabBar
-from .titlewidget import RibbonApplicationButton, RibbonTitleWidget
+from .titlewidget import (
+    RibbonApplicationButton,
+    RibbonTabBarScrollArea,
+    RibbonTabBarScrollButton,
+    RibbonTitleWidget,
+)
 from .utils import DataFile
 
 
@@ -290,6 +295,20 @@ class RibbonBar(QWidget):
         """
         return self._titleWidget.tabBar()
 
+    def tabBarScrollArea(self) -> RibbonTabBarScrollArea:
+        """Return the scroll area of the tab bar of the ribbon.
+
+        :return: The scroll area of the tab bar of the ribbon.
+        """
+        return self._titleWidget.tabBarScrollArea()
+
+    def tabBarScrollButtons(self) -> typing.List[RibbonTabBarScrollButton]:
+        """Return the previous and the next button of the tab bar of the ribbon.
+
+        :return: The previous and the next button of the tab bar of the ribbon.
+        """
+        return self._titleWidget.tabBarScrollButtons()
+
     def quickAccessToolBar(self) -> QToolBar:
         """Return the quick access toolbar of the ribbon.
 
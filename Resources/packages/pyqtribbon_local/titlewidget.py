@@ -10,10 +10,12 @@ from PySide.QtWidgets import (
     QLabel,
     QToolBar,
     QTabBar,
+    QScrollArea,
 )
 from PySide.QtCore import (
     Qt,
     QSize,
+    QEvent,
     Signal,
 )
 
@@ -42,6 +44,33 @@ class RibbonTitleLabel(QLabel):
     pass
 
 
+class RibbonTabBarScrollArea(QScrollArea):
+    """Scroll area for the tab bar, when the size is not enough for all tabs."""
+
+    def sizeHint(self) -> QSize:
+        """Return the size hint of the tab bar, so the tab bar is not scrolled when it fits."""
+        widget = self.widget()
+        if widget is None:
+            return super().sizeHint()
+        return widget.sizeHint()
+
+    def minimumSizeHint(self) -> QSize:
+        """The scroll area can be as narrow as needed, the tabs are scrolled."""
+        return QSize(0, self.sizeHint().height())
+
+    def viewportEvent(self, event: QEvent) -> bool:
+        """Update the geometry of the scroll area when the size hint of the tab bar changes."""
+        if event.type() == QEvent.Type.LayoutRequest:
+            self.updateGeometry()
+        return super().viewportEvent(event)
+
+
+class RibbonTabBarScrollButton(QToolButton):
+    """Previous/Next buttons of the tab bar when the size is not enough for all tabs."""
+
+    pass
+
+
 class RibbonTitleWidget(QFrame):
     """The title widget of the ribbon."""
 
@@ -146,6 +175,46 @@ class RibbonTitleWidget(QFrame):
         self._tabBar.setFont(font)
         self._tabBar.setShape(QTabBar.Shape.RoundedNorth)
         self._tabBar.setDocumentMode(True)
+        # The tab bar is scrolled by its scroll area, instead of by its own scroll buttons
+        self._tabBar.setUsesScrollButtons(False)
+        self._tabBar.setElideMode(Qt.TextElideMode.ElideNone)
+
+        # Tab bar scroll area
+        self._tabBarScrollArea = RibbonTabBarScrollArea(self)
+        self._tabBarScrollArea.setFrameShape(QFrame.Shape.NoFrame)
+        self._tabBarScrollArea.setHorizontalScrollBarPolicy(
+            Qt.ScrollBarPolicy.ScrollBarAlwaysOff
+        )
+        self._tabBarScrollArea.setVerticalScrollBarPolicy(
+            Qt.ScrollBarPolicy.ScrollBarAlwaysOff
+        )
+        self._tabBarScrollArea.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Preferred)  # type: ignore
+        self._tabBarScrollArea.setWidgetResizable(True)
+        self._tabBarScrollArea.setWidget(self._tabBar)
+        self._tabBarScrollArea.viewport().setAutoFillBackground(False)
+
+        # Previous/Next buttons of the tab bar
+        self._tabBarPreviousButton = RibbonTabBarScrollButton(self)
+        self._tabBarPreviousButton.setArrowType(Qt.ArrowType.LeftArrow)
+        self._tabBarPreviousButton.setAutoRaise(True)
+        self._tabBarPreviousButton.clicked.connect(self.scrollTabBarPrevious)  # type: ignore
+        self._tabBarNextButton = RibbonTabBarScrollButton(self)
+        self._tabBarNextButton.setArrowType(Qt.ArrowType.RightArrow)
+        self._tabBarNextButton.setAutoRaise(True)
+        self._tabBarNextButton.clicked.connect(self.scrollTabBarNext)  # type: ignore
+
+        # Auto set the visibility of the scroll buttons, when the tab bar is scrolled or
+        # when the size of the tab bar or the scroll area changes
+        horizontalScrollBar = self._tabBarScrollArea.horizontalScrollBar()
+        horizontalScrollBar.rangeChanged.connect(
+            lambda minimum, maximum: self.autoSetTabBarScrollButtonsVisible()
+        )
+        horizontalScrollBar.valueChanged.connect(
+            lambda value: self.autoSetTabBarScrollButtonsVisible()
+        )
+        self.autoSetTabBarScrollButtonsVisible()
+        # Keep the current tab visible
+        self._tabBar.currentChanged.connect(self.ensureTabVisible)
 
         # Title label
         self._titleLabel = RibbonTitleLabel(self)
@@ -159,7 +228,15 @@ class RibbonTitleWidget(QFrame):
         self._tabBarLayout.addWidget(
             self._quickAccessToolBarWidget, 0, Qt.AlignmentFlag.AlignVCenter
         )
-        self._tabBarLayout.addWidget(self._tabBar, 0, Qt.AlignmentFlag.AlignVCenter)
+        self._tabBarLayout.addWidget(
+            self._tabBarPreviousButton, 0, Qt.AlignmentFlag.AlignVCenter
+        )
+        self._tabBarLayout.addWidget(
+            self._tabBarScrollArea, 0, Qt.AlignmentFlag.AlignVCenter
+        )
+        self._tabBarLayout.addWidget(
+            self._tabBarNextButton, 0, Qt.AlignmentFlag.AlignVCenter
+        )
         self._tabBarLayout.addWidget(self._titleLabel, 1, Qt.AlignmentFlag.AlignVCenter)
         self._tabBarLayout.addWidget(
             self._rightToolBar, 0, Qt.AlignmentFlag.AlignVCenter
@@ -205,6 +282,58 @@ class RibbonTitleWidget(QFrame):
         """
         return self._tabBar
 
+    def tabBarScrollArea(self) -> RibbonTabBarScrollArea:
+        """Return the scroll area of the tab bar.
+
+        :return: The scroll area of the tab bar.
+        """
+        return self._tabBarScrollArea
+
+    def tabBarScrollButtons(self) -> typing.List[RibbonTabBarScrollButton]:
+        """Return the previous and the next button of the tab bar.
+
+        :return: The previous and the next button of the tab bar.
+        """
+        return [self._tabBarPreviousButton, self._tabBarNextButton]
+
+    def autoSetTabBarScrollButtonsVisible(self):
+        """Set the visibility of the scroll buttons of the tab bar, only when it changes."""
+        horizontalScrollBar = self._tabBarScrollArea.horizontalScrollBar()
+        for button, visible in (
+            (
+                self._tabBarPreviousButton,
+                horizontalScrollBar.value() > horizontalScrollBar.minimum(),
+            ),
+            (
+                self._tabBarNextButton,
+                horizontalScrollBar.value() < horizontalScrollBar.maximum(),
+            ),
+        ):
+            if button.isHidden() == visible:
+                button.setVisible(visible)
+
+    def ensureTabVisible(self, index: int):
+        """Scroll the tab bar so that the tab is visible.
+
+        :param index: The index of the tab.
+        """
+        if index < 0:
+            return
+        rect = self._tabBar.tabRect(index)
+        self._tabBarScrollArea.ensureVisible(
+            rect.center().x(), rect.center().y(), rect.width() // 2, 0
+        )
+
+    def scrollTabBarPrevious(self):
+        """Scroll the tab bar to the previous tabs."""
+        horizontalScrollBar = self._tabBarScrollArea.horizontalScrollBar()
+        horizontalScrollBar.setValue(horizontalScrollBar.value() - 50)
+
+    def scrollTabBarNext(self):
+        """Scroll the tab bar to the next tabs."""
+        horizontalScrollBar = self._tabBarScrollArea.horizontalScrollBar()
+        horizontalScrollBar.setValue(horizontalScrollBar.value() + 50)
+
     def quickAccessToolBar(self) -> QToolBar:
         """Return the quick access toolbar of the ribbon.
 
@@ -22,7 +22,13 @@
 
 # This code is based on the serialize function of the SearBar Addon.
 # Original developer for the SearchBar addon is Suzanne Soy.
-from PySide.QtGui import QIcon, QPixmap
+import os
+import json
+import mmap
+import struct
+import base64
+import hashlib
+from PySide.QtGui import QIcon, QPixmap, QImage
 from PySide.QtCore import (
     Qt,
     QSize,
@@ -32,6 +38,20 @@ from PySide.QtCore import (
     QByteArray,
 )
 
+# The modes and states of the pixmaps in an icon
+ICON_MODES = {
+    "normal": QIcon.Mode.Normal,
+    "disabled": QIcon.Mode.Disabled,
+    "active": QIcon.Mode.Active,
+    "selected": QIcon.Mode.Selected,
+}
+ICON_STATES = {"off": QIcon.State.Off, "on": QIcon.State.On}
+
+# Icon pack layout: magic, version, header length, json header, PNG data.
+ICON_PACK_MAGIC = b"RBNICONS"
+ICON_PACK_VERSION = 1
+ICON_PACK_PREFIX = struct.Struct("<8sII")
+
 
 def iconToBase64(
     icon: QIcon, sz=QSize(64, 64), mode=QIcon.Mode.Normal, state=QIcon.State.On
@@ -48,6 +68,26 @@ def iconToBase64(
     Returns:
         str: The Base64-encoded string of the icon's pixmap.
     """
+    # Use standard Base64 encoding
+    base64_data = base64.b64encode(iconToPNG(icon, sz, mode, state)).decode("utf-8")
+    return base64_data
+
+
+def iconToPNG(
+    icon: QIcon, sz=QSize(64, 64), mode=QIcon.Mode.Normal, state=QIcon.State.On
+) -> bytes:
+    """
+    Converts a QIcon to the PNG data of its pixmap.
+
+    Args:
+        icon (QIcon): The icon to encode.
+        sz (QSize): The size of the pixmap to generate.
+        mode (QIcon.Mode): The mode of the pixmap (e.g., Normal, Disabled).
+        state (QIcon.State): The state of the pixmap (e.g., On, Off).
+
+    Returns:
+        bytes: The PNG data of the icon's pixmap.
+    """
     buf = QBuffer()
     buf.open(QIODevice.OpenModeFlag.WriteOnly)
 
@@ -59,10 +99,9 @@ def iconToBase64(
         # raise ValueError("Failed to save icon to buffer. Ensure the icon is valid.")
         print(e)
 
-    # Use standard Base64 encoding
-    base64_data = buf.data().toBase64().data().decode("utf-8")
+    png_data = bytes(buf.data().data())
     buf.close()
-    return base64_data
+    return png_data
 
 
 def serializeIcon(icon):
@@ -108,3 +147,208 @@ def deserializeIcon(iconPixmaps):
                     )
                     ico.addPixmap(pxm, mode, state)
     return ico
+
+
+def iconToImages(icon: QIcon) -> list:
+    """
+    Renders all available sizes, modes and states of an icon to images.
+    Must be called from the GUI thread, because it uses QPixmap.
+
+    Returns:
+        list: [width, height, mode, state, QImage] for each pixmap.
+    """
+    images = []
+    for sz in icon.availableSizes():
+        for strMode, mode in ICON_MODES.items():
+            for strState, state in ICON_STATES.items():
+                image = icon.pixmap(sz, mode, state).toImage()
+                images.append([sz.width(), sz.height(), strMode, strState, image])
+    return images
+
+
+def imageToPNG(image: QImage) -> bytes:
+    """Converts a QImage to PNG data. This can be used outside the GUI thread."""
+    buf = QBuffer()
+    buf.open(QIODevice.OpenModeFlag.WriteOnly)
+    image.save(buf, "PNG")
+    png_data = bytes(buf.data().data())
+    buf.close()
+    return png_data
+
+
+def encodeImages(images: list) -> list:
+    """
+    Converts the images from iconToImages to PNG data. This can be used outside the GUI thread.
+
+    Returns:
+        list: [width, height, mode, state, PNG data] for each image.
+    """
+    encodedImages = []
+    for width, height, strMode, strState, image in images:
+        encodedImages.append([width, height, strMode, strState, imageToPNG(image)])
+    return encodedImages
+
+
+class IconPackWriter:
+    """
+    Writes icons to an icon pack file.
+
+    The file starts with a header that maps (name, size, mode, state) to the offset and length
+    of the raw PNG data. Identical PNG data is stored only once.
+    """
+
+    def __init__(self):
+        # section -> name -> list of [width, height, mode, state, blob number]
+        self._Index = {}
+        # The PNG data and the blob number per content hash
+        self._Blobs = []
+        self._BlobNumbers = {}
+
+    def _addBlob(self, data: bytes) -> int:
+        key = hashlib.sha1(data).hexdigest()
+        number = self._BlobNumbers.get(key)
+        if number is None:
+            number = len(self._Blobs)
+            self._Blobs.append(data)
+            self._BlobNumbers[key] = number
+        return number
+
+    def addIcon(self, section: str, name: str, icon: QIcon):
+        """Add all available sizes, modes and states of an icon."""
+        self.addEncodedIcon(section, name, encodeImages(iconToImages(icon)))
+        return
+
+    def addEncodedIcon(self, section: str, name: str, encodedImages: list):
+        """Add an icon that is converted with iconToImages and encodeImages."""
+        entries = []
+        for width, height, strMode, strState, data in encodedImages:
+            number = self._addBlob(data)
+            entries.append([width, height, strMode, strState, number])
+        self._Index.setdefault(section, {})[name] = entries
+        return
+
+    def addSerializedIcon(self, section: str, name: str, iconPixmaps: dict):
+        """Add an icon that is serialized with serializeIcon."""
+        entries = []
+        for strW, wPixmaps in iconPixmaps.items():
+            for strH, hPixmaps in wPixmaps.items():
+                for strMode, modePixmaps in hPixmaps.items():
+                    for strState, statePixmap in modePixmaps.items():
+                        number = self._addBlob(base64.b64decode(statePixmap))
+                        entries.append(
+                            [int(strW), int(strH), strMode, strState, number]
+                        )
+        self._Index.setdefault(section, {})[name] = entries
+        return
+
+    def write(self, fileName: str):
+        """Write the icon pack. The file is replaced at once when it is complete."""
+        # Convert the blob numbers to offsets and lengths
+        blobs = []
+        offset = 0
+        for data in self._Blobs:
+            blobs.append([offset, len(data)])
+            offset = offset + len(data)
+        header = json.dumps(
+            {"blobs": blobs, "icons": self._Index}, separators=(",", ":")
+        ).encode("utf-8")
+
+        tempFile = fileName + ".tmp"
+        with open(tempFile, "wb") as outfile:
+            outfile.write(
+                ICON_PACK_PREFIX.pack(ICON_PACK_MAGIC, ICON_PACK_VERSION, len(header))
+            )
+            outfile.write(header)
+            for data in self._Blobs:
+                outfile.write(data)
+        os.replace(tempFile, fileName)
+        return
+
+
+class IconPack:
+    """
+    Reads icons from an icon pack file written by IconPackWriter.
+
+    The file is memory-mapped. Only the header is parsed when the pack is opened. The PNG data
+    of an icon is read when the icon is requested.
+    """
+
+    def __init__(self, fileName: str):
+        self._File = open(fileName, "rb")
+        try:
+            self._Map = mmap.mmap(self._File.fileno(), 0, access=mmap.ACCESS_READ)
+            magic, version, headerLength = ICON_PACK_PREFIX.unpack_from(self._Map, 0)
+            if magic != ICON_PACK_MAGIC or version != ICON_PACK_VERSION:
+                raise ValueError(f"{fileName} is not a valid icon pack")
+            start = ICON_PACK_PREFIX.size
+            header = json.loads(self._Map[start : start + headerLength].decode("utf-8"))
+        except Exception:
+            self.close()
+            raise
+        self._Blobs = header["blobs"]
+        self._Index = header["icons"]
+        self._DataStart = start + headerLength
+
+    def close(self):
+        if getattr(self, "_Map", None) is not None:
+            self._Map.close()
+            self._Map = None
+        if self._File is not None:
+            self._File.close()
+            self._File = None
+        return
+
+    def names(self, section: str) -> list:
+        """Returns the names of the icons in a section."""
+        return list(self._Index.get(section, {}).keys())
+
+    def hasIcon(self, section: str, name: str) -> bool:
+        return name in self._Index.get(section, {})
+
+    def encodedIcon(self, section: str, name: str):
+        """
+        Returns [width, height, mode, state, PNG data] for each pixmap of the icon,
+        or None if the icon is not in the pack.
+        """
+        entries = self._Index.get(section, {}).get(name)
+        if entries is None:
+            return None
+        encodedImages = []
+        for width, height, strMode, strState, number in entries:
+            offset, length = self._Blobs[number]
+            offset = self._DataStart + offset
+            data = self._Map[offset : offset + length]
+            encodedImages.append([width, height, strMode, strState, data])
+        return encodedImages
+
+    def icon(self, section: str, name: str):
+        """Returns the icon or None if the icon is not in the pack."""
+        encodedImages = self.encodedIcon(section, name)
+        if encodedImages is None:
+            return None
+        ico = QIcon()
+        for width, height, strMode, strState, data in encodedImages:
+            pxm = QPixmap()
+            pxm.loadFromData(data, "PNG")
+            ico.addPixmap(pxm, ICON_MODES[strMode], ICON_STATES[strState])
+        return ico
+
+
+def migrateIconLists(data: dict, fileName: str) -> bool:
+    """
+    Writes the serialized icons of a data file (the lists "Command_Icons" and "WorkBench_Icons")
+    to an icon pack. Returns True if there were icons to migrate.
+    """
+    writer = IconPackWriter()
+    count = 0
+    for section, key in {
+        "commands": "Command_Icons",
+        "workbenches": "WorkBench_Icons",
+    }.items():
+        for name, iconPixmaps in data.get(key, []):
+            writer.addSerializedIcon(section, name, iconPixmaps)
+            count = count + 1
+    if count == 0:
+        return False
+    writer.write(fileName)
+    return True
@@ -243,17 +243,20 @@ def ColorConvertor(ColorRGB: [], Alpha: float = 1, Hex=False, KeepHexAlpha=True)
     ColorRGB:   [255,255,255]
     Alpha:      0-1
     """
-    from matplotlib import colors as mcolors
-
+    # Converted in the same way as matplotlib's to_rgba and to_hex.
+    # This function is used while the ribbon is loaded, so it avoids importing matplotlib
     ColorRed = ColorRGB[0] / 255
     colorGreen = ColorRGB[1] / 255
     colorBlue = ColorRGB[2] / 255
+    if Alpha is None:
+        Alpha = 1
 
-    color = (ColorRed, colorGreen, colorBlue)
-
-    result = mcolors.to_rgba(color, Alpha)
+    result = (ColorRed, colorGreen, colorBlue, float(Alpha))
     if Hex is True:
-        result = mcolors.to_hex((ColorRed, colorGreen, colorBlue, Alpha), KeepHexAlpha)
+        Values = result
+        if KeepHexAlpha is False:
+            Values = result[:3]
+        result = "#" + "".join(format(round(Value * 255), "02x") for Value in Values)
 
     return result
 
@@ -691,6 +694,58 @@ def returnQiCons_Commands(CommandName, pixmap=""):
     return icon
 
 
+def WriteFileAtomic(FileName: str, Text: str):
+    """
+    Writes a text file. The text is written to a temporary file first, which then replaces the file.
+    This way the file is never left half written.
+    """
+    import os
+
+    TempFile = FileName + ".tmp"
+    with open(TempFile, "w") as outfile:
+        outfile.write(Text)
+    os.replace(TempFile, FileName)
+    return
+
+
+def ReturnWorkbenchFingerprints():
+    """
+    Returns a fingerprint per workbench name, used to detect installed or updated workbenches.
+    For add-ons, the fingerprint is the version and modification time of their package.xml.
+    Other workbenches get the version of FreeCAD as fingerprint.
+    """
+    import xml.etree.ElementTree as ET
+    import os
+
+    FreeCADVersion = "FreeCAD " + ".".join(App.Version()[:3])
+    Fingerprints = {}
+    for WorkBenchName in Gui.listWorkbenches():
+        Fingerprints[WorkBenchName] = FreeCADVersion
+
+    # Go through the top-level add-on folders only
+    namespaces = {"i": "https://wiki.freecad.org/Package_Metadata"}
+    ModFolders = [
+        os.path.join(App.getUserAppDataDir(), "Mod"),
+        os.path.join(App.getHomePath(), "Mod"),
+    ]
+    for ModFolder in ModFolders:
+        if os.path.isdir(ModFolder) is False:
+            continue
+        for name in os.listdir(ModFolder):
+            packageXML = os.path.join(ModFolder, name, "package.xml")
+            try:
+                ModifiedTime = os.stat(packageXML).st_mtime_ns
+                treeRoot = ET.parse(packageXML).getroot()
+                Version = treeRoot.findtext("i:version", "", namespaces)
+                for element in treeRoot.findall(
+                    ".//i:content/i:workbench/i:classname", namespaces
+                ):
+                    Fingerprints[element.text.strip()] = f"{Version}|{ModifiedTime}"
+            except Exception:
+                continue
+    return Fingerprints
+
+
 def CorrectGetToolbarItems(ToolbarItems: dict):
     newCommands = []
 
@@ -43,7 +43,6 @@ from datetime import datetime
 import shutil
 import Standard_Functions_RIbbon as StandardFunctions
 import Parameters_Ribbon
-import webbrowser
 import time
 
 # Get the resources
@@ -57,6 +56,61 @@ sys.path.append(pathUI)
 sys.path.append(pathBackup)
 
 
+class StyleItemCache:
+    """
+    Cache of the resolved style items and stylesheets.
+
+    The cache is cleared when the settings of the ribbon are changed, which is seen from
+    the version of the settings snapshot (see Parameters_Ribbon.Settings.Version), and by a
+    parameter observer when the stylesheet of FreeCAD is changed.
+    The version is increased every time the cache is cleared.
+    """
+
+    def __init__(self):
+        # (ControlName, ShowCustomIcon, IgnoreOverlay) -> resolved style item
+        self.Items = {}
+        # (control, radius, padding_right, padding_bottom, width) -> stylesheet
+        self.StyleSheets = {}
+        # The current stylesheet of FreeCAD. Read on first use
+        self.StyleSheet = None
+        self.Version = 0
+        # The version of the settings of the ribbon, when the cache was filled
+        self.SettingsVersion = None
+
+    def Clear(self):
+        self.Items.clear()
+        self.StyleSheets.clear()
+        self.StyleSheet = None
+        self.Version = self.Version + 1
+        return
+
+    def Validate(self):
+        """Clear the cache when a setting of the ribbon is changed."""
+        SettingsVersion = Parameters_Ribbon.Settings.Version()
+        if SettingsVersion != self.SettingsVersion:
+            self.Clear()
+            self.SettingsVersion = SettingsVersion
+        return
+
+    def OnChange(self, ParamGrp, Reason):
+        """Called by FreeCAD when a parameter of the main window is changed."""
+        if Reason == "StyleSheet":
+            self.Clear()
+        return
+
+    def ReturnStyleSheetName(self) -> str:
+        """Returns the current stylesheet of FreeCAD, or "none" when it is not in StyleMapping_default."""
+        if self.StyleSheet is None:
+            FreeCAD_preferences = App.ParamGet(
+                "User parameter:BaseApp/Preferences/MainWindow"
+            )
+            currentStyleSheet = FreeCAD_preferences.GetString("StyleSheet")
+            if currentStyleSheet not in StyleMapping_default["Stylesheets"]:
+                currentStyleSheet = "none"
+            self.StyleSheet = currentStyleSheet
+        return self.StyleSheet
+
+
 def ReturnStyleItem(ControlName, ShowCustomIcon=False, IgnoreOverlay=False):
     """
     Enter one of the names below:
@@ -74,19 +128,25 @@ def ReturnStyleItem(ControlName, ShowCustomIcon=False, IgnoreOverlay=False):
         "PinButton_open" returns QIcon,
         "PinButton_closed" returns QIcon,
     """
-    # define a result holder and a dict for the StyleMapping file
-    result = "none"
+    StyleCache.Validate()
+    Key = (ControlName, ShowCustomIcon, IgnoreOverlay)
+    if Key in StyleCache.Items:
+        return StyleCache.Items[Key]
 
-    # Get the current stylesheet for FreeCAD
-    FreeCAD_preferences = App.ParamGet("User parameter:BaseApp/Preferences/MainWindow")
-    currentStyleSheet = FreeCAD_preferences.GetString("StyleSheet")
-    IsInList = False
-    for key, value in StyleMapping_default["Stylesheets"].items():
-        if key == currentStyleSheet:
-            IsInList = True
-            break
-    if IsInList is False:
-        currentStyleSheet = "none"
+    result = ResolveStyleItem(
+        ControlName, StyleCache.ReturnStyleSheetName(), ShowCustomIcon, IgnoreOverlay
+    )
+    if result is not None:
+        StyleCache.Items[Key] = result
+    return result
+
+
+def ResolveStyleItem(
+    ControlName, currentStyleSheet, ShowCustomIcon=False, IgnoreOverlay=False
+):
+    """Returns the style item for the given stylesheet of FreeCAD. See ReturnStyleItem."""
+    # define a result holder
+    result = "none"
 
     ListIcons = [
         "ScrollLeftButton_Tab",
@@ -159,6 +219,21 @@ def ReturnStyleSheet(
         toolbuttonLarge,
         applicationbutton,
     """
+    StyleCache.Validate()
+    Key = (control, radius, padding_right, padding_bottom, width)
+    if Key in StyleCache.StyleSheets:
+        return StyleCache.StyleSheets[Key]
+
+    StyleSheet = CreateStyleSheet(control, radius, padding_right, padding_bottom, width)
+    if StyleSheet is not None:
+        StyleCache.StyleSheets[Key] = StyleSheet
+    return StyleSheet
+
+
+def CreateStyleSheet(
+    control, radius="2px", padding_right="0px", padding_bottom="0px", width="16px"
+):
+    """Creates the stylesheet for a control. See ReturnStyleSheet."""
     StyleSheet = ""
     try:
         BorderColor = ReturnStyleItem("Border_Color")
@@ -249,6 +324,55 @@ def ReturnStyleSheet(
         return StyleSheet
 
 
+def ReturnHighlightBorderColor():
+    """Returns the border color of a highlighted button of the ribbon."""
+    BorderColor = ReturnStyleItem("Border_Color")
+    if Parameters_Ribbon.CUSTOM_COLORS_ENABLED:
+        BorderColor = Parameters_Ribbon.COLOR_BORDERS
+    if Parameters_Ribbon.BORDER_TRANSPARANT:
+        BorderColor = ReturnStyleItem("Background_Color_Hover")
+    return BorderColor
+
+
+def ReturnRibbonStyleSheet():
+    """
+    Returns the stylesheet for the toolbuttons of the ribbon. It is set once on the ribbon.
+    The toolbuttons are targeted with a dynamic property (see CustomWidgets.SetRibbonPart):
+
+    RibbonPart (string):
+        "ToolButton" for a single toolbutton.
+    """
+    StyleCache.Validate()
+    Key = ("ribbon",)
+    if Key in StyleCache.StyleSheets:
+        return StyleCache.StyleSheets[Key]
+
+    StyleSheet = ""
+    BackgroundColor = ReturnStyleItem("Background_Color")
+    HoverColor = ReturnStyleItem("Background_Color_Hover")
+    FontColor = ReturnStyleItem("FontColor")
+    BorderColor = ReturnStyleItem("Border_Color")
+    if BackgroundColor is None or HoverColor is None or BorderColor is None:
+        return StyleSheet
+
+    # The border color when a toolbutton is hovered
+    HoverBorderColor = BorderColor
+    if Parameters_Ribbon.BORDER_TRANSPARANT is True:
+        HoverBorderColor = BackgroundColor
+
+    StyleSheet = (
+        'QToolButton[RibbonPart="ToolButton"] {'
+        + f"color: {FontColor};background: {BackgroundColor};"
+        + "margin: 0px;padding: 0px;spacing: 0px;border-radius: 2px;}"
+        + 'QToolButton[RibbonPart="ToolButton"]:hover {'
+        + f"background: {HoverColor};border: 0.5px solid {HoverBorderColor};"
+        + "}"
+    )
+
+    StyleCache.StyleSheets[Key] = StyleSheet
+    return StyleSheet
+
+
 def ReturnColor(ColorType="Background_Color"):
     mw: QMainWindow = Gui.getMainWindow()
     palette = mw.style().standardPalette()
@@ -309,51 +433,117 @@ def ReturnFontColor(StyleSheet=""):
     return fontColor
 
 
-def DarkMode():
+class ThemeDetectionCache:
+    """
+    Cache of the result of DarkMode, stored in the settings of the ribbon so it is kept between sessions.
+
+    The result is stored per stylesheet of FreeCAD, together with the modification times of
+    the package.xml files of the add-ons that match the stylesheet. When one of these add-ons
+    is installed, updated or removed, the theme is detected again.
+    """
+
+    SettingName = "ThemeDetectionCache"
+
+    def __init__(self):
+        # Stylesheet -> {"Stamps": {add-on folder: mtime of package.xml}, "IsDarkTheme": bool}
+        self.Entries = None
+
+    def IsDarkTheme(self, StyleSheet: str) -> bool:
+        Stamps = self.ReturnStamps(StyleSheet)
+        Entries = self.ReturnEntries()
+        Entry = Entries.get(StyleSheet)
+        if Entry is not None and Entry.get("Stamps") == Stamps:
+            return Entry.get("IsDarkTheme", False)
+
+        IsDarkTheme = False
+        for name in Stamps:
+            if IsPreferencePackDark(
+                os.path.join(self.ReturnAddonFolder(), name, "package.xml")
+            ):
+                IsDarkTheme = True
+                break
+
+        Entries[StyleSheet] = {"Stamps": Stamps, "IsDarkTheme": IsDarkTheme}
+        try:
+            Parameters_Ribbon.preferences.SetString(
+                self.SettingName, json.dumps(Entries)
+            )
+        except Exception:
+            pass
+        return IsDarkTheme
+
+    def ReturnEntries(self) -> dict:
+        if self.Entries is None:
+            self.Entries = {}
+            try:
+                Entries = json.loads(
+                    Parameters_Ribbon.preferences.GetString(self.SettingName)
+                )
+                if isinstance(Entries, dict):
+                    self.Entries = Entries
+            except Exception:
+                pass
+        return self.Entries
+
+    def ReturnAddonFolder(self) -> str:
+        """Returns the folder with add-ons. (The parent folder of the ribbon)"""
+        return os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+    def ReturnStamps(self, StyleSheet: str) -> dict:
+        """
+        Returns the modification time of the package.xml per add-on folder that matches the stylesheet.
+        Only the top-level add-on folders are checked.
+        """
+        Stamps = {}
+        StyleSheetName = StyleSheet.replace(".qss", "").lower()
+        try:
+            with os.scandir(self.ReturnAddonFolder()) as Folders:
+                for Folder in Folders:
+                    if StyleSheetName not in Folder.name.lower():
+                        continue
+                    try:
+                        if Folder.is_dir() is False:
+                            continue
+                        packageXML = os.path.join(Folder.path, "package.xml")
+                        Stamps[Folder.name] = os.stat(packageXML).st_mtime
+                    except OSError:
+                        continue
+        except OSError:
+            pass
+        return Stamps
+
+
+def IsPreferencePackDark(packageXML: str) -> bool:
+    """Returns True if one of the tags of a preference pack in the package.xml contains 'dark'."""
     import xml.etree.ElementTree as ET
-    import os
 
-    # Define the standard result
-    IsDarkTheme = False
+    try:
+        # Get the tree and root of the xml file
+        tree = ET.parse(packageXML)
+        treeRoot = tree.getroot()
+
+        # Get all the tag elements
+        namespaces = {"i": "https://wiki.freecad.org/Package_Metadata"}
+        elements = treeRoot.findall(".//i:content/i:preferencepack/i:tag", namespaces)
+
+        # go throug all tags. If 'dark' in the element text, this is a dark theme
+        for element in elements:
+            if element.text is not None and "dark" in element.text.lower():
+                return True
+    except Exception:
+        pass
+    return False
 
+
+def DarkMode():
     # Get the current stylesheet for FreeCAD
     FreeCAD_preferences = App.ParamGet("User parameter:BaseApp/Preferences/MainWindow")
     currentStyleSheet = FreeCAD_preferences.GetString("StyleSheet")
 
-    path = os.path.dirname(__file__)
-    # Get the folder with add-ons
-    for i in range(2):
-        # Starting point
-        path = os.path.dirname(path)
-
-    # Go through the sub-folders
-    for root, dirs, files in os.walk(path):
-        for name in dirs:
-            # if the current stylesheet matches a sub directory, try to geth the pacakgexml
-            if currentStyleSheet.replace(".qss", "").lower() in name.lower():
-                try:
-                    packageXML = os.path.join(path, name, "package.xml")
-
-                    # Get the tree and root of the xml file
-                    tree = ET.parse(packageXML)
-                    treeRoot = tree.getroot()
-
-                    # Get all the tag elements
-                    elements = []
-                    namespaces = {"i": "https://wiki.freecad.org/Package_Metadata"}
-                    elements = treeRoot.findall(
-                        ".//i:content/i:preferencepack/i:tag", namespaces
-                    )
-
-                    # go throug all tags. If 'dark' in the element text, this is a dark theme
-                    for element in elements:
-                        if "dark" in element.text.lower():
-                            IsDarkTheme = True
-                            break
-                except Exception:
-                    continue
-
-    return IsDarkTheme
+    return ThemeCache.IsDarkTheme(currentStyleSheet)
+
+
+ThemeCache = ThemeDetectionCache()
 
 
 # Used when custom colors are enabled
@@ -543,3 +733,12 @@ StyleMapping_default = {
         },
     }
 }
+
+
+# The shared cache for the style items.
+# Keep it up-to-date when the stylesheet of FreeCAD is changed
+StyleCache = StyleItemCache()
+try:
+    App.ParamGet("User parameter:BaseApp/Preferences/MainWindow").Attach(StyleCache)
+except Exception:
+    pass